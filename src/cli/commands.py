@@ -2,9 +2,12 @@
 
 import asyncio
 import json
+import sys
 import time
+from functools import lru_cache
 from typing import Optional
 
+import orjson
 import typer
 from rich.console import Console
 from rich.panel import Panel
@@ -19,10 +22,42 @@ app = typer.Typer(
 )
 console = Console()
 
+# Persistent event loop shared by all CLI calls in this process
+_loop: asyncio.AbstractEventLoop | None = None
+
 
 def run_async(coro):
-    """Helper to run async functions from sync CLI."""
-    return asyncio.run(coro)
+    """Helper to run async functions from sync CLI.
+
+    Reuses one event loop for the whole process so that connection pools and
+    keep-alive sessions survive across calls (e.g. successive `watch` refreshes).
+    """
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop.run_until_complete(coro)
+
+
+@lru_cache
+def _get_service(rpc_url: str | None) -> OperatorService:
+    """Get the shared OperatorService for an RPC URL (one per URL per process)."""
+    return OperatorService(rpc_url)
+
+
+def print_json(data: dict) -> None:
+    """Write data to stdout as indented JSON (orjson, Decimals as strings).
+
+    Share amounts in wei can exceed orjson's 64-bit integer limit, so those
+    payloads fall back to the stdlib encoder.
+    """
+    try:
+        raw = orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    except TypeError:
+        raw = (json.dumps(data, default=str, indent=2) + "\n").encode()
+    sys.stdout.flush()
+    sys.stdout.buffer.write(raw)
+    sys.stdout.buffer.flush()
 
 
 def format_as_api_json(rewards: OperatorRewards, include_validators: bool = False, include_withdrawals: bool = False) -> dict:
@@ -67,7 +102,7 @@ def format_as_api_json(rewards: OperatorRewards, include_validators: bool = Fals
     # Add APY metrics if available
     if rewards.apy:
         # Use actual excess bond for lifetime values (matches Web API)
-        lifetime_bond = float(rewards.excess_bond_eth)
+        lifetime_bond = rewards.excess_bond_eth_float
         lifetime_net_total = (rewards.apy.lifetime_distribution_eth or 0) + lifetime_bond
 
         result["apy"] = {
@@ -154,6 +189,49 @@ def format_as_api_json(rewards: OperatorRewards, include_validators: bool = Fals
     return result
 
 
+def _build_rewards_table(rewards: OperatorRewards, detailed: bool = False) -> Table:
+    """Build the Earnings Summary table for an operator."""
+    rewards_table = Table(title="Earnings Summary")
+    rewards_table.add_column("Metric", style="cyan")
+    rewards_table.add_column("Value", style="green")
+    rewards_table.add_column("Notes", style="dim")
+
+    rewards_table.add_row(
+        "Current Bond",
+        f"{rewards.current_bond_eth:.6f} ETH",
+        f"Required: {rewards.required_bond_eth:.6f} ETH",
+    )
+    rewards_table.add_row(
+        "Excess Bond",
+        f"[bold green]{rewards.excess_bond_eth:.6f} ETH[/bold green]",
+        "Claimable",
+    )
+    rewards_table.add_row("", "", "")
+    rewards_table.add_row(
+        "Cumulative Rewards",
+        f"{rewards.cumulative_rewards_eth:.6f} ETH",
+        f"({rewards.cumulative_rewards_shares:,} shares)" if detailed else "All-time total",
+    )
+    rewards_table.add_row(
+        "Already Distributed",
+        f"{rewards.distributed_eth:.6f} ETH",
+        f"({rewards.distributed_shares:,} shares)" if detailed else "",
+    )
+    rewards_table.add_row(
+        "Unclaimed Rewards",
+        f"[bold green]{rewards.unclaimed_eth:.6f} ETH[/bold green]",
+        f"({rewards.unclaimed_shares:,} shares)" if detailed else "",
+    )
+    rewards_table.add_row("", "", "")
+    rewards_table.add_row(
+        "[bold]TOTAL CLAIMABLE[/bold]",
+        f"[bold yellow]{rewards.total_claimable_eth:.6f} ETH[/bold yellow]",
+        "Excess bond + unclaimed rewards",
+    )
+
+    return rewards_table
+
+
 @app.command("rewards")
 @app.command("check", hidden=True)
 def rewards(
@@ -199,8 +277,24 @@ def rewards(
         operator_id = int(address)
         address = None
 
-    service = OperatorService(rpc_url)
+    service = _get_service(rpc_url)
+    _render_rewards(service, address, operator_id, output_json, detailed, history, withdrawals)
 
+
+def _render_rewards(
+    service: OperatorService,
+    address: str | None,
+    operator_id: int | None,
+    output_json: bool = False,
+    detailed: bool = False,
+    history: bool = False,
+    withdrawals: bool = False,
+) -> None:
+    """Fetch operator rewards with an existing service and render them.
+
+    Shared by `rewards` and `watch` so repeated refreshes reuse the same
+    service (RPC clients, contracts) instead of rebuilding it each time.
+    """
     if not output_json:
         console.print()
         status_msg = "[bold blue]Fetching operator data..."
@@ -221,14 +315,14 @@ def rewards(
 
     if rewards is None:
         if output_json:
-            print(json.dumps({"error": "Operator not found"}, indent=2))
+            print_json({"error": "Operator not found"})
         else:
             console.print("[red]No CSM operator found for this address/ID[/red]")
         raise typer.Exit(1)
 
     # JSON output mode
     if output_json:
-        print(json.dumps(format_as_api_json(rewards, detailed, withdrawals), indent=2))
+        print_json(format_as_api_json(rewards, detailed, withdrawals))
         return
 
     # Header panel
@@ -377,45 +471,7 @@ def rewards(
         console.print()
 
     # Rewards table
-    rewards_table = Table(title="Earnings Summary")
-    rewards_table.add_column("Metric", style="cyan")
-    rewards_table.add_column("Value", style="green")
-    rewards_table.add_column("Notes", style="dim")
-
-    rewards_table.add_row(
-        "Current Bond",
-        f"{rewards.current_bond_eth:.6f} ETH",
-        f"Required: {rewards.required_bond_eth:.6f} ETH",
-    )
-    rewards_table.add_row(
-        "Excess Bond",
-        f"[bold green]{rewards.excess_bond_eth:.6f} ETH[/bold green]",
-        "Claimable",
-    )
-    rewards_table.add_row("", "", "")
-    rewards_table.add_row(
-        "Cumulative Rewards",
-        f"{rewards.cumulative_rewards_eth:.6f} ETH",
-        f"({rewards.cumulative_rewards_shares:,} shares)" if detailed else "All-time total",
-    )
-    rewards_table.add_row(
-        "Already Distributed",
-        f"{rewards.distributed_eth:.6f} ETH",
-        f"({rewards.distributed_shares:,} shares)" if detailed else "",
-    )
-    rewards_table.add_row(
-        "Unclaimed Rewards",
-        f"[bold green]{rewards.unclaimed_eth:.6f} ETH[/bold green]",
-        f"({rewards.unclaimed_shares:,} shares)" if detailed else "",
-    )
-    rewards_table.add_row("", "", "")
-    rewards_table.add_row(
-        "[bold]TOTAL CLAIMABLE[/bold]",
-        f"[bold yellow]{rewards.total_claimable_eth:.6f} ETH[/bold yellow]",
-        "Excess bond + unclaimed rewards",
-    )
-
-    console.print(rewards_table)
+    console.print(_build_rewards_table(rewards, detailed))
     console.print()
 
     # APY Metrics table (only shown with --detailed or --history flag)
@@ -702,7 +758,7 @@ def health(
         operator_id = int(address)
         address = None
 
-    service = OperatorService(rpc_url)
+    service = _get_service(rpc_url)
 
     if not output_json:
         console.print()
@@ -720,7 +776,7 @@ def health(
 
     if rewards is None:
         if output_json:
-            print(json.dumps({"error": "Operator not found"}, indent=2))
+            print_json({"error": "Operator not found"})
         else:
             console.print("[red]No CSM operator found for this address/ID[/red]")
         raise typer.Exit(1)
@@ -760,7 +816,7 @@ def health(
                 },
                 "has_issues": rewards.health.has_issues,
             }
-        print(json.dumps(result, indent=2))
+        print_json(result)
         return
 
     # Rich output
@@ -877,11 +933,18 @@ def watch(
     Continuously monitor rewards with live updates.
     Press Ctrl+C to stop.
     """
+    operator_id = None
+    if address.isdigit():
+        operator_id = int(address)
+        address = None
+
+    # Resolve the service once so every refresh reuses its clients and contracts
+    service = _get_service(rpc_url)
     try:
         while True:
             console.clear()
             try:
-                rewards(address, rpc_url=rpc_url)
+                _render_rewards(service, address, operator_id)
             except Exception as e:
                 console.print(f"[red]Error: {e}[/red]")
             console.print(
@@ -899,7 +962,7 @@ def list_operators(
     ),
 ):
     """List all operators with rewards in the current tree."""
-    service = OperatorService(rpc_url)
+    service = _get_service(rpc_url)
 
     with console.status("[bold blue]Fetching rewards tree..."):
         operator_ids = run_async(service.get_all_operators_with_rewards())
@@ -32,6 +32,12 @@ class Settings(BaseSettings):
     # Cache Settings
     cache_ttl_seconds: int = 300  # 5 minutes
 
+    # Web Settings
+    # Serve /docs, /redoc and /openapi.json (disable in production to skip schema generation)
+    api_docs_enabled: bool = True
+    # Return a pyinstrument profile for requests with ?profile=true (needs the "profile" extra)
+    profile_requests: bool = False
+
     # Database Settings
     database_path: Path = Path.home() / ".cache" / "csm-dashboard" / "operators.db"
     # IPFS Gateway Configuration (comma-separated list)
@@ -45,6 +51,8 @@ class Settings(BaseSettings):
     csstrikes_address: str = "0xaa328816027F2D32B9F56d190BC9Fa4A5C07637f"
     steth_address: str = "0xae7ab96520DE3A18E5e111B5EaAb095312D7fE84"
     withdrawal_queue_address: str = "0x889edC2eDab5f40e902b864aD4d7AdE8E412F9B1"
+    # Multicall3 is deployed at the same address on mainnet and testnets
+    multicall3_address: str = "0xcA11bde05977b3631167028862bE2a173976CA11"
 
 
 @lru_cache
@@ -1,9 +1,12 @@
 """Contract ABIs and helpers."""
 
 import json
+from functools import lru_cache
 from importlib import resources
 from typing import Any
 
+from web3 import Web3
+
 
 def load_abi(name: str) -> list[dict[str, Any]]:
     """Load ABI from JSON file in abis directory."""
@@ -11,9 +14,16 @@ def load_abi(name: str) -> list[dict[str, Any]]:
     return json.loads(abi_file.read_text())
 
 
+@lru_cache(maxsize=64)
+def checksum_address(address: str) -> str:
+    """Checksum a configured contract address, memoized (keccak runs once per address)."""
+    return Web3.to_checksum_address(address)
+
+
 # Load ABIs at module level for easy import
 CSMODULE_ABI = load_abi("CSModule")
 CSACCOUNTING_ABI = load_abi("CSAccounting")
 CSFEEDISTRIBUTOR_ABI = load_abi("CSFeeDistributor")
 STETH_ABI = load_abi("stETH")
 WITHDRAWAL_QUEUE_ABI = load_abi("WithdrawalQueueERC721")
+MULTICALL3_ABI = load_abi("Multicall3")
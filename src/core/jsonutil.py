@@ -0,0 +1,33 @@
+"""Fast JSON helpers backed by orjson, exact for integers wider than 64 bits."""
+
+import json
+import re
+from typing import Any
+
+import orjson
+
+# orjson only handles 64-bit integers: it refuses to serialize larger ones and
+# parses them as floats. Share amounts in wei can exceed 2**64, so payloads with
+# an integer token that may overflow (20+ digits, or a 19+ digit negative) go
+# through the stdlib parser instead. Digit runs inside hex strings and float
+# mantissas are not integer tokens and keep the orjson path.
+_BIG_INT_RE = re.compile(rb'(?<![\w."])(?:\d{20,}|-\d{19,})(?![\w.])')
+
+JSONDecodeError = (orjson.JSONDecodeError, json.JSONDecodeError)
+
+
+def dumps(data: Any) -> bytes:
+    """Serialize data to JSON bytes."""
+    try:
+        return orjson.dumps(data)
+    except TypeError:
+        return json.dumps(data).encode()
+
+
+def loads(raw: bytes | str) -> Any:
+    """Parse JSON bytes or text."""
+    if isinstance(raw, str):
+        raw = raw.encode()
+    if _BIG_INT_RE.search(raw):
+        return json.loads(raw)
+    return orjson.loads(raw)
@@ -1,5 +1,6 @@
 """Data models for CSM Dashboard."""
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any
@@ -9,8 +10,12 @@ from pydantic import BaseModel
 if TYPE_CHECKING:
     from ..data.beacon import ValidatorInfo
 
+# Wei per ETH (also stETH shares per share unit), for converting on-chain amounts
+WEI_PER_ETH = Decimal(10**18)
 
-class NodeOperator(BaseModel):
+
+@dataclass(slots=True, kw_only=True)
+class NodeOperator:
     """Node operator data from CSModule contract."""
 
     node_operator_id: int
@@ -31,7 +36,8 @@ class NodeOperator(BaseModel):
     extended_manager_permissions: bool
 
 
-class BondSummary(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class BondSummary:
     """Bond information for an operator."""
 
     current_bond_wei: int
@@ -41,14 +47,29 @@ class BondSummary(BaseModel):
     excess_bond_eth: Decimal
 
 
-class RewardsInfo(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class OperatorBundle:
+    """Operator, bond, distributed shares, bond curve and stETH share totals
+    fetched in one multicall (so all read at the same block)."""
+
+    operator: NodeOperator
+    bond: BondSummary
+    distributed_shares: int
+    curve_id: int
+    total_pooled_ether: int
+    total_shares: int
+
+
+@dataclass(slots=True, kw_only=True)
+class RewardsInfo:
     """Rewards data from merkle tree."""
 
     cumulative_fee_shares: int
     proof: list[str]
 
 
-class DistributionFrame(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class DistributionFrame:
     """Single distribution frame data."""
 
     frame_number: int
@@ -180,10 +201,13 @@ class HealthStatus(BaseModel):
         )
 
 
-class OperatorRewards(BaseModel):
-    """Complete rewards summary for display."""
+@dataclass(slots=True, kw_only=True)
+class OperatorRewards:
+    """Complete rewards summary for display.
 
-    model_config = {"arbitrary_types_allowed": True}
+    Plain slots dataclass (like NodeOperator, BondSummary and RewardsInfo):
+    built from already-trusted on-chain data, so no validation is needed.
+    """
 
     node_operator_id: int
     manager_address: str
@@ -215,7 +239,7 @@ class OperatorRewards(BaseModel):
     exited_validators: int
 
     # Validator details (from beacon chain, optional)
-    validator_details: list[Any] = []  # list[ValidatorInfo]
+    validator_details: list[Any] = field(default_factory=list)  # list[ValidatorInfo]
     validators_by_status: dict[str, int] | None = None
     avg_effectiveness: float | None = None
 
@@ -230,3 +254,9 @@ class OperatorRewards(BaseModel):
 
     # Withdrawal history (optional, populated with --history flag)
     withdrawals: list[WithdrawalEvent] | None = None
+
+    # Float copy of excess_bond_eth for JSON output (converted once, not per use)
+    excess_bond_eth_float: float = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.excess_bond_eth_float = float(self.excess_bond_eth)
@@ -2,9 +2,12 @@
 
 import asyncio
 import logging
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from enum import Enum
+from functools import lru_cache
 
 import httpx
 
@@ -12,17 +15,33 @@ logger = logging.getLogger(__name__)
 
 from ..core.config import get_settings
 from .cache import cached
+from .http_client import get_http_client
+
+# Per-pubkey validator cache: lowercased pubkey -> ValidatorInfo for the epoch
+# in _validator_cache_epoch. Validator state only changes at epoch boundaries,
+# so the whole cache is dropped when the epoch rolls over; within an epoch it is
+# an LRU capped at VALIDATOR_CACHE_SIZE entries.
+VALIDATOR_CACHE_SIZE = 16384
+_validator_cache: OrderedDict[str, "ValidatorInfo"] = OrderedDict()
+_validator_cache_epoch: int | None = None
 
 # Beacon Chain constants
 BEACON_GENESIS = datetime(2020, 12, 1, 12, 0, 23, tzinfo=timezone.utc)
 SECONDS_PER_EPOCH = 32 * 12  # 384 seconds (32 slots × 12 seconds per slot)
 
 
+@lru_cache(maxsize=4096)
 def epoch_to_datetime(epoch: int) -> datetime:
     """Convert beacon chain epoch to datetime."""
     return BEACON_GENESIS + timedelta(seconds=epoch * SECONDS_PER_EPOCH)
 
 
+def current_epoch() -> int:
+    """Get the current beacon chain epoch from wall-clock time."""
+    elapsed = (datetime.now(timezone.utc) - BEACON_GENESIS).total_seconds()
+    return int(elapsed // SECONDS_PER_EPOCH)
+
+
 def get_earliest_activation(validators: list["ValidatorInfo"]) -> datetime | None:
     """Get the earliest activation date from a list of validators."""
     epochs = [v.activation_epoch for v in validators if v.activation_epoch is not None]
@@ -102,6 +121,17 @@ class ValidatorStatus(str, Enum):
 class ValidatorInfo:
     """Information about a single validator."""
 
+    # Built per validator on every lookup; slots drop the per-instance __dict__
+    __slots__ = (
+        "pubkey",
+        "index",
+        "status",
+        "balance_gwei",
+        "effectiveness",
+        "activation_epoch",
+        "exit_epoch",
+    )
+
     def __init__(
         self,
         pubkey: str,
@@ -157,6 +187,12 @@ class ValidatorInfo:
 class BeaconDataProvider:
     """Fetches validator data from beaconcha.in API."""
 
+    # beaconcha.in accepts up to 100 comma-separated pubkeys per request
+    BATCH_SIZE = 100
+    # Max batch requests in flight, and spacing between batch starts (seconds)
+    BATCH_CONCURRENCY = 4
+    BATCH_INTERVAL = 0.5
+
     def __init__(self):
         self.settings = get_settings()
         self.base_url = self.settings.beacon_api_url.rstrip("/")
@@ -168,94 +204,110 @@ class BeaconDataProvider:
             headers["apikey"] = self.settings.beacon_api_key
         return headers
 
-    @cached(ttl=300)  # Cache for 5 minutes
     async def get_validators_by_pubkeys(
         self, pubkeys: list[str]
     ) -> list[ValidatorInfo]:
         """
         Fetch validator info for multiple pubkeys.
 
-        beaconcha.in supports comma-separated pubkeys (up to 100).
+        Uses the beaconcha.in bulk POST endpoint (up to 100 pubkeys per
+        request). Duplicate pubkeys are dropped, and results are cached per
+        pubkey for the current epoch so only uncached pubkeys are requested. Batches run concurrently
+        (at most BATCH_CONCURRENCY in flight, starts spaced BATCH_INTERVAL apart).
         Includes retry logic for rate limiting and proper error handling.
         """
+        global _validator_cache_epoch
         if not pubkeys:
             return []
 
-        validators = []
-        batch_size = 100  # beaconcha.in limit
+        # Hex case doesn't matter to the API; normalize so duplicates collapse
+        unique = list(dict.fromkeys(pk.lower() for pk in pubkeys))
+        epoch = current_epoch()
+        if _validator_cache_epoch != epoch:
+            _validator_cache.clear()
+            _validator_cache_epoch = epoch
+        found: dict[str, ValidatorInfo] = {}
+        misses = []
+        for pk in unique:
+            cached_info = _validator_cache.get(pk)
+            if cached_info is not None:
+                _validator_cache.move_to_end(pk)
+                found[pk] = cached_info
+            else:
+                misses.append(pk)
+
+        if misses:
+            batches = [misses[i : i + self.BATCH_SIZE] for i in range(0, len(misses), self.BATCH_SIZE)]
+            semaphore = asyncio.Semaphore(self.BATCH_CONCURRENCY)
+            client = get_http_client()
+
+            async def fetch(batch_number: int, batch: list[str]) -> list[ValidatorInfo]:
+                # Stagger batch starts to avoid rate limiting
+                await asyncio.sleep(batch_number * self.BATCH_INTERVAL)
+                async with semaphore:
+                    return await self._fetch_validator_batch(client, batch)
+
+            results = await asyncio.gather(*(fetch(n, batch) for n, batch in enumerate(batches)))
+            for batch_validators in results:
+                for v in batch_validators:
+                    pk = v.pubkey.lower()
+                    found[pk] = v
+                    # Failed lookups are retried on the next call; results are
+                    # not cached if the epoch rolled over while fetching
+                    if v.status != ValidatorStatus.UNKNOWN and _validator_cache_epoch == epoch:
+                        _validator_cache[pk] = v
+                        if len(_validator_cache) > VALIDATOR_CACHE_SIZE:
+                            _validator_cache.popitem(last=False)
+
+        return [found[pk] for pk in unique if pk in found]
+
+    async def _fetch_validator_batch(
+        self, client: httpx.AsyncClient, batch: list[str]
+    ) -> list[ValidatorInfo]:
+        """Fetch one batch of up to BATCH_SIZE pubkeys, retrying on rate limits."""
+        # POST keeps 100 pubkeys (~9.8KB) out of the URL, avoiding URL length limits
+        body = {"indicesOrPubkey": ",".join(batch)}
         max_retries = 3
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            for i in range(0, len(pubkeys), batch_size):
-                batch = pubkeys[i : i + batch_size]
-                pubkeys_param = ",".join(batch)
-
-                # Add delay between batches to avoid rate limiting
-                if i > 0:
-                    await asyncio.sleep(0.5)
-
-                for attempt in range(max_retries):
-                    try:
-                        response = await client.get(
-                            f"{self.base_url}/validator/{pubkeys_param}",
-                            headers=self._get_headers(),
-                        )
-
-                        if response.status_code == 200:
-                            data = response.json().get("data", [])
-                            # API returns single object if only one validator
-                            if isinstance(data, dict):
-                                data = [data]
-
-                            for v in data:
-                                validators.append(self._parse_validator(v))
-                            break  # Success, exit retry loop
-                        elif response.status_code == 404:
-                            # Validators not found - create placeholder entries
-                            for pubkey in batch:
-                                validators.append(
-                                    ValidatorInfo(
-                                        pubkey=pubkey,
-                                        status=ValidatorStatus.PENDING_INITIALIZED,
-                                    )
-                                )
-                            break  # Success, exit retry loop
-                        elif response.status_code == 429:
-                            # Rate limited - wait and retry
-                            if attempt < max_retries - 1:
-                                await asyncio.sleep(2**attempt)  # 1s, 2s, 4s
-                                continue
-                            # Max retries reached, add as unknown
-                            for pubkey in batch:
-                                validators.append(
-                                    ValidatorInfo(
-                                        pubkey=pubkey, status=ValidatorStatus.UNKNOWN
-                                    )
-                                )
-                            break
-                        else:
-                            # Other error status - add as unknown
-                            for pubkey in batch:
-                                validators.append(
-                                    ValidatorInfo(
-                                        pubkey=pubkey, status=ValidatorStatus.UNKNOWN
-                                    )
-                                )
-                            break
-                    except Exception:
-                        if attempt < max_retries - 1:
-                            await asyncio.sleep(1)
-                            continue
-                        # On final failure, add unknown status for this batch
-                        for pubkey in batch:
-                            validators.append(
-                                ValidatorInfo(
-                                    pubkey=pubkey, status=ValidatorStatus.UNKNOWN
-                                )
-                            )
-                        break
+        for attempt in range(max_retries):
+            try:
+                response = await client.post(
+                    f"{self.base_url}/validator",
+                    json=body,
+                    headers=self._get_headers(),
+                    timeout=30.0,
+                )
 
-        return validators
+                if response.status_code == 200:
+                    data = response.json().get("data", [])
+                    # API returns single object if only one validator
+                    if isinstance(data, dict):
+                        data = [data]
+                    return [self._parse_validator(v) for v in data]
+                elif response.status_code == 404:
+                    # Validators not found - create placeholder entries
+                    return [
+                        ValidatorInfo(pubkey=pubkey, status=ValidatorStatus.PENDING_INITIALIZED)
+                        for pubkey in batch
+                    ]
+                elif response.status_code == 429:
+                    # Rate limited - wait and retry
+                    if attempt < max_retries - 1:
+                        await asyncio.sleep(2**attempt)  # 1s, 2s, 4s
+                        continue
+                    # Max retries reached, add as unknown
+                    break
+                else:
+                    # Other error status - add as unknown
+                    break
+            except Exception:
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(1)
+                    continue
+                # On final failure, add unknown status for this batch
+                break
+
+        return [ValidatorInfo(pubkey=pubkey, status=ValidatorStatus.UNKNOWN) for pubkey in batch]
 
     def _parse_validator(self, data: dict) -> ValidatorInfo:
         """Parse beaconcha.in validator response."""
@@ -283,17 +335,18 @@ class BeaconDataProvider:
         self, validator_index: int
     ) -> dict | None:
         """Get detailed performance metrics for a validator."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.get(
-                    f"{self.base_url}/validator/{validator_index}/performance",
-                    headers=self._get_headers(),
-                )
-
-                if response.status_code == 200:
-                    return response.json().get("data")
-            except Exception as e:
-                logger.debug(f"Failed to get validator performance for index {validator_index}: {e}")
+        client = get_http_client()
+        try:
+            response = await client.get(
+                f"{self.base_url}/validator/{validator_index}/performance",
+                headers=self._get_headers(),
+                timeout=30.0,
+            )
+
+            if response.status_code == 200:
+                return response.json().get("data")
+        except Exception as e:
+            logger.debug(f"Failed to get validator performance for index {validator_index}: {e}")
 
         return None
 
@@ -320,39 +373,40 @@ class BeaconDataProvider:
         # Calculate epoch limit (~225 epochs per day)
         epoch_limit = days * 225
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            for i in range(0, len(validator_indices), batch_size):
-                batch = validator_indices[i : i + batch_size]
-                indices_param = ",".join(str(idx) for idx in batch)
-
-                try:
-                    response = await client.get(
-                        f"{self.base_url}/validator/{indices_param}/incomedetailhistory",
-                        params={"limit": epoch_limit},
-                        headers=self._get_headers(),
-                    )
-
-                    if response.status_code == 200:
-                        data = response.json().get("data", [])
-                        # Handle single validator response (dict instead of list)
-                        if isinstance(data, dict):
-                            data = [data]
-
-                        for entry in data:
-                            # Each entry has income breakdown by reward type
-                            # API returns: attestation_source_reward, attestation_target_reward,
-                            # attestation_head_reward (not a "total" field)
-                            income = entry.get("income", {})
-                            if isinstance(income, dict):
-                                # Sum all reward types (values are in gwei), filtering out non-numeric
-                                total_income_gwei += sum(
-                                    v for v in income.values() if isinstance(v, (int, float))
-                                )
-                            elif isinstance(income, (int, float)):
-                                total_income_gwei += income
-                except Exception as e:
-                    # On error, continue with partial data
-                    logger.warning(f"Failed to fetch income for validator batch: {e}")
+        client = get_http_client()
+        for i in range(0, len(validator_indices), batch_size):
+            batch = validator_indices[i : i + batch_size]
+            indices_param = ",".join(str(idx) for idx in batch)
+
+            try:
+                response = await client.get(
+                    f"{self.base_url}/validator/{indices_param}/incomedetailhistory",
+                    params={"limit": epoch_limit},
+                    headers=self._get_headers(),
+                    timeout=60.0,
+                )
+
+                if response.status_code == 200:
+                    data = response.json().get("data", [])
+                    # Handle single validator response (dict instead of list)
+                    if isinstance(data, dict):
+                        data = [data]
+
+                    for entry in data:
+                        # Each entry has income breakdown by reward type
+                        # API returns: attestation_source_reward, attestation_target_reward,
+                        # attestation_head_reward (not a "total" field)
+                        income = entry.get("income", {})
+                        if isinstance(income, dict):
+                            # Sum all reward types (values are in gwei), filtering out non-numeric
+                            total_income_gwei += sum(
+                                v for v in income.values() if isinstance(v, (int, float))
+                            )
+                        elif isinstance(income, (int, float)):
+                            total_income_gwei += income
+            except Exception as e:
+                # On error, continue with partial data
+                logger.warning(f"Failed to fetch income for validator batch: {e}")
 
         return {
             "total_income_eth": Decimal(total_income_gwei) / Decimal(10**9),
@@ -420,3 +474,75 @@ def count_slashed_validators(validators: list[ValidatorInfo]) -> int:
         1 for v in validators
         if v.status in (ValidatorStatus.ACTIVE_SLASHED, ValidatorStatus.EXITED_SLASHED)
     )
+
+
+# aggregate_validator_status() buckets, precomputed per status
+_STATUS_BUCKETS: dict[ValidatorStatus, str] = {
+    ValidatorStatus.PENDING_INITIALIZED: "pending",
+    ValidatorStatus.PENDING_QUEUED: "pending",
+    ValidatorStatus.ACTIVE_ONGOING: "active",
+    ValidatorStatus.ACTIVE_EXITING: "exiting",
+    ValidatorStatus.ACTIVE_SLASHED: "slashed",
+    ValidatorStatus.EXITED_UNSLASHED: "exited",
+    ValidatorStatus.EXITED_SLASHED: "slashed",
+    ValidatorStatus.WITHDRAWAL_POSSIBLE: "exited",
+    ValidatorStatus.WITHDRAWAL_DONE: "exited",
+}
+
+# ValidatorStatus.is_active as a set, for hash lookups in the summary loop
+_ACTIVE_STATUSES = frozenset(status for status in ValidatorStatus if status.is_active)
+
+
+@dataclass(slots=True, kw_only=True)
+class ValidatorSummary:
+    """Aggregates over an operator's validators, computed in one pass."""
+
+    by_status: dict[str, int]
+    avg_effectiveness: float | None
+    slashed_count: int
+    at_risk_count: int
+    earliest_activation: datetime | None
+
+
+def summarize_validators(validators: list[ValidatorInfo]) -> ValidatorSummary:
+    """Compute aggregate_validator_status, calculate_avg_effectiveness,
+    count_slashed_validators, count_at_risk_validators and
+    get_earliest_activation in a single pass over the validators.
+    """
+    counts = {
+        "active": 0,
+        "pending": 0,
+        "exiting": 0,
+        "exited": 0,
+        "slashed": 0,
+        "unknown": 0,
+    }
+    effectiveness_total = 0.0
+    effectiveness_count = 0
+    at_risk_count = 0
+    earliest_epoch: int | None = None
+
+    for v in validators:
+        status = v.status
+        counts[_STATUS_BUCKETS.get(status, "unknown")] += 1
+
+        if status in _ACTIVE_STATUSES:
+            if v.effectiveness is not None:
+                effectiveness_total += v.effectiveness
+                effectiveness_count += 1
+            # Same rule as ValidatorInfo.at_risk (32 ETH = 32_000_000_000 gwei)
+            if v.balance_gwei < 32_000_000_000:
+                at_risk_count += 1
+
+        epoch = v.activation_epoch
+        if epoch is not None and (earliest_epoch is None or epoch < earliest_epoch):
+            earliest_epoch = epoch
+
+    return ValidatorSummary(
+        by_status=counts,
+        avg_effectiveness=effectiveness_total / effectiveness_count if effectiveness_count else None,
+        slashed_count=counts["slashed"],
+        at_risk_count=at_risk_count,
+        earliest_activation=epoch_to_datetime(earliest_epoch) if earliest_epoch is not None else None,
+    )
+
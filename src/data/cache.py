@@ -1,9 +1,10 @@
-"""Simple in-memory cache with TTL support and LRU eviction."""
+"""Simple in-memory cache with TTL support and size-bounded eviction."""
 
-import hashlib
+import asyncio
 import logging
+import time
 from collections import OrderedDict
-from datetime import datetime, timedelta
+from collections.abc import Hashable
 from functools import wraps
 from typing import Any, Callable
 
@@ -17,41 +18,46 @@ DEFAULT_MAX_SIZE = 1000
 
 class SimpleCache:
     """
-    Simple in-memory cache with TTL and LRU eviction.
+    Simple in-memory cache with TTL and size-bounded eviction.
 
     Safe for single-threaded async but not thread-safe.
-    Uses OrderedDict for LRU eviction when max_size is reached.
+    When max_size is reached, expired entries are dropped first, then the
+    oldest entries by insertion order. Reads never reorder entries; with
+    short TTLs this behaves like LRU in practice.
     """
 
     def __init__(self, default_ttl: int | None = None, max_size: int = DEFAULT_MAX_SIZE):
-        self._cache: OrderedDict[str, tuple[Any, datetime]] = OrderedDict()
+        self._cache: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
         self._default_ttl = default_ttl or get_settings().cache_ttl_seconds
         self._max_size = max_size
 
-    def get(self, key: str) -> Any | None:
-        """Get value from cache if not expired. Moves accessed key to end (LRU)."""
+    def get(self, key: Hashable) -> Any | None:
+        """Get value from cache if not expired."""
         if key in self._cache:
             value, expiry = self._cache[key]
-            if datetime.now() < expiry:
-                # Move to end to mark as recently used
-                self._cache.move_to_end(key)
+            if time.monotonic() < expiry:
                 return value
             # Expired - remove it
             del self._cache[key]
         return None
 
-    def set(self, key: str, value: Any, ttl: int | None = None) -> None:
-        """Set value in cache with TTL. Evicts LRU entries if at max size."""
+    def set(self, key: Hashable, value: Any, ttl: int | None = None) -> None:
+        """Set value in cache with TTL. Evicts expired, then oldest entries if at max size."""
         # If key exists, remove it first (will be re-added at end)
         if key in self._cache:
             del self._cache[key]
 
-        # Evict oldest entries if at max size
+        # At max size: drop expired entries first (cheap under TTL pressure)
+        if len(self._cache) >= self._max_size:
+            self.cleanup_expired()
+
+        # Still full - evict oldest entries by insertion order
         while len(self._cache) >= self._max_size:
             oldest_key, _ = self._cache.popitem(last=False)
-            logger.debug(f"Cache eviction: removed {oldest_key[:16]}...")
+            logger.debug(f"Cache eviction: removed {oldest_key!r:.64}...")
 
-        expiry = datetime.now() + timedelta(seconds=ttl or self._default_ttl)
+        # Monotonic deadline: cheap float compare, immune to wall-clock jumps
+        expiry = time.monotonic() + (ttl or self._default_ttl)
         self._cache[key] = (value, expiry)
 
     def clear(self) -> None:
@@ -60,13 +66,14 @@ class SimpleCache:
 
     def cleanup_expired(self) -> int:
         """Remove all expired entries. Returns count of removed entries."""
-        now = datetime.now()
-        expired_keys = [
-            key for key, (_, expiry) in self._cache.items() if now >= expiry
-        ]
-        for key in expired_keys:
-            del self._cache[key]
-        return len(expired_keys)
+        now = time.monotonic()
+        removed = 0
+        # Single pass over a snapshot of the keys, deleting as we go
+        for key in list(self._cache):
+            if now >= self._cache[key][1]:
+                del self._cache[key]
+                removed += 1
+        return removed
 
     @property
     def size(self) -> int:
@@ -76,6 +83,17 @@ class SimpleCache:
 
 # Global cache instance
 _cache = SimpleCache()
+# In-flight calls by cache key, so concurrent misses coalesce
+_inflight: dict[Hashable, asyncio.Future] = {}
+
+
+def _hashable(value: Any) -> Hashable:
+    """Return value unchanged if hashable, otherwise its repr (e.g. lists of pubkeys)."""
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
 
 
 def cached(ttl: int | None = None) -> Callable:
@@ -91,16 +109,37 @@ def cached(ttl: int | None = None) -> Callable:
             if args and hasattr(args[0], func.__name__):
                 # First arg is likely 'self' - skip it for cache key
                 cache_args = args[1:]
-            key_data = f"{func.__module__}.{func.__name__}:{repr(cache_args)}:{repr(sorted(kwargs.items()))}"
-            cache_key = hashlib.md5(key_data.encode()).hexdigest()
+            # Native tuple key - dicts hash tuples in C, no string building needed.
+            # kwargs keep call-site order (no sort): a differently ordered call
+            # only costs a cache miss, never a wrong hit.
+            cache_key = (
+                func.__module__,
+                func.__qualname__,
+                tuple(_hashable(a) for a in cache_args),
+                tuple((k, _hashable(v)) for k, v in kwargs.items()) if kwargs else (),
+            )
 
             cached_result = _cache.get(cache_key)
             if cached_result is not None:
                 return cached_result
 
-            result = await func(*args, **kwargs)
-            _cache.set(cache_key, result, ttl)
-            return result
+            # Concurrent misses for the same key share one call instead of
+            # each hitting the upstream
+            task = _inflight.get(cache_key)
+            if task is None or task.get_loop() is not asyncio.get_running_loop():
+                task = asyncio.ensure_future(func(*args, **kwargs))
+                _inflight[cache_key] = task
+
+                def on_done(done: asyncio.Future) -> None:
+                    if _inflight.get(cache_key) is done:
+                        del _inflight[cache_key]
+                    # Failures are not cached
+                    if not done.cancelled() and done.exception() is None:
+                        _cache.set(cache_key, done.result(), ttl)
+
+                task.add_done_callback(on_done)
+            # Shield so one cancelled caller doesn't cancel the call for the others
+            return await asyncio.shield(task)
 
         return wrapper
 
@@ -1,21 +1,80 @@
 """SQLite database for persisting saved operators."""
 
-import json
+import asyncio
 import logging
+import zlib
 from datetime import datetime
 from pathlib import Path
 
 import aiosqlite
 
+from ..core import jsonutil
 from ..core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
-_db_initialized = False
+# Process-wide connection, opened lazily by init_db() and reused by every call
+_conn: aiosqlite.Connection | None = None
+_init_lock = asyncio.Lock()
+# Serializes write transactions on the shared connection
+_write_lock = asyncio.Lock()
+
+# zlib level for data_blob; low levels already shrink the JSON several times over
+COMPRESSION_LEVEL = 3
+
+# get_saved_operators() results are cached per (write generation, data_version).
+# The generation counter covers this process's writes; PRAGMA data_version
+# changes when another connection (e.g. another server worker) commits.
+_gen = 0
+_saved_cache: tuple[tuple[int, int], list[dict]] | None = None
 
 # Database connection timeout in seconds (prevents hanging on locks)
 DB_TIMEOUT = 5.0
 
+# Per-connection PRAGMAs (journal_mode=WAL is persistent, set once in init_db)
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",  # WAL makes NORMAL safe; one fsync less per commit
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",  # ~64 MB page cache
+    "PRAGMA mmap_size=268435456",  # 256 MB memory-mapped I/O
+)
+
+
+# Statement text is kept in one place so every call sends the identical SQL and
+# hits sqlite3's per-connection prepared statement cache on the shared connection
+SQL_UPSERT = """
+    INSERT INTO saved_operators (operator_id, manager_address, reward_address, data_json, data_blob, saved_at, updated_at)
+    VALUES (?, ?, ?, '', ?, ?, ?)
+    ON CONFLICT(operator_id) DO UPDATE SET
+        manager_address = excluded.manager_address,
+        reward_address = excluded.reward_address,
+        data_blob = excluded.data_blob,
+        updated_at = excluded.updated_at
+"""
+SQL_UPDATE = """
+    UPDATE saved_operators
+    SET manager_address = ?, reward_address = ?, data_blob = ?, updated_at = ?
+    WHERE operator_id = ?
+"""
+SQL_SELECT_ALL = """
+    SELECT operator_id, data_blob, saved_at, updated_at
+    FROM saved_operators
+    ORDER BY saved_at DESC
+"""
+SQL_SELECT_ADDRESSES = """
+    SELECT operator_id, manager_address, reward_address
+    FROM saved_operators
+    ORDER BY saved_at DESC
+"""
+SQL_DATA_VERSION = "PRAGMA data_version"
+SQL_DELETE = "DELETE FROM saved_operators WHERE operator_id = ?"
+SQL_EXISTS = "SELECT 1 FROM saved_operators WHERE operator_id = ?"
+SQL_FIND_BY_ADDRESS = """
+    SELECT operator_id FROM saved_operators
+    WHERE manager_address = ? COLLATE NOCASE OR reward_address = ? COLLATE NOCASE
+    LIMIT 1
+"""
+
 
 async def get_db_path() -> Path:
     """Get the database file path, creating parent directories if needed."""
@@ -26,33 +85,108 @@ async def get_db_path() -> Path:
     return db_path
 
 
+async def _open_connection() -> aiosqlite.Connection:
+    """Open a database connection with the per-connection PRAGMAs applied."""
+    db_path = await get_db_path()
+    db = await aiosqlite.connect(db_path, timeout=DB_TIMEOUT)
+    db.row_factory = aiosqlite.Row
+    for pragma in CONNECTION_PRAGMAS:
+        await db.execute(pragma)
+    return db
+
+
 async def init_db() -> None:
-    """Initialize the database schema."""
-    global _db_initialized
-    if _db_initialized:
+    """Open the shared connection and initialize the database schema."""
+    global _conn
+    if _conn is not None:
         logger.debug("Database already initialized")
         return
 
-    logger.info("Initializing database schema")
-    db_path = await get_db_path()
-    async with aiosqlite.connect(db_path, timeout=DB_TIMEOUT) as db:
-        # Enable WAL mode for better concurrent access
+    async with _init_lock:
+        if _conn is not None:
+            return
+
+        logger.info("Initializing database schema")
+        db = await _open_connection()
+        # Enable WAL mode for better concurrent access (persistent setting)
         await db.execute("PRAGMA journal_mode=WAL")
         await db.execute("""
             CREATE TABLE IF NOT EXISTS saved_operators (
                 operator_id INTEGER PRIMARY KEY,
                 manager_address TEXT NOT NULL,
                 reward_address TEXT NOT NULL,
-                data_json TEXT NOT NULL,
+                data_json TEXT NOT NULL DEFAULT '',
+                data_blob BLOB,
                 saved_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
+        await _migrate_data_blob(db)
+        # Case-insensitive address indexes for find_saved_by_address()
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_manager ON saved_operators(manager_address COLLATE NOCASE)"
+        )
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_reward ON saved_operators(reward_address COLLATE NOCASE)"
+        )
         await db.commit()
-    _db_initialized = True
+        _conn = db
     logger.info("Database initialized successfully")
 
 
+async def _migrate_data_blob(db: aiosqlite.Connection) -> None:
+    """Move legacy TEXT data_json rows into the compressed data_blob column."""
+    async with db.execute("PRAGMA table_info(saved_operators)") as cursor:
+        columns = {row["name"] for row in await cursor.fetchall()}
+    if "data_blob" not in columns:
+        await db.execute("ALTER TABLE saved_operators ADD COLUMN data_blob BLOB")
+
+    async with db.execute(
+        "SELECT operator_id, data_json FROM saved_operators WHERE data_blob IS NULL"
+    ) as cursor:
+        rows = await cursor.fetchall()
+    if not rows:
+        return
+
+    logger.info(f"Compressing {len(rows)} saved operators into data_blob")
+    await db.executemany(
+        "UPDATE saved_operators SET data_blob = ?, data_json = '' WHERE operator_id = ?",
+        [(zlib.compress(row["data_json"].encode(), COMPRESSION_LEVEL), row["operator_id"]) for row in rows],
+    )
+
+
+def _encode_data(data: dict) -> bytes:
+    """Serialize and compress operator data for the data_blob column."""
+    return zlib.compress(jsonutil.dumps(data), COMPRESSION_LEVEL)
+
+
+def _decode_data(blob: bytes) -> dict:
+    """Decompress and parse a data_blob value."""
+    return jsonutil.loads(zlib.decompress(blob))
+
+
+async def _get_db() -> aiosqlite.Connection:
+    """Get the shared connection, initializing the database on first use."""
+    await init_db()
+    return _conn
+
+
+def _bump_generation() -> None:
+    """Invalidate the get_saved_operators() cache after a write."""
+    global _gen
+    _gen += 1
+
+
+async def close_db() -> None:
+    """Close the shared connection (called on application shutdown)."""
+    global _conn, _saved_cache
+    _saved_cache = None
+    if _conn is not None:
+        await _conn.close()
+        _conn = None
+        logger.info("Database connection closed")
+
+
 async def save_operator(operator_id: int, data: dict) -> None:
     """Save or update an operator in the database.
 
@@ -60,25 +194,17 @@ async def save_operator(operator_id: int, data: dict) -> None:
         operator_id: The operator ID
         data: The full operator data dictionary (from API response)
     """
-    await init_db()
-    db_path = await get_db_path()
+    db = await _get_db()
 
     manager_address = data.get("manager_address", "")
     reward_address = data.get("reward_address", "")
-    data_json = json.dumps(data)
+    data_blob = _encode_data(data)
     now = datetime.utcnow().isoformat()
 
-    async with aiosqlite.connect(db_path, timeout=DB_TIMEOUT) as db:
-        await db.execute("""
-            INSERT INTO saved_operators (operator_id, manager_address, reward_address, data_json, saved_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            ON CONFLICT(operator_id) DO UPDATE SET
-                manager_address = excluded.manager_address,
-                reward_address = excluded.reward_address,
-                data_json = excluded.data_json,
-                updated_at = excluded.updated_at
-        """, (operator_id, manager_address, reward_address, data_json, now, now))
+    async with _write_lock:
+        await db.execute(SQL_UPSERT, (operator_id, manager_address, reward_address, data_blob, now, now))
         await db.commit()
+        _bump_generation()
 
 
 async def get_saved_operators() -> list[dict]:
@@ -87,38 +213,52 @@ async def get_saved_operators() -> list[dict]:
     Returns:
         List of operator data dictionaries with added metadata (saved_at, updated_at)
     """
+    global _saved_cache
     try:
+        db = await _get_db()
+
+        async with db.execute(SQL_DATA_VERSION) as cursor:
+            version = (_gen, (await cursor.fetchone())[0])
+        if _saved_cache is not None and _saved_cache[0] == version:
+            # Shallow copies so callers can't mutate the cached entries
+            return [dict(op) for op in _saved_cache[1]]
+
         logger.debug("Getting saved operators from database")
-        await init_db()
-        db_path = await get_db_path()
-
-        async with aiosqlite.connect(db_path, timeout=DB_TIMEOUT) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute("""
-                SELECT operator_id, data_json, saved_at, updated_at
-                FROM saved_operators
-                ORDER BY saved_at DESC
-            """) as cursor:
-                rows = await cursor.fetchall()
+        async with db.execute(SQL_SELECT_ALL) as cursor:
+            rows = await cursor.fetchall()
 
         result = []
         for row in rows:
             try:
-                data = json.loads(row["data_json"])
+                data = _decode_data(row["data_blob"])
                 data["_saved_at"] = row["saved_at"]
                 data["_updated_at"] = row["updated_at"]
                 result.append(data)
-            except json.JSONDecodeError:
-                logger.warning(f"Corrupted JSON for operator {row['operator_id']}, skipping")
+            except (zlib.error, ValueError):
+                logger.warning(f"Corrupted data for operator {row['operator_id']}, skipping")
                 continue
 
         logger.debug(f"Retrieved {len(result)} saved operators from database")
-        return result
+        _saved_cache = (version, result)
+        return [dict(op) for op in result]
     except Exception as e:
         logger.error(f"Database error in get_saved_operators: {e}", exc_info=True)
         return []
 
 
+async def list_saved_addresses() -> list[tuple[int, str, str]]:
+    """Get the ID and addresses of every saved operator without loading their data.
+
+    Returns:
+        List of (operator_id, manager_address, reward_address) tuples
+    """
+    db = await _get_db()
+
+    async with db.execute(SQL_SELECT_ADDRESSES) as cursor:
+        rows = await cursor.fetchall()
+    return [(row["operator_id"], row["manager_address"], row["reward_address"]) for row in rows]
+
+
 async def delete_operator(operator_id: int) -> bool:
     """Remove an operator from the saved list.
 
@@ -128,15 +268,12 @@ async def delete_operator(operator_id: int) -> bool:
     Returns:
         True if the operator was deleted, False if not found
     """
-    await init_db()
-    db_path = await get_db_path()
+    db = await _get_db()
 
-    async with aiosqlite.connect(db_path, timeout=DB_TIMEOUT) as db:
-        cursor = await db.execute(
-            "DELETE FROM saved_operators WHERE operator_id = ?",
-            (operator_id,)
-        )
+    async with _write_lock:
+        cursor = await db.execute(SQL_DELETE, (operator_id,))
         await db.commit()
+        _bump_generation()
         return cursor.rowcount > 0
 
 
@@ -149,16 +286,27 @@ async def is_operator_saved(operator_id: int) -> bool:
     Returns:
         True if the operator is saved, False otherwise
     """
-    await init_db()
-    db_path = await get_db_path()
+    db = await _get_db()
+
+    async with db.execute(SQL_EXISTS, (operator_id,)) as cursor:
+        row = await cursor.fetchone()
+        return row is not None
+
+
+async def find_saved_by_address(address: str) -> int | None:
+    """Find a saved operator by manager or reward address.
+
+    Args:
+        address: Ethereum address (case-insensitive)
+
+    Returns:
+        The operator ID if a saved operator uses this address, None otherwise
+    """
+    db = await _get_db()
 
-    async with aiosqlite.connect(db_path, timeout=DB_TIMEOUT) as db:
-        async with db.execute(
-            "SELECT 1 FROM saved_operators WHERE operator_id = ?",
-            (operator_id,)
-        ) as cursor:
-            row = await cursor.fetchone()
-            return row is not None
+    async with db.execute(SQL_FIND_BY_ADDRESS, (address, address)) as cursor:
+        row = await cursor.fetchone()
+        return row["operator_id"] if row else None
 
 
 async def update_operator_data(operator_id: int, data: dict) -> bool:
@@ -171,19 +319,47 @@ async def update_operator_data(operator_id: int, data: dict) -> bool:
     Returns:
         True if updated, False if operator not found
     """
-    await init_db()
-    db_path = await get_db_path()
+    db = await _get_db()
 
     manager_address = data.get("manager_address", "")
     reward_address = data.get("reward_address", "")
-    data_json = json.dumps(data)
+    data_blob = _encode_data(data)
     now = datetime.utcnow().isoformat()
 
-    async with aiosqlite.connect(db_path, timeout=DB_TIMEOUT) as db:
-        cursor = await db.execute("""
-            UPDATE saved_operators
-            SET manager_address = ?, reward_address = ?, data_json = ?, updated_at = ?
-            WHERE operator_id = ?
-        """, (manager_address, reward_address, data_json, now, operator_id))
+    async with _write_lock:
+        cursor = await db.execute(SQL_UPDATE, (manager_address, reward_address, data_blob, now, operator_id))
         await db.commit()
+        _bump_generation()
         return cursor.rowcount > 0
+
+
+async def update_operators_bulk(items: list[tuple[int, dict]]) -> None:
+    """Update the cached data for many saved operators in a single transaction.
+
+    Operators that are no longer saved (e.g. removed while a refresh was in
+    flight) are skipped rather than re-inserted.
+
+    Args:
+        items: List of (operator_id, data) pairs
+    """
+    if not items:
+        return
+
+    db = await _get_db()
+
+    now = datetime.utcnow().isoformat()
+    rows = [
+        (
+            data.get("manager_address", ""),
+            data.get("reward_address", ""),
+            _encode_data(data),
+            now,
+            operator_id,
+        )
+        for operator_id, data in items
+    ]
+
+    async with _write_lock:
+        await db.executemany(SQL_UPDATE, rows)
+        await db.commit()
+        _bump_generation()
@@ -0,0 +1,42 @@
+"""Shared pooled HTTP client for REST and IPFS gateway calls."""
+
+import asyncio
+import logging
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Connection pool bounds for the shared client
+HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+DEFAULT_TIMEOUT = 10.0
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the process-wide httpx client, creating it on first use.
+
+    Reusing one client keeps TCP/TLS connections alive across requests instead
+    of paying a new handshake per call. Per-call settings (timeout,
+    follow_redirects) are passed to the individual request methods.
+    A new client is created if the running event loop changed, since pooled
+    connections can't move between loops.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(limits=HTTP_LIMITS, timeout=DEFAULT_TIMEOUT)
+        _client_loop = loop
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client (called on application shutdown)."""
+    global _client, _client_loop
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        _client_loop = None
+        logger.info("HTTP client closed")
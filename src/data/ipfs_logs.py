@@ -4,14 +4,15 @@ import asyncio
 import json
 import logging
 import time
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
 
-import httpx
-
 from ..core.config import get_settings
+from .http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +20,19 @@ logger = logging.getLogger(__name__)
 # Ethereum Beacon Chain genesis timestamp (Dec 1, 2020 12:00:23 UTC)
 BEACON_GENESIS = 1606824023
 
+# Parsed logs kept in memory across providers (CID content is immutable, so no
+# TTL), plus in-flight fetches so concurrent requests for a CID share one load.
+LOG_MEMORY_CACHE_SIZE = 32
+_log_memory_cache: OrderedDict[str, dict] = OrderedDict()
+_inflight_fetches: dict[str, asyncio.Future] = {}
+
+# Extracted per-operator frames keyed by (operator_id, log CIDs). A new
+# distribution log changes the key, so entries never go stale.
+OPERATOR_HISTORY_CACHE_SIZE = 256
+_operator_history_cache: OrderedDict[tuple, list["FrameData"]] = OrderedDict()
 
+
+@lru_cache(maxsize=4096)
 def epoch_to_datetime(epoch: int) -> datetime:
     """Convert beacon chain epoch to datetime.
 
@@ -29,7 +42,7 @@ def epoch_to_datetime(epoch: int) -> datetime:
     return datetime.fromtimestamp(timestamp, tz=timezone.utc)
 
 
-@dataclass
+@dataclass(slots=True)
 class FrameData:
     """Data from a single distribution frame."""
 
@@ -39,6 +52,11 @@ class FrameData:
     block_number: int
     distributed_rewards: int  # For specific operator, in wei
     validator_count: int  # Number of validators for operator in this frame
+    duration_days: float = field(init=False)
+
+    def __post_init__(self):
+        # Each epoch is 6.4 minutes (384 seconds = 32 slots * 12 seconds)
+        self.duration_days = (self.end_epoch - self.start_epoch) * 384 / 86400
 
 
 class IPFSLogProvider:
@@ -46,6 +64,8 @@ class IPFSLogProvider:
 
     # Rate limiting: minimum seconds between gateway requests
     MIN_REQUEST_INTERVAL = 1.0
+    # Upper bound on gateway fetches in flight when callers gather fetch_log()
+    MAX_CONCURRENT_FETCHES = 8
 
     def __init__(self, cache_dir: Path | None = None):
         self.settings = get_settings()
@@ -55,6 +75,7 @@ class IPFSLogProvider:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self._last_request_time = 0.0
         self._rate_limit_lock = asyncio.Lock()
+        self._fetch_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
 
     def _get_cache_path(self, cid: str) -> Path:
         """Get the cache file path for a CID."""
@@ -94,23 +115,51 @@ class IPFSLogProvider:
         """
         Fetch and parse a distribution log from IPFS.
 
-        Checks local cache first, then tries IPFS gateways.
+        Checks the in-memory cache, then the local disk cache, then tries IPFS
+        gateways. Concurrent calls for the same CID share a single load.
         Returns None if fetch fails.
         """
-        # Check cache first
-        cached = self._load_from_cache(cid)
-        if cached is not None:
-            return cached
-
-        # Rate limit gateway requests (async-safe)
-        await self._rate_limit()
-
-        # Try each gateway
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+        data = _log_memory_cache.get(cid)
+        if data is not None:
+            _log_memory_cache.move_to_end(cid)
+            return data
+
+        task = _inflight_fetches.get(cid)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._load_log(cid))
+            _inflight_fetches[cid] = task
+
+            def on_done(done: asyncio.Future) -> None:
+                if _inflight_fetches.get(cid) is done:
+                    del _inflight_fetches[cid]
+
+            task.add_done_callback(on_done)
+        # Shield so one cancelled caller doesn't cancel the load for the others
+        return await asyncio.shield(task)
+
+    async def _load_log(self, cid: str) -> dict | None:
+        """Load a log from disk cache or IPFS and remember it in memory."""
+        data = self._load_from_cache(cid)
+        if data is None:
+            data = await self._fetch_from_gateways(cid)
+        if data is not None:
+            _log_memory_cache[cid] = data
+            if len(_log_memory_cache) > LOG_MEMORY_CACHE_SIZE:
+                _log_memory_cache.popitem(last=False)
+        return data
+
+    async def _fetch_from_gateways(self, cid: str) -> dict | None:
+        """Fetch a log from the configured IPFS gateways and save it to disk."""
+        async with self._fetch_semaphore:
+            # Rate limit gateway requests (async-safe)
+            await self._rate_limit()
+
+            # Try each gateway over the shared pooled client (keep-alive connections)
+            client = get_http_client()
             for gateway in self.gateways:
                 try:
                     url = f"{gateway}{cid}"
-                    response = await client.get(url)
+                    response = await client.get(url, timeout=30.0, follow_redirects=True)
                     if response.status_code == 200:
                         try:
                             data = response.json()
@@ -127,8 +176,8 @@ class IPFSLogProvider:
                     logger.debug(f"IPFS gateway {gateway} failed for CID {cid}: {e}")
                     continue  # Try next gateway
 
-        logger.warning(f"All IPFS gateways failed for CID {cid}")
-        return None
+            logger.warning(f"All IPFS gateways failed for CID {cid}")
+            return None
 
     def get_operator_frame_rewards(self, log_data: dict, operator_id: int) -> int | None:
         """
@@ -194,13 +243,24 @@ class IPFSLogProvider:
         Returns:
             List of FrameData objects, sorted by epoch (oldest first)
         """
+        key = (operator_id, tuple(entry["logCid"] for entry in log_cids))
+        cached_frames = _operator_history_cache.get(key)
+        if cached_frames is not None:
+            _operator_history_cache.move_to_end(key)
+            return list(cached_frames)
+
+        # Fetch all frame logs concurrently (gateway fetches stay bounded by
+        # MAX_CONCURRENT_FETCHES and the rate limiter)
+        log_datas = await asyncio.gather(
+            *(self.fetch_log(entry["logCid"]) for entry in log_cids)
+        )
+
         frames = []
 
-        for entry in log_cids:
+        for entry, log_data in zip(log_cids, log_datas):
             cid = entry["logCid"]
             block = entry["block"]
 
-            log_data = await self.fetch_log(cid)
             if log_data is None:
                 continue
 
@@ -225,14 +285,17 @@ class IPFSLogProvider:
 
         # Sort by epoch (oldest first)
         frames.sort(key=lambda f: f.start_epoch)
-        return frames
+
+        # Only complete histories are reused; a failed fetch is retried next time
+        if all(log_data is not None for log_data in log_datas):
+            _operator_history_cache[key] = frames
+            if len(_operator_history_cache) > OPERATOR_HISTORY_CACHE_SIZE:
+                _operator_history_cache.popitem(last=False)
+        return list(frames)
 
     def calculate_frame_duration_days(self, frame: FrameData) -> float:
         """Calculate the duration of a frame in days."""
-        # Each epoch is 6.4 minutes (384 seconds = 32 slots * 12 seconds)
-        epochs = frame.end_epoch - frame.start_epoch
-        minutes = epochs * 6.4
-        return minutes / (60 * 24)
+        return frame.duration_days
 
     def calculate_historical_apy(
         self,
@@ -261,6 +324,9 @@ class IPFSLogProvider:
         if not frames or bond_eth <= 0:
             return {self._period_name(p): None for p in periods}
 
+        # Float math: results are rounded to 2 decimals
+        bond_f = float(bond_eth)
+
         results = {}
 
         for period in periods:
@@ -274,7 +340,7 @@ class IPFSLogProvider:
                 total_days = 0.0
                 selected_frames = []
                 for frame in reversed(frames):
-                    frame_days = self.calculate_frame_duration_days(frame)
+                    frame_days = frame.duration_days
                     if total_days + frame_days <= period * 1.5:  # Allow some buffer
                         selected_frames.insert(0, frame)
                         total_days += frame_days
@@ -287,20 +353,19 @@ class IPFSLogProvider:
 
             # Sum rewards and calculate total days
             total_rewards_wei = sum(f.distributed_rewards for f in selected_frames)
-            total_days = sum(self.calculate_frame_duration_days(f) for f in selected_frames)
+            total_days = sum(f.duration_days for f in selected_frames)
 
             if total_days <= 0:
                 results[self._period_name(period)] = None
                 continue
 
             # Convert rewards to ETH
-            total_rewards_eth = Decimal(total_rewards_wei) / Decimal(10**18)
+            total_rewards_eth = total_rewards_wei / 1e18
 
             # Annualize: (rewards / bond) * (365 / days) * 100
-            # Keep calculation in Decimal for precision, convert to float only at the end
-            apy = (total_rewards_eth / bond_eth) * Decimal(365) / Decimal(total_days) * Decimal(100)
+            apy = total_rewards_eth / bond_f * 365.0 / total_days * 100
 
-            results[self._period_name(period)] = round(float(apy), 2)
+            results[self._period_name(period)] = round(apy, 2)
 
         return results
 
@@ -311,6 +376,8 @@ class IPFSLogProvider:
         return f"{period}d"
 
     def clear_cache(self) -> None:
-        """Clear all cached IPFS logs."""
+        """Clear all cached IPFS logs (on disk and in memory)."""
         for cache_file in self.cache_dir.glob("*.json"):
             cache_file.unlink(missing_ok=True)
+        _log_memory_cache.clear()
+        _operator_history_cache.clear()
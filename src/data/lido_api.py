@@ -2,10 +2,9 @@
 
 import logging
 
-import httpx
-
 from ..core.config import get_settings
 from .cache import cached
+from .http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -16,32 +15,34 @@ LIDO_SUBGRAPH_ID = "Sxx812XgeKyzQPaBpR5YZWmGV5fZuBaPdh7DFhzSwiQ"
 class LidoAPIProvider:
     """Fetches data from Lido's public API."""
 
-    @cached(ttl=3600)  # Cache for 1 hour
     async def get_steth_apr(self) -> dict:
         """
         Get current stETH APR from Lido API.
 
         Returns 7-day SMA (simple moving average) APR.
         """
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            try:
-                response = await client.get(
-                    f"{LIDO_API_BASE}/protocol/steth/apr/sma"
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    # Handle case where data["data"] could be explicitly None
-                    data_obj = data.get("data") or {}
-                    return {
-                        "apr": float(data_obj.get("smaApr", 0) or 0),
-                        "timestamp": data_obj.get("timeUnix"),
-                    }
-            except Exception as e:
-                logger.warning(f"Failed to fetch stETH APR from Lido API: {e}")
+        try:
+            return await self._fetch_steth_apr()
+        except Exception as e:
+            logger.warning(f"Failed to fetch stETH APR from Lido API: {e}")
 
         return {"apr": None, "timestamp": None}
 
+    @cached(ttl=3600)  # Cache for 1 hour (the SMA updates daily)
+    async def _fetch_steth_apr(self) -> dict:
+        """Fetch the stETH APR, raising on failure so errors aren't cached."""
+        response = await get_http_client().get(
+            f"{LIDO_API_BASE}/protocol/steth/apr/sma", timeout=10.0
+        )
+        response.raise_for_status()
+        data = response.json()
+        # Handle case where data["data"] could be explicitly None
+        data_obj = data.get("data") or {}
+        return {
+            "apr": float(data_obj.get("smaApr", 0) or 0),
+            "timestamp": data_obj.get("timeUnix"),
+        }
+
     @cached(ttl=3600)  # Cache for 1 hour
     async def get_historical_apr_data(self) -> list[dict]:
         """Fetch historical APR data from Lido subgraph.
@@ -67,20 +68,20 @@ class LidoAPIProvider:
 
         endpoint = f"https://gateway-arbitrum.network.thegraph.com/api/{settings.thegraph_api_key}/subgraphs/id/{LIDO_SUBGRAPH_ID}"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.post(
-                    endpoint,
-                    json={"query": query},
-                    headers={"Content-Type": "application/json"},
-                )
-                if response.status_code == 200:
-                    data = response.json()
-                    results = data.get("data", {}).get("totalRewards", [])
-                    # Reverse to get ascending order (oldest to newest) for binary search
-                    return list(reversed(results))
-            except Exception as e:
-                logger.warning(f"Failed to fetch historical APR from TheGraph: {e}")
+        try:
+            response = await get_http_client().post(
+                endpoint,
+                json={"query": query},
+                headers={"Content-Type": "application/json"},
+                timeout=30.0,
+            )
+            if response.status_code == 200:
+                data = response.json()
+                results = data.get("data", {}).get("totalRewards", [])
+                # Reverse to get ascending order (oldest to newest) for binary search
+                return list(reversed(results))
+        except Exception as e:
+            logger.warning(f"Failed to fetch historical APR from TheGraph: {e}")
 
         return []
 
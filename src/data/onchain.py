@@ -3,9 +3,11 @@
 import asyncio
 import logging
 from decimal import Decimal
-from functools import partial
+from functools import lru_cache
 
-from web3 import Web3
+from eth_utils import get_abi_output_types
+from web3 import AsyncHTTPProvider, AsyncWeb3, Web3
+from web3.exceptions import ContractLogicError
 
 logger = logging.getLogger(__name__)
 
@@ -14,62 +16,112 @@ from ..core.contracts import (
     CSACCOUNTING_ABI,
     CSFEEDISTRIBUTOR_ABI,
     CSMODULE_ABI,
+    MULTICALL3_ABI,
     STETH_ABI,
     WITHDRAWAL_QUEUE_ABI,
+    checksum_address,
 )
-from ..core.types import BondSummary, NodeOperator
+from ..core.types import WEI_PER_ETH, BondSummary, NodeOperator, OperatorBundle
 from .cache import cached
 from .etherscan import EtherscanProvider
 from .known_cids import KNOWN_DISTRIBUTION_LOGS
 
 
+# CSM was deployed around block 20873000 (Dec 2024)
+CSM_DEPLOY_BLOCK = 20873000
+
+# CSModule events carrying operator addresses as indexed topics:
+# topic1 = nodeOperatorId, topic2 = manager / old address, topic3 = reward / new address
+_NODE_OPERATOR_ADDED_TOPICS = [
+    Web3.keccak(text="NodeOperatorAdded(uint256,address,address)").to_0x_hex(),
+    Web3.keccak(text="NodeOperatorAdded(uint256,address,address,bool)").to_0x_hex(),
+]
+_ADDRESS_CHANGED_TOPICS = [
+    Web3.keccak(text="NodeOperatorManagerAddressChanged(uint256,address,address)").to_0x_hex(),
+    Web3.keccak(text="NodeOperatorRewardAddressChanged(uint256,address,address)").to_0x_hex(),
+]
+
+
+# Incremental DistributionLogUpdated scans: start_block -> (scanned_to, events).
+# Module-level because providers are created per request.
+_log_history_scans: dict[int, tuple[int, list[dict]]] = {}
+
+
+def _merge_log_events(entries: list[dict], new_events: list[dict]) -> list[dict]:
+    """Append newly scanned log events, skipping ones already present."""
+    seen = {(e["block"], e["logCid"]) for e in entries}
+    merged = entries + [e for e in new_events if (e["block"], e["logCid"]) not in seen]
+    return sorted(merged, key=lambda x: x["block"])
+
+
+@lru_cache
+def get_web3(rpc_url: str) -> AsyncWeb3:
+    """Get the process-wide AsyncWeb3 client for an RPC URL.
+
+    Providers are created per request; sharing one client per URL keeps a
+    single pooled keep-alive HTTP session instead of reconnecting each time.
+    """
+    return AsyncWeb3(AsyncHTTPProvider(rpc_url, request_kwargs={"timeout": 30}))
+
+
 class OnChainDataProvider:
     """Fetches data from Ethereum contracts."""
 
+    # Max calls per JSON-RPC batch (some providers reject or rate-count large batches)
+    BATCH_SIZE = 50
+    # Max batches in flight while scanning operators
+    BATCH_PIPELINE_DEPTH = 4
+    # Max concurrent single calls when the RPC does not support batching
+    FALLBACK_CONCURRENCY = 20
+    # getSigningKeys page size, and keys per Multicall3 eth_call (stays well
+    # below typical eth_call gas caps)
+    SIGNING_KEYS_PAGE = 100
+    SIGNING_KEYS_PER_MULTICALL = 1000
+
     def __init__(self, rpc_url: str | None = None):
         self.settings = get_settings()
-        self.w3 = Web3(
-            Web3.HTTPProvider(
-                rpc_url or self.settings.eth_rpc_url,
-                request_kwargs={"timeout": 30},
-            )
-        )
+        self.w3 = get_web3(rpc_url or self.settings.eth_rpc_url)
 
         # Initialize contracts
         self.csmodule = self.w3.eth.contract(
-            address=Web3.to_checksum_address(self.settings.csmodule_address),
+            address=checksum_address(self.settings.csmodule_address),
             abi=CSMODULE_ABI,
         )
         self.csaccounting = self.w3.eth.contract(
-            address=Web3.to_checksum_address(self.settings.csaccounting_address),
+            address=checksum_address(self.settings.csaccounting_address),
             abi=CSACCOUNTING_ABI,
         )
         self.csfeedistributor = self.w3.eth.contract(
-            address=Web3.to_checksum_address(self.settings.csfeedistributor_address),
+            address=checksum_address(self.settings.csfeedistributor_address),
             abi=CSFEEDISTRIBUTOR_ABI,
         )
         self.steth = self.w3.eth.contract(
-            address=Web3.to_checksum_address(self.settings.steth_address),
+            address=checksum_address(self.settings.steth_address),
             abi=STETH_ABI,
         )
         self.withdrawal_queue = self.w3.eth.contract(
-            address=Web3.to_checksum_address(self.settings.withdrawal_queue_address),
+            address=checksum_address(self.settings.withdrawal_queue_address),
             abi=WITHDRAWAL_QUEUE_ABI,
         )
+        self.multicall3 = self.w3.eth.contract(
+            address=checksum_address(self.settings.multicall3_address),
+            abi=MULTICALL3_ABI,
+        )
 
     @cached(ttl=60)
     async def get_node_operators_count(self) -> int:
         """Get total number of node operators."""
-        return await asyncio.to_thread(
-            self.csmodule.functions.getNodeOperatorsCount().call
-        )
+        return await self.csmodule.functions.getNodeOperatorsCount().call()
 
     @cached(ttl=300)
     async def get_node_operator(self, operator_id: int) -> NodeOperator:
         """Get node operator data by ID."""
-        data = await asyncio.to_thread(
-            self.csmodule.functions.getNodeOperator(operator_id).call
-        )
+        data = await self.csmodule.functions.getNodeOperator(operator_id).call()
+        return self._parse_node_operator(operator_id, data)
+
+    @staticmethod
+    def _parse_node_operator(operator_id: int, data: tuple) -> NodeOperator:
+        """Build a NodeOperator from the getNodeOperator struct."""
         return NodeOperator(
             node_operator_id=operator_id,
             total_added_keys=data[0],
@@ -89,59 +141,242 @@ class OnChainDataProvider:
             extended_manager_permissions=data[14],
         )
 
+    @cached(ttl=60)
+    async def get_operator_bundle(self, operator_id: int) -> OperatorBundle:
+        """Get every on-chain value an operator lookup needs in one RPC.
+
+        getNodeOperator, getBondSummary, distributedShares, getBondCurveId and
+        the stETH share totals are aggregated through Multicall3, so they are
+        read at the same block. Raises ContractLogicError if the operator does
+        not exist. A failing getBondCurveId falls back to curve 0, like
+        get_bond_curve_id.
+        """
+        results = await self._aggregate(
+            [
+                (self.csmodule, "getNodeOperator", [operator_id]),
+                (self.csaccounting, "getBondSummary", [operator_id]),
+                (self.csfeedistributor, "distributedShares", [operator_id]),
+                (self.csaccounting, "getBondCurveId", [operator_id]),
+                (self.steth, "getTotalPooledEther", []),
+                (self.steth, "getTotalShares", []),
+            ],
+            allow_failure=True,
+        )
+        operator_result, bond_result, distributed_result, curve_result, pooled_result, shares_result = results
+        for name, result in (
+            ("getNodeOperator", operator_result),
+            ("getBondSummary", bond_result),
+            ("distributedShares", distributed_result),
+        ):
+            if result is None:
+                raise ContractLogicError(f"{name} reverted for operator {operator_id}")
+        if pooled_result is None or shares_result is None:
+            # Not an operator problem; let callers fall back to single calls
+            raise ValueError("stETH share totals reverted in multicall")
+
+        current, required = bond_result
+        return OperatorBundle(
+            operator=self._parse_aggregated_operator(operator_id, operator_result[0]),
+            bond=self._parse_bond_summary(current, required),
+            distributed_shares=distributed_result[0],
+            curve_id=curve_result[0] if curve_result is not None else 0,
+            total_pooled_ether=pooled_result[0],
+            total_shares=shares_result[0],
+        )
+
+    async def get_operator_with_first_key(
+        self, operator_id: int
+    ) -> tuple[NodeOperator, str | None]:
+        """Get operator data and its first signing key in one RPC.
+
+        Returns (operator, pubkey); pubkey is None if the operator has no keys.
+        Raises ContractLogicError if the operator does not exist.
+        """
+        operator_result, keys_result = await self._aggregate(
+            [
+                (self.csmodule, "getNodeOperator", [operator_id]),
+                (self.csmodule, "getSigningKeys", [operator_id, 0, 1]),
+            ],
+            allow_failure=True,
+        )
+        if operator_result is None:
+            raise ContractLogicError(f"getNodeOperator({operator_id},) reverted")
+        operator = self._parse_aggregated_operator(operator_id, operator_result[0])
+        keys = self._split_keys(keys_result[0]) if keys_result is not None else []
+        return operator, keys[0] if keys else None
+
+    def _parse_aggregated_operator(self, operator_id: int, operator_data: tuple) -> NodeOperator:
+        """Parse getNodeOperator output decoded from a multicall."""
+        # Raw ABI decoding returns lowercase addresses; match .call() output
+        operator_data = tuple(
+            Web3.to_checksum_address(v) if i in (10, 11, 12, 13) else v
+            for i, v in enumerate(operator_data)
+        )
+        return self._parse_node_operator(operator_id, operator_data)
+
+    async def _aggregate(
+        self, calls: list[tuple], allow_failure: bool = False
+    ) -> list[tuple | None]:
+        """Execute view calls in a single eth_call through Multicall3.
+
+        Args:
+            calls: List of (contract, function name, args) tuples
+            allow_failure: Return None for reverted calls instead of raising
+
+        Returns:
+            Decoded return values, one tuple per call.
+            Raises ContractLogicError if any call reverts (unless allow_failure).
+        """
+        encoded = [
+            (contract.address, True, contract.encode_abi(fn_name, args=args))
+            for contract, fn_name, args in calls
+        ]
+        results = await self.multicall3.functions.aggregate3(encoded).call()
+
+        decoded = []
+        for (contract, fn_name, args), (success, return_data) in zip(calls, results):
+            if not success:
+                if allow_failure:
+                    decoded.append(None)
+                    continue
+                raise ContractLogicError(f"{fn_name}{tuple(args)} reverted")
+            output_types = get_abi_output_types(contract.get_function_by_name(fn_name).abi)
+            decoded.append(self.w3.codec.decode(output_types, return_data))
+        return decoded
+
+    async def _batch_call(self, calls: list) -> list:
+        """Execute contract function calls as JSON-RPC batch requests.
+
+        Calls are chunked into batches of BATCH_SIZE, each sent as a single
+        HTTP request. Raises if the RPC does not support batching.
+        """
+        results = []
+        for start in range(0, len(calls), self.BATCH_SIZE):
+            async with self.w3.batch_requests() as batch:
+                for call in calls[start : start + self.BATCH_SIZE]:
+                    batch.add(call)
+                results.extend(await batch.async_execute())
+        return results
+
+    async def _find_operator_by_events(self, target: str) -> int | None:
+        """Find an operator that currently uses target via address event logs.
+
+        Candidates come from NodeOperatorAdded / address change events with
+        target in an indexed address topic, and are verified against the
+        current on-chain state. Returns None if no operator uses target.
+        Raises if the RPC rejects the log query or a candidate can't be
+        verified, so the caller can fall back to a full scan.
+        """
+        topic = "0x" + "0" * 24 + target[2:]
+        base = {
+            "address": self.csmodule.address,
+            "fromBlock": CSM_DEPLOY_BLOCK,
+            "toBlock": "latest",
+        }
+        logs = await asyncio.gather(
+            # Added with target as manager
+            self.w3.eth.get_logs({**base, "topics": [_NODE_OPERATOR_ADDED_TOPICS, None, topic]}),
+            # Added with target as reward, or changed to target
+            self.w3.eth.get_logs(
+                {**base, "topics": [_NODE_OPERATOR_ADDED_TOPICS + _ADDRESS_CHANGED_TOPICS, None, None, topic]}
+            ),
+        )
+
+        candidates = sorted({int.from_bytes(log["topics"][1], "big") for batch in logs for log in batch})
+        for op_id in candidates:
+            data = await self.csmodule.functions.getNodeOperator(op_id).call()
+            if data[10].lower() == target or data[12].lower() == target:
+                return op_id
+        return None
+
     async def find_operator_by_address(self, address: str) -> int | None:
         """
         Find operator ID by manager or reward address.
 
-        Tries batch requests first (faster if RPC supports JSON-RPC batching).
-        Falls back to sequential calls with rate limiting if batch fails.
+        Looks up candidate operators from CSModule address events. Only if the
+        RPC rejects that lookup does it scan all operators with batch requests
+        (faster if RPC supports JSON-RPC batching), falling back to concurrent
+        single calls (bounded) if batch fails.
         """
-        address = Web3.to_checksum_address(address)
-        total = await self.get_node_operators_count()
+        # Validate once, then compare lowercase strings in the scan loops
+        target = Web3.to_checksum_address(address).lower()
 
-        # Try batch requests first (not all RPCs support this)
-        batch_size = 50
-        batch_supported = True
+        try:
+            return await self._find_operator_by_events(target)
+        except Exception as e:
+            logger.debug(f"Address event lookup failed, scanning operators: {e}")
 
-        for start in range(0, total, batch_size):
-            end = min(start + batch_size, total)
+        total = await self.get_node_operators_count()
 
-            if batch_supported:
-                try:
-                    def run_batch():
-                        with self.w3.batch_requests() as batch:
-                            for op_id in range(start, end):
-                                batch.add(self.csmodule.functions.getNodeOperator(op_id))
-                            return batch.execute()
-
-                    results = await asyncio.to_thread(run_batch)
-
-                    for i, data in enumerate(results):
-                        op_id = start + i
-                        manager = data[10]
-                        reward = data[12]
-                        if manager.lower() == address.lower() or reward.lower() == address.lower():
-                            return op_id
-                    continue  # Batch succeeded, move to next batch
-                except Exception:
-                    # Batch not supported by this RPC, fall back to sequential
-                    batch_supported = False
+        # Batch requests (not all RPCs support this), with up to
+        # BATCH_PIPELINE_DEPTH batches in flight so round trips overlap
+        batch_size = self.BATCH_SIZE
+        pipeline = asyncio.Semaphore(self.BATCH_PIPELINE_DEPTH)
+        batch_found = asyncio.Event()
+
+        async def scan_batch(start: int) -> int | None:
+            async with pipeline:
+                if batch_found.is_set():
+                    return None
+                end = min(start + batch_size, total)
+                results = await self._batch_call(
+                    [self.csmodule.functions.getNodeOperator(op_id) for op_id in range(start, end)]
+                )
+            for i, data in enumerate(results):
+                if data[10].lower() == target or data[12].lower() == target:
+                    batch_found.set()
+                    return start + i
+            return None
 
-            # Sequential fallback with rate limiting
-            for op_id in range(start, end):
+        remaining: list[int] = []
+        try:
+            # First batch alone: cheaply detects whether batching is supported
+            match = await scan_batch(0) if total else None
+        except Exception:
+            # Batch not supported by this RPC, fall back to single calls
+            remaining = list(range(total))
+        else:
+            if match is not None:
+                return match
+            starts = range(batch_size, total, batch_size)
+            outcomes = await asyncio.gather(
+                *(scan_batch(start) for start in starts), return_exceptions=True
+            )
+            for start, outcome in zip(starts, outcomes):
+                if isinstance(outcome, BaseException):
+                    # Retry operators from failed batches with single calls
+                    remaining.extend(range(start, min(start + batch_size, total)))
+                elif outcome is not None:
+                    return outcome
+
+        if not remaining:
+            return None
+
+        # Fallback: single calls for the remaining operators, run concurrently
+        # (bounded by a semaphore) and stopping new calls once a match is found
+        semaphore = asyncio.Semaphore(self.FALLBACK_CONCURRENCY)
+        found = asyncio.Event()
+
+        async def probe(op_id: int) -> int | None:
+            async with semaphore:
+                if found.is_set():
+                    return None
                 try:
-                    data = await asyncio.to_thread(
-                        self.csmodule.functions.getNodeOperator(op_id).call
-                    )
-                    manager = data[10]
-                    reward = data[12]
-                    if manager.lower() == address.lower() or reward.lower() == address.lower():
-                        return op_id
-                    # Small delay to avoid rate limiting on public RPCs
-                    await asyncio.sleep(0.05)
+                    data = await self.csmodule.functions.getNodeOperator(op_id).call()
                 except Exception:
-                    await asyncio.sleep(0.1)  # Longer delay on error
-                    continue
+                    await asyncio.sleep(0.1)  # Back off on error (likely rate limited)
+                    return None
+            manager = data[10]
+            reward = data[12]
+            if manager.lower() == target or reward.lower() == target:
+                found.set()
+                return op_id
+            return None
+
+        matches = await asyncio.gather(*(probe(op_id) for op_id in remaining))
+        for op_id in matches:
+            if op_id is not None:
+                return op_id
 
         return None
 
@@ -154,9 +389,7 @@ class OnChainDataProvider:
             1 = ICS/Legacy EA (1.5 ETH first validator, 1.3 ETH subsequent)
         """
         try:
-            return await asyncio.to_thread(
-                self.csaccounting.functions.getBondCurveId(operator_id).call
-            )
+            return await self.csaccounting.functions.getBondCurveId(operator_id).call()
         except Exception:
             # Fall back to 0 (Permissionless) if call fails
             return 0
@@ -229,12 +462,14 @@ class OnChainDataProvider:
     @cached(ttl=60)
     async def get_bond_summary(self, operator_id: int) -> BondSummary:
         """Get bond summary for an operator."""
-        current, required = await asyncio.to_thread(
-            self.csaccounting.functions.getBondSummary(operator_id).call
-        )
+        current, required = await self.csaccounting.functions.getBondSummary(operator_id).call()
+        return self._parse_bond_summary(current, required)
 
-        current_eth = Decimal(current) / Decimal(10**18)
-        required_eth = Decimal(required) / Decimal(10**18)
+    @staticmethod
+    def _parse_bond_summary(current: int, required: int) -> BondSummary:
+        """Build a BondSummary from getBondSummary's (current, required) wei values."""
+        current_eth = Decimal(current) / WEI_PER_ETH
+        required_eth = Decimal(required) / WEI_PER_ETH
         excess_eth = max(Decimal(0), current_eth - required_eth)
 
         return BondSummary(
@@ -248,51 +483,103 @@ class OnChainDataProvider:
     @cached(ttl=60)
     async def get_distributed_shares(self, operator_id: int) -> int:
         """Get already distributed (claimed) shares for operator."""
-        return await asyncio.to_thread(
-            self.csfeedistributor.functions.distributedShares(operator_id).call
-        )
+        return await self.csfeedistributor.functions.distributedShares(operator_id).call()
 
-    @cached(ttl=60)
     async def shares_to_eth(self, shares: int) -> Decimal:
-        """Convert stETH shares to ETH value."""
+        """Convert stETH shares to ETH value.
+
+        Uses the cached pool totals with the contract's own integer math, so
+        the result matches getPooledEthByShares without an RPC per amount.
+        """
         if shares == 0:
             return Decimal(0)
-        eth_wei = await asyncio.to_thread(
-            self.steth.functions.getPooledEthByShares(shares).call
+        total_pooled, total_shares = await self.get_share_totals()
+        eth_wei = shares * total_pooled // total_shares
+        return Decimal(eth_wei) / WEI_PER_ETH
+
+    async def get_shares_to_eth_rate(self) -> Decimal:
+        """Get the stETH share rate (totalPooledEther / totalShares).
+
+        ``shares * rate / 10**18`` converts shares to ETH without an RPC call
+        per conversion.
+        """
+        total_pooled, total_shares = await self.get_share_totals()
+        return Decimal(total_pooled) / Decimal(total_shares)
+
+    @cached(ttl=60)  # The totals only move on oracle reports
+    async def get_share_totals(self) -> tuple[int, int]:
+        """Get (totalPooledEther, totalShares) from the stETH contract.
+
+        Both values are read concurrently; concurrent callers share a single
+        fetch through @cached.
+        """
+        total_pooled, total_shares = await asyncio.gather(
+            self.steth.functions.getTotalPooledEther().call(),
+            self.steth.functions.getTotalShares().call(),
         )
-        return Decimal(eth_wei) / Decimal(10**18)
+        return total_pooled, total_shares
 
     async def get_signing_keys(
         self, operator_id: int, start: int = 0, count: int = 100
     ) -> list[str]:
         """Get validator pubkeys for an operator.
 
-        Fetches in batches of 100 to avoid RPC limits on large operators.
+        Fetches in pages of 100 keys to avoid RPC limits on large operators.
+        Pages are aggregated through Multicall3, falling back to one eth_call
+        per page if Multicall3 is unavailable.
         """
+        try:
+            return await self.get_signing_keys_multicall(operator_id, start, count)
+        except Exception as e:
+            logger.debug(f"Multicall getSigningKeys failed for operator {operator_id}: {e}")
+
         keys = []
-        batch_size = 100
-
-        for batch_start in range(start, start + count, batch_size):
-            batch_count = min(batch_size, start + count - batch_start)
-            keys_bytes = await asyncio.to_thread(
-                self.csmodule.functions.getSigningKeys(
-                    operator_id, batch_start, batch_count
-                ).call
-            )
-            # Each key is 48 bytes
-            for i in range(0, len(keys_bytes), 48):
-                key = "0x" + keys_bytes[i : i + 48].hex()
-                keys.append(key)
+        for batch_start in range(start, start + count, self.SIGNING_KEYS_PAGE):
+            batch_count = min(self.SIGNING_KEYS_PAGE, start + count - batch_start)
+            keys_bytes = await self.csmodule.functions.getSigningKeys(
+                operator_id, batch_start, batch_count
+            ).call()
+            keys.extend(self._split_keys(keys_bytes))
 
         return keys
 
+    async def get_signing_keys_multicall(
+        self, operator_id: int, start: int = 0, count: int = 100
+    ) -> list[str]:
+        """Get validator pubkeys with every page aggregated through Multicall3.
+
+        Up to SIGNING_KEYS_PER_MULTICALL keys go in one eth_call; larger
+        operators are split into several aggregate3 calls sent concurrently.
+        """
+        end = start + count
+        pages = [
+            (self.csmodule, "getSigningKeys", [operator_id, page_start, min(self.SIGNING_KEYS_PAGE, end - page_start)])
+            for page_start in range(start, end, self.SIGNING_KEYS_PAGE)
+        ]
+        pages_per_call = self.SIGNING_KEYS_PER_MULTICALL // self.SIGNING_KEYS_PAGE
+        results = await asyncio.gather(*(
+            self._aggregate(pages[i : i + pages_per_call])
+            for i in range(0, len(pages), pages_per_call)
+        ))
+
+        keys = []
+        for decoded in results:
+            for (keys_bytes,) in decoded:
+                keys.extend(self._split_keys(keys_bytes))
+        return keys
+
+    @staticmethod
+    def _split_keys(keys_bytes: bytes) -> list[str]:
+        """Split concatenated 48-byte pubkeys into 0x-prefixed hex strings."""
+        # Hex-encode once (96 hex chars per key), then slice
+        keys_hex = keys_bytes.hex()
+        return ["0x" + keys_hex[i : i + 96] for i in range(0, len(keys_hex), 96)]
+
     async def get_current_log_cid(self) -> str:
         """Get the current distribution log CID from the contract."""
-        return await asyncio.to_thread(
-            self.csfeedistributor.functions.logCid().call
-        )
+        return await self.csfeedistributor.functions.logCid().call()
 
-    @cached(ttl=3600)  # Cache for 1 hour since historical events don't change
+    @cached(ttl=300)  # Short TTL: refreshes are incremental (see below)
     async def get_distribution_log_history(
         self, start_block: int | None = None
     ) -> list[dict]:
@@ -305,29 +592,42 @@ class OnChainDataProvider:
         3. Hardcoded known CIDs - fallback for users without API keys
         4. Current logCid from contract - ultimate fallback
 
+        Results from methods 1-2 are kept per start_block together with the
+        block they were scanned up to. Later calls return them as-is while the
+        chain tip hasn't moved, and otherwise only scan the new blocks.
+
         Args:
             start_block: Starting block number (default: CSM deployment ~20873000)
 
         Returns:
             List of {block, logCid} dicts, sorted by block number (oldest first)
         """
-        # CSM was deployed around block 20873000 (Dec 2024)
         if start_block is None:
-            start_block = 20873000
+            start_block = CSM_DEPLOY_BLOCK
 
-        # 1. Try Etherscan API first (most reliable)
-        etherscan = EtherscanProvider()
-        if etherscan.is_available():
-            events = await etherscan.get_distribution_log_events(
-                self.settings.csfeedistributor_address,
-                start_block,
-            )
-            if events:
-                return events
-
-        # 2. Try chunked RPC queries
-        events = await self._query_events_chunked(start_block)
+        try:
+            tip = await self.w3.eth.block_number
+        except Exception as e:
+            logger.debug(f"Failed to get block number for log history: {e}")
+            tip = None
+
+        scanned = _log_history_scans.get(start_block)
+        if scanned is not None and tip is not None:
+            scanned_to, entries = scanned
+            if tip <= scanned_to:
+                return entries
+            new_events = await self._fetch_distribution_log_events(scanned_to + 1, tip)
+            if new_events is None:
+                # Keep the (possibly stale) history rather than a partial one
+                return entries
+            entries = _merge_log_events(entries, new_events)
+            _log_history_scans[start_block] = (tip, entries)
+            return entries
+
+        events = await self._fetch_distribution_log_events(start_block, tip)
         if events:
+            if tip is not None:
+                _log_history_scans[start_block] = (tip, events)
             return events
 
         # 3. Use known historical CIDs as fallback
@@ -338,31 +638,53 @@ class OnChainDataProvider:
         try:
             current_cid = await self.get_current_log_cid()
             if current_cid:
-                current_block = await asyncio.to_thread(
-                    lambda: self.w3.eth.block_number
-                )
+                current_block = tip if tip is not None else await self.w3.eth.block_number
                 return [{"block": current_block, "logCid": current_cid}]
         except Exception as e:
             logger.debug(f"Failed to get current log CID as fallback: {e}")
 
         return []
 
+    async def _fetch_distribution_log_events(
+        self, from_block: int, to_block: int | None
+    ) -> list[dict] | None:
+        """Fetch DistributionLogUpdated events via Etherscan, then chunked RPC.
+
+        Returns None if no method succeeded, so callers can tell a failed scan
+        apart from a block range with no events.
+        """
+        # 1. Try Etherscan API first (most reliable)
+        etherscan = EtherscanProvider()
+        if etherscan.is_available():
+            events = await etherscan.get_distribution_log_events(
+                self.settings.csfeedistributor_address,
+                from_block,
+                to_block if to_block is not None else "latest",
+            )
+            if events:
+                return events
+
+        # 2. Try chunked RPC queries
+        return await self._query_events_chunked(from_block, to_block)
+
     async def _query_events_chunked(
-        self, start_block: int, chunk_size: int = 10000
-    ) -> list[dict]:
-        """Query events in smaller chunks to work around RPC limitations."""
-        current_block = await asyncio.to_thread(lambda: self.w3.eth.block_number)
+        self, start_block: int, end_block: int | None = None, chunk_size: int = 10000
+    ) -> list[dict] | None:
+        """Query events in smaller chunks to work around RPC limitations.
+
+        Returns None if any chunk fails.
+        """
+        current_block = (
+            end_block if end_block is not None else await self.w3.eth.block_number
+        )
         all_events = []
 
-        for from_block in range(start_block, current_block, chunk_size):
+        for from_block in range(start_block, current_block + 1, chunk_size):
             to_block = min(from_block + chunk_size - 1, current_block)
             try:
-                events = await asyncio.to_thread(
-                    partial(
-                        self.csfeedistributor.events.DistributionLogUpdated.get_logs,
-                        from_block=from_block,
-                        to_block=to_block,
-                    )
+                events = await self.csfeedistributor.events.DistributionLogUpdated.get_logs(
+                    from_block=from_block,
+                    to_block=to_block,
                 )
                 for e in events:
                     all_events.append(
@@ -370,7 +692,7 @@ class OnChainDataProvider:
                     )
             except Exception:
                 # If chunked queries fail, give up on this method
-                return []
+                return None
 
         return sorted(all_events, key=lambda x: x["block"])
 
@@ -480,7 +802,7 @@ class OnChainDataProvider:
         chunk_size: int = 10000,
     ) -> list[dict]:
         """Query WithdrawalRequested events in chunks via RPC."""
-        current_block = await asyncio.to_thread(lambda: self.w3.eth.block_number)
+        current_block = await self.w3.eth.block_number
         all_events = []
 
         requestor = Web3.to_checksum_address(requestor)
@@ -489,16 +811,13 @@ class OnChainDataProvider:
         for from_blk in range(start_block, current_block, chunk_size):
             to_blk = min(from_blk + chunk_size - 1, current_block)
             try:
-                events = await asyncio.to_thread(
-                    partial(
-                        self.withdrawal_queue.events.WithdrawalRequested.get_logs,
-                        from_block=from_blk,
-                        to_block=to_blk,
-                        argument_filters={
-                            "requestor": requestor,
-                            "owner": owner,
-                        },
-                    )
+                events = await self.withdrawal_queue.events.WithdrawalRequested.get_logs(
+                    from_block=from_blk,
+                    to_block=to_blk,
+                    argument_filters={
+                        "requestor": requestor,
+                        "owner": owner,
+                    },
                 )
                 for e in events:
                     all_events.append(
@@ -528,9 +847,7 @@ class OnChainDataProvider:
         # Get status for all request IDs
         request_ids = [e["request_id"] for e in events]
         try:
-            statuses = await asyncio.to_thread(
-                self.withdrawal_queue.functions.getWithdrawalStatus(request_ids).call
-            )
+            statuses = await self.withdrawal_queue.functions.getWithdrawalStatus(request_ids).call()
         except Exception:
             # If status query fails, set all as unknown
             statuses = [None] * len(events)
@@ -543,9 +860,7 @@ class OnChainDataProvider:
         for i, event in enumerate(events):
             try:
                 # Get block timestamp
-                block = await asyncio.to_thread(
-                    partial(self.w3.eth.get_block, event["block"])
-                )
+                block = await self.w3.eth.get_block(event["block"])
                 timestamp = datetime.fromtimestamp(
                     block["timestamp"], tz=timezone.utc
                 ).isoformat()
@@ -584,9 +899,7 @@ class OnChainDataProvider:
                     enriched_event["claim_tx_hash"] = claim["tx_hash"]
                     # Get claim timestamp
                     try:
-                        claim_block = await asyncio.to_thread(
-                            partial(self.w3.eth.get_block, claim["block"])
-                        )
+                        claim_block = await self.w3.eth.get_block(claim["block"])
                         enriched_event["claim_timestamp"] = datetime.fromtimestamp(
                             claim_block["timestamp"], tz=timezone.utc
                         ).isoformat()
@@ -618,19 +931,16 @@ class OnChainDataProvider:
                 return events
 
         # RPC fallback - query in chunks
-        current_block = await asyncio.to_thread(lambda: self.w3.eth.block_number)
+        current_block = await self.w3.eth.block_number
         all_events = []
 
         for from_blk in range(start_block, current_block, 10000):
             to_blk = min(from_blk + 9999, current_block)
             try:
-                logs = await asyncio.to_thread(
-                    partial(
-                        self.withdrawal_queue.events.WithdrawalClaimed.get_logs,
-                        from_block=from_blk,
-                        to_block=to_blk,
-                        argument_filters={"receiver": receiver},
-                    )
+                logs = await self.withdrawal_queue.events.WithdrawalClaimed.get_logs(
+                    from_block=from_blk,
+                    to_block=to_blk,
+                    argument_filters={"receiver": receiver},
                 )
                 for e in logs:
                     all_events.append(
@@ -654,7 +964,7 @@ class OnChainDataProvider:
         chunk_size: int = 10000,
     ) -> list[dict]:
         """Query Transfer events in smaller chunks."""
-        current_block = await asyncio.to_thread(lambda: self.w3.eth.block_number)
+        current_block = await self.w3.eth.block_number
         all_events = []
 
         from_address = Web3.to_checksum_address(from_address)
@@ -663,16 +973,13 @@ class OnChainDataProvider:
         for from_blk in range(start_block, current_block, chunk_size):
             to_blk = min(from_blk + chunk_size - 1, current_block)
             try:
-                events = await asyncio.to_thread(
-                    partial(
-                        self.steth.events.Transfer.get_logs,
-                        from_block=from_blk,
-                        to_block=to_blk,
-                        argument_filters={
-                            "from": from_address,
-                            "to": to_address,
-                        },
-                    )
+                events = await self.steth.events.Transfer.get_logs(
+                    from_block=from_blk,
+                    to_block=to_blk,
+                    argument_filters={
+                        "from": from_address,
+                        "to": to_address,
+                    },
                 )
                 for e in events:
                     all_events.append(
@@ -696,9 +1003,7 @@ class OnChainDataProvider:
         for event in events:
             try:
                 # Get block timestamp
-                block = await asyncio.to_thread(
-                    partial(self.w3.eth.get_block, event["block"])
-                )
+                block = await self.w3.eth.get_block(event["block"])
                 timestamp = datetime.fromtimestamp(
                     block["timestamp"], tz=timezone.utc
                 ).isoformat()
@@ -1,15 +1,18 @@
 """Price fetching from CoinGecko API."""
 
+import asyncio
 import logging
 import time
 
-import httpx
+from .http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
-# Cache ETH price for 5 minutes
+# Cache ETH price for 5 minutes (timestamp is time.monotonic())
 _price_cache: dict = {"eth_usd": None, "timestamp": 0}
 CACHE_TTL = 300  # 5 minutes
+# Upstream fetch shared by concurrent cache misses (e.g. several tabs loading)
+_inflight_fetch: asyncio.Future | None = None
 
 
 async def get_eth_price() -> float | None:
@@ -18,27 +21,37 @@ async def get_eth_price() -> float | None:
     Returns:
         ETH price in USD, or None if fetch fails
     """
-    global _price_cache
+    global _inflight_fetch
 
     # Check cache
-    now = time.time()
+    now = time.monotonic()
     if _price_cache["eth_usd"] is not None and (now - _price_cache["timestamp"]) < CACHE_TTL:
         return _price_cache["eth_usd"]
 
+    task = _inflight_fetch
+    if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+        task = _inflight_fetch = asyncio.ensure_future(_fetch_eth_price(now))
+    # Shield so one cancelled caller doesn't cancel the fetch for the others
+    return await asyncio.shield(task)
+
+
+async def _fetch_eth_price(now: float) -> float | None:
+    """Fetch the price from CoinGecko, falling back to the last cached value."""
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                "https://api.coingecko.com/api/v3/simple/price",
-                params={"ids": "ethereum", "vs_currencies": "usd"},
-            )
-            if response.status_code == 200:
-                data = response.json()
-                price = data.get("ethereum", {}).get("usd")
-                if price:
-                    _price_cache["eth_usd"] = float(price)
-                    _price_cache["timestamp"] = now
-                    logger.info(f"Fetched ETH price: ${price}")
-                    return float(price)
+        client = get_http_client()
+        response = await client.get(
+            "https://api.coingecko.com/api/v3/simple/price",
+            params={"ids": "ethereum", "vs_currencies": "usd"},
+            timeout=10.0,
+        )
+        if response.status_code == 200:
+            data = response.json()
+            price = data.get("ethereum", {}).get("usd")
+            if price:
+                _price_cache["eth_usd"] = float(price)
+                _price_cache["timestamp"] = now
+                logger.info(f"Fetched ETH price: ${price}")
+                return float(price)
     except Exception as e:
         logger.warning(f"Failed to fetch ETH price: {e}")
 
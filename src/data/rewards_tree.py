@@ -1,22 +1,168 @@
 """Fetch and parse the rewards merkle tree from GitHub."""
 
-import json
+import asyncio
+import gzip
 import logging
+import os
+import tempfile
+import zlib
+from pathlib import Path
 
 import httpx
 
+from ..core import jsonutil
 from ..core.config import get_settings
 from ..core.types import RewardsInfo
 from .cache import cached
+from .http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
+OPERATOR_KEY_PREFIX = "CSM Operator "
+_PREFIX_LEN = len(OPERATOR_KEY_PREFIX)
+
+# Parsed {operator_id: RewardsInfo} index, shared by all providers and
+# rebuilt only when fetch_rewards_data() hands back a different tree
+_index_source: dict | None = None
+_index: dict[int, RewardsInfo] = {}
+_sorted_ids: list[int] = []
+
+
+def _build_index(data: dict) -> None:
+    """Index the proofs.json entries by integer operator ID."""
+    global _index_source, _index, _sorted_ids
+    index = {}
+    for key, entry in data.items():
+        if not key.startswith(OPERATOR_KEY_PREFIX):
+            continue
+        try:
+            op_id = int(key[_PREFIX_LEN:])
+        except ValueError:
+            continue
+        index[op_id] = RewardsInfo(
+            cumulative_fee_shares=entry["cumulativeFeeShares"],
+            proof=entry["proof"],
+        )
+    _index = index
+    _sorted_ids = sorted(index)
+    _index_source = data
+
 
 class RewardsTreeProvider:
     """Fetches rewards data from the csm-rewards repository."""
 
-    def __init__(self):
+    def __init__(self, cache_dir: Path | None = None):
         self.settings = get_settings()
+        # Last downloaded proofs.json (gzipped) and its ETag, reused across restarts
+        self.cache_dir = cache_dir or Path.home() / ".cache" / "csm-dashboard" / "rewards"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._body_path = self.cache_dir / "proofs.json.gz"
+        self._etag_path = self.cache_dir / "proofs.etag"
+
+    def _make_temp(self, suffix: str) -> Path:
+        """Create a uniquely named temp file in the cache dir.
+
+        Each download gets its own file, so concurrent workers sharing the
+        cache dir never write into the same temp file.
+        """
+        fd, name = tempfile.mkstemp(dir=self.cache_dir, prefix="proofs.", suffix=suffix)
+        os.close(fd)
+        return Path(name)
+
+    def _load_cached_body(self) -> bytes | None:
+        """Load the last downloaded proofs.json body from disk."""
+        try:
+            return gzip.decompress(self._body_path.read_bytes())
+        except (OSError, EOFError, gzip.BadGzipFile, zlib.error):
+            return None
+
+    async def _load_cached_data(self) -> dict | None:
+        """Load and parse the cached proofs.json, or None if missing or corrupt."""
+        body = await asyncio.to_thread(self._load_cached_body)
+        if body is None:
+            return None
+        try:
+            return await asyncio.to_thread(jsonutil.loads, body)
+        except jsonutil.JSONDecodeError:
+            return None
+
+    def _discard_cache(self) -> None:
+        """Delete the cached body and its ETag so the next download is unconditional."""
+        for path in (self._body_path, self._etag_path):
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    def _load_cached_etag(self) -> str | None:
+        """Load the ETag of the cached body (only if the body itself exists)."""
+        if not self._body_path.exists():
+            return None
+        try:
+            return self._etag_path.read_text().strip() or None
+        except OSError:
+            return None
+
+    async def _download(
+        self, client: httpx.AsyncClient, headers: dict
+    ) -> tuple[bytearray, str | None, Path | None] | None:
+        """Stream proofs.json, gzipping chunks into a temp cache file as they arrive.
+
+        Returns (body, etag, temp path), or None if the server answered 304 Not
+        Modified. The temp file only replaces the cached copy once
+        _commit_cache() is called, i.e. after the body has parsed successfully;
+        otherwise the caller removes it with _discard_temp().
+        """
+        async with client.stream(
+            "GET", self.settings.rewards_proofs_url, headers=headers, timeout=30.0
+        ) as response:
+            if response.status_code == 304:
+                return None
+            response.raise_for_status()
+
+            body = bytearray()
+            try:
+                tmp_path = self._make_temp(".json.gz.tmp")
+                cache_file = gzip.open(tmp_path, "wb", compresslevel=6)
+            except OSError:
+                tmp_path = cache_file = None  # Cache write failure is non-fatal
+            try:
+                async for chunk in response.aiter_bytes():
+                    body += chunk
+                    if cache_file is not None:
+                        cache_file.write(chunk)
+            except BaseException:
+                if cache_file is not None:
+                    cache_file.close()
+                self._discard_temp(tmp_path)
+                raise
+            if cache_file is not None:
+                cache_file.close()
+            return body, response.headers.get("etag"), tmp_path
+
+    @staticmethod
+    def _discard_temp(tmp_path: Path | None) -> None:
+        """Remove a temp file left by a download that won't be committed."""
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+
+    def _commit_cache(self, tmp_path: Path | None, etag: str | None) -> None:
+        """Atomically promote the streamed body to the cache and store its ETag."""
+        if tmp_path is None:
+            return
+        tmp_etag = None
+        try:
+            os.replace(tmp_path, self._body_path)
+            if etag:
+                tmp_etag = self._make_temp(".etag.tmp")
+                tmp_etag.write_text(etag)
+                os.replace(tmp_etag, self._etag_path)
+            else:
+                self._etag_path.unlink(missing_ok=True)
+        except OSError:
+            # Cache write failure is non-fatal
+            self._discard_temp(tmp_path)
+            self._discard_temp(tmp_etag)
 
     @cached(ttl=3600)  # Cache for 1 hour since tree updates infrequently
     async def fetch_rewards_data(self) -> dict:
@@ -30,44 +176,57 @@ class RewardsTreeProvider:
             ...
         }
         """
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        etag = self._load_cached_etag()
+        headers = {"If-None-Match": etag} if etag else {}
+
+        client = get_http_client()
+        try:
+            result = await self._download(client, headers)
+            if result is None:
+                data = await self._load_cached_data()
+                if data is not None:
+                    logger.debug("Rewards tree not modified, using cached copy")
+                    return data
+                # Cached body vanished or is corrupt; drop it (and its ETag, so
+                # the server can't answer 304 again) and fetch unconditionally
+                logger.warning("Cached rewards tree unreadable, downloading a fresh copy")
+                self._discard_cache()
+                result = await self._download(client, {})
+            body, new_etag, tmp_path = result
             try:
-                response = await client.get(self.settings.rewards_proofs_url)
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                logger.warning(f"Failed to fetch rewards tree: HTTP {e.response.status_code}")
-                return {}
-            except httpx.RequestError as e:
-                logger.warning(f"Failed to fetch rewards tree: {e}")
-                return {}
-            except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse rewards tree JSON: {e}")
-                return {}
+                # Parsing the multi-MB tree is CPU-bound; keep it off the event loop
+                data = await asyncio.to_thread(jsonutil.loads, body)
+            except BaseException:
+                self._discard_temp(tmp_path)
+                raise
+            self._commit_cache(tmp_path, new_etag)
+            return data
+        except httpx.HTTPStatusError as e:
+            logger.warning(f"Failed to fetch rewards tree: HTTP {e.response.status_code}")
+        except httpx.RequestError as e:
+            logger.warning(f"Failed to fetch rewards tree: {e}")
+        except jsonutil.JSONDecodeError as e:
+            logger.warning(f"Failed to parse rewards tree JSON: {e}")
 
-    async def get_operator_rewards(self, operator_id: int) -> RewardsInfo | None:
-        """Get rewards info for a specific operator."""
-        data = await self.fetch_rewards_data()
-        key = f"CSM Operator {operator_id}"
+        # Network or parse failure: fall back to the last downloaded copy, if any
+        data = await self._load_cached_data()
+        if data is not None:
+            return data
+        return {}
 
-        if key not in data:
-            return None
+    async def _get_index(self) -> dict[int, RewardsInfo]:
+        """Get the operator ID index for the current rewards tree."""
+        data = await self.fetch_rewards_data()
+        if data is not _index_source:
+            await asyncio.to_thread(_build_index, data)
+        return _index
 
-        entry = data[key]
-        return RewardsInfo(
-            cumulative_fee_shares=entry["cumulativeFeeShares"],
-            proof=entry["proof"],
-        )
+    async def get_operator_rewards(self, operator_id: int) -> RewardsInfo | None:
+        """Get rewards info for a specific operator."""
+        index = await self._get_index()
+        return index.get(operator_id)
 
     async def get_all_operators_with_rewards(self) -> list[int]:
         """Get list of all operator IDs that have rewards."""
-        data = await self.fetch_rewards_data()
-        operator_ids = []
-        for key in data.keys():
-            if key.startswith("CSM Operator "):
-                try:
-                    op_id = int(key.replace("CSM Operator ", ""))
-                    operator_ids.append(op_id)
-                except ValueError:
-                    continue
-        return sorted(operator_ids)
+        await self._get_index()
+        return list(_sorted_ids)
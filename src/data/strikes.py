@@ -7,11 +7,11 @@ import time
 from dataclasses import dataclass
 from pathlib import Path
 
-import httpx
-from web3 import Web3
-
 from ..core.config import get_settings
+from ..core.contracts import checksum_address
 from .cache import cached
+from .http_client import get_http_client
+from .onchain import get_web3
 
 logger = logging.getLogger(__name__)
 
@@ -66,7 +66,7 @@ class StrikesProvider:
         self.settings = get_settings()
         # Use configurable gateways from settings (comma-separated)
         self.gateways = [g.strip() for g in self.settings.ipfs_gateways.split(",") if g.strip()]
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url or self.settings.eth_rpc_url))
+        self.w3 = get_web3(rpc_url or self.settings.eth_rpc_url)
         self.cache_dir = cache_dir or Path.home() / ".cache" / "csm-dashboard" / "strikes"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self._last_request_time = 0.0
@@ -74,7 +74,7 @@ class StrikesProvider:
 
         # Initialize CSStrikes contract
         self.csstrikes = self.w3.eth.contract(
-            address=Web3.to_checksum_address(self.settings.csstrikes_address),
+            address=checksum_address(self.settings.csstrikes_address),
             abi=self.CSSTRIKES_ABI,
         )
 
@@ -114,9 +114,7 @@ class StrikesProvider:
     @cached(ttl=300)  # Cache CID for 5 minutes
     async def get_tree_cid(self) -> str:
         """Get the current strikes tree CID from the contract."""
-        return await asyncio.to_thread(
-            self.csstrikes.functions.treeCid().call
-        )
+        return await self.csstrikes.functions.treeCid().call()
 
     async def _fetch_tree_from_ipfs(self, cid: str) -> dict | None:
         """Fetch tree data from IPFS gateways."""
@@ -129,23 +127,23 @@ class StrikesProvider:
         await self._rate_limit()
 
         # Try each gateway
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            for gateway in self.gateways:
-                try:
-                    url = f"{gateway}{cid}"
-                    response = await client.get(url)
-                    if response.status_code == 200:
-                        try:
-                            data = response.json()
-                        except json.JSONDecodeError as e:
-                            logger.warning(f"Failed to parse strikes tree JSON from {gateway}: {e}")
-                            continue
-                        # Cache the successful result
-                        self._save_to_cache(cid, data)
-                        return data
-                except Exception as e:
-                    logger.debug(f"IPFS gateway {gateway} failed for strikes CID {cid}: {e}")
-                    continue
+        client = get_http_client()
+        for gateway in self.gateways:
+            try:
+                url = f"{gateway}{cid}"
+                response = await client.get(url, timeout=30.0, follow_redirects=True)
+                if response.status_code == 200:
+                    try:
+                        data = response.json()
+                    except json.JSONDecodeError as e:
+                        logger.warning(f"Failed to parse strikes tree JSON from {gateway}: {e}")
+                        continue
+                    # Cache the successful result
+                    self._save_to_cache(cid, data)
+                    return data
+            except Exception as e:
+                logger.debug(f"IPFS gateway {gateway} failed for strikes CID {cid}: {e}")
+                continue
 
         logger.warning(f"All IPFS gateways failed for strikes CID {cid}")
         return None
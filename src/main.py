@@ -27,8 +27,13 @@ def serve(
     host: str = typer.Option("127.0.0.1", help="Host to bind to"),
     port: int = typer.Option(8080, help="Port to bind to"),
     reload: bool = typer.Option(False, "--reload", help="Enable auto-reload for development"),
+    workers: int = typer.Option(1, help="Number of worker processes (each keeps its own caches)"),
 ):
-    """Start the web dashboard server."""
+    """Start the web dashboard server.
+
+    Uvicorn picks uvloop and httptools automatically when they are installed
+    (the "speed" extra).
+    """
     import uvicorn
 
     from .web.app import create_app
@@ -36,13 +41,17 @@ def serve(
     logger = logging.getLogger(__name__)
     logger.info(f"Starting CSM Dashboard server on {host}:{port}")
 
-    web_app = create_app()
+    # Reload and multiple workers need an import string to re-create the app
+    use_factory = reload or workers > 1
     uvicorn.run(
-        web_app if not reload else "src.web.app:create_app",
+        "src.web.app:create_app" if use_factory else create_app(),
         host=host,
         port=port,
         reload=reload,
-        factory=reload,
+        workers=workers,
+        factory=use_factory,
+        loop="auto",
+        http="auto",
         log_level="info",
     )
 
@@ -1,16 +1,22 @@
 """Main service for computing operator rewards."""
 
+import asyncio
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 import logging
 from decimal import Decimal
 
 logger = logging.getLogger(__name__)
 
 from ..core.types import (
+    WEI_PER_ETH,
     APYMetrics,
     BondSummary,
     DistributionFrame,
     HealthStatus,
+    NodeOperator,
     OperatorRewards,
     StrikeSummary,
     WithdrawalEvent,
@@ -18,12 +24,10 @@ from ..core.types import (
 from ..data.beacon import (
     BeaconDataProvider,
     ValidatorInfo,
-    aggregate_validator_status,
-    calculate_avg_effectiveness,
-    count_at_risk_validators,
-    count_slashed_validators,
+    ValidatorSummary,
     epoch_to_datetime,
     get_earliest_activation,
+    summarize_validators,
 )
 from ..data.ipfs_logs import BEACON_GENESIS, IPFSLogProvider, epoch_to_datetime as epoch_to_dt
 from ..data.lido_api import LidoAPIProvider
@@ -32,6 +36,79 @@ from ..data.rewards_tree import RewardsTreeProvider
 from ..data.strikes import StrikesProvider
 
 
+# In-flight get_operator_by_id lookups, keyed by (web3 client, operator ID, flags)
+_inflight_lookups: dict[tuple, asyncio.Future] = {}
+
+# Operator ID -> first validator activation date. Deposited keys can't be
+# removed and activation epochs are final, so entries never go stale.
+_active_since_cache: dict[int, datetime] = {}
+
+
+@lru_cache(maxsize=4096)
+def _epoch_isoformat(epoch: int) -> str:
+    """ISO date string for a frame boundary epoch.
+
+    Adjacent frames share boundaries and past frames never change, so each
+    epoch is converted and formatted once.
+    """
+    return epoch_to_dt(epoch).isoformat()
+
+
+@lru_cache(maxsize=1024)
+def _frame_eths(frame_shares: tuple[int, ...], shares_rate: Decimal) -> tuple[float, ...]:
+    """Convert per-frame reward shares to ETH (as floats for the APY math).
+
+    Finalized frames never change and the share rate only moves on oracle
+    reports, so repeated loads of the same operator hit the cache.
+    """
+    eth_per_share = shares_rate / WEI_PER_ETH
+    return tuple(float(shares * eth_per_share) for shares in frame_shares)
+
+
+@dataclass
+class RequestCache:
+    """Memoizes values that are invariant within one logical request.
+
+    Each value is fetched at most once; concurrent callers await the same task.
+    """
+
+    onchain: OnChainDataProvider
+    _tasks: dict[str, asyncio.Future] = field(default_factory=dict)
+
+    def _memo(self, name: str, factory) -> asyncio.Future:
+        task = self._tasks.get(name)
+        if task is None:
+            task = self._tasks[name] = asyncio.ensure_future(factory())
+        return task
+
+    async def log_history(self) -> list[dict]:
+        """Distribution log history (see OnChainDataProvider.get_distribution_log_history)."""
+        return await self._memo("log_history", self.onchain.get_distribution_log_history)
+
+    async def shares_rate(self) -> Decimal:
+        """stETH share rate (see OnChainDataProvider.get_shares_to_eth_rate)."""
+        return await self._memo("shares_rate", self.onchain.get_shares_to_eth_rate)
+
+    async def operator(self, operator_id: int) -> NodeOperator:
+        """Node operator data (see OnChainDataProvider.get_node_operator)."""
+        return await self._memo(
+            f"operator:{operator_id}", lambda: self.onchain.get_node_operator(operator_id)
+        )
+
+    def _set(self, name: str, value) -> None:
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(value)
+        self._tasks[name] = future
+
+    def set_operator(self, operator: NodeOperator) -> None:
+        """Record operator data already fetched by another path (e.g. a multicall)."""
+        self._set(f"operator:{operator.node_operator_id}", operator)
+
+    def set_shares_rate(self, rate: Decimal) -> None:
+        """Record a share rate already fetched by another path (e.g. a multicall)."""
+        self._set("shares_rate", rate)
+
+
 class OperatorService:
     """Orchestrates data from multiple sources to compute final rewards."""
 
@@ -44,7 +121,12 @@ class OperatorService:
         self.strikes = StrikesProvider(rpc_url)
 
     async def get_operator_by_address(
-        self, address: str, include_validators: bool = False, include_history: bool = False, include_withdrawals: bool = False
+        self,
+        address: str,
+        include_validators: bool = False,
+        include_history: bool = False,
+        include_withdrawals: bool = False,
+        ctx: RequestCache | None = None,
     ) -> OperatorRewards | None:
         """
         Main entry point: get complete rewards data for an address.
@@ -55,49 +137,163 @@ class OperatorService:
         if operator_id is None:
             return None
 
-        return await self.get_operator_by_id(operator_id, include_validators, include_history, include_withdrawals)
+        return await self.get_operator_by_id(
+            operator_id, include_validators, include_history, include_withdrawals, ctx
+        )
 
     async def get_operator_by_id(
-        self, operator_id: int, include_validators: bool = False, include_history: bool = False, include_withdrawals: bool = False
+        self,
+        operator_id: int,
+        include_validators: bool = False,
+        include_history: bool = False,
+        include_withdrawals: bool = False,
+        ctx: RequestCache | None = None,
+    ) -> OperatorRewards | None:
+        """Get complete rewards data for an operator ID.
+
+        Concurrent identical lookups (same operator, flags and RPC) share one
+        in-flight computation instead of each repeating the full fan-out.
+        """
+        key = (self.onchain.w3, operator_id, include_validators, include_history, include_withdrawals)
+        task = _inflight_lookups.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(
+                self._get_operator_by_id(
+                    operator_id, include_validators, include_history, include_withdrawals, ctx
+                )
+            )
+            _inflight_lookups[key] = task
+
+            def on_done(done: asyncio.Future) -> None:
+                if _inflight_lookups.get(key) is done:
+                    del _inflight_lookups[key]
+                # Mark the exception retrieved even if every caller was cancelled
+                if not done.cancelled():
+                    done.exception()
+
+            task.add_done_callback(on_done)
+        # Shield so one cancelled caller doesn't cancel the lookup for the others
+        return await asyncio.shield(task)
+
+    async def _get_operator_by_id(
+        self,
+        operator_id: int,
+        include_validators: bool,
+        include_history: bool,
+        include_withdrawals: bool,
+        ctx: RequestCache | None,
     ) -> OperatorRewards | None:
-        """Get complete rewards data for an operator ID."""
+        """Uncoalesced implementation of get_operator_by_id."""
         from web3.exceptions import ContractLogicError
 
-        # Step 1: Get operator info
+        ctx = ctx or RequestCache(self.onchain)
+
+        # Step 1: Get operator info, bond summary, distributed (claimed) shares,
+        # bond curve and the stETH share rate in a single multicall
+        curve_id: int | None = None
         try:
-            operator = await self.onchain.get_node_operator(operator_id)
+            bundle = await self.onchain.get_operator_bundle(operator_id)
+            operator = bundle.operator
+            bond = bundle.bond
+            distributed = bundle.distributed_shares
+            curve_id = bundle.curve_id
+            ctx.set_shares_rate(Decimal(bundle.total_pooled_ether) / Decimal(bundle.total_shares))
         except ContractLogicError:
             # Operator ID doesn't exist on-chain
             return None
+        except Exception as e:
+            # Multicall unavailable on this RPC/chain, fall back to individual calls
+            logger.debug(f"Multicall failed for operator {operator_id}, using single calls: {e}")
+            operator, bond, distributed = await asyncio.gather(
+                self.onchain.get_node_operator(operator_id),
+                self.onchain.get_bond_summary(operator_id),
+                self.onchain.get_distributed_shares(operator_id),
+                return_exceptions=True,
+            )
+            if isinstance(operator, ContractLogicError):
+                return None
+            for result in (operator, bond, distributed):
+                if isinstance(result, BaseException):
+                    raise result
+        ctx.set_operator(operator)
 
-        # Step 2: Get bond curve and operator type
-        curve_id = await self.onchain.get_bond_curve_id(operator_id)
-        operator_type = self.onchain.get_operator_type_name(curve_id)
+        fetch_validators = include_validators and operator.total_deposited_keys > 0
 
-        # Step 3: Get bond summary
-        bond = await self.onchain.get_bond_summary(operator_id)
+        async def get_curve_id() -> int:
+            if curve_id is not None:
+                return curve_id
+            return await self.onchain.get_bond_curve_id(operator_id)
 
-        # Step 4: Get rewards from merkle tree
-        rewards_info = await self.rewards_tree.get_operator_rewards(operator_id)
+        async def apy_after_curve(curve_task: asyncio.Task) -> APYMetrics:
+            return await self.calculate_apy_metrics(
+                operator_id=operator_id,
+                bond_eth=bond.current_bond_eth,
+                curve_id=await curve_task,
+                include_history=include_history,
+                ctx=ctx,
+            )
+
+        async def health_after_validators(
+            curve_task: asyncio.Task, validators_task: asyncio.Task
+        ) -> HealthStatus:
+            validator_details, validator_summary = await validators_task
+            return await self.calculate_health_status(
+                operator_id=operator_id,
+                bond=bond,
+                stuck_validators_count=operator.stuck_validators_count,
+                validator_details=validator_details,
+                curve_id=await curve_task,
+                validator_summary=validator_summary,
+            )
 
-        # Step 5: Get already distributed (claimed) shares
-        distributed = await self.onchain.get_distributed_shares(operator_id)
+        # Every remaining fetch only depends on Step 1, so they run as one task
+        # group: latency is the slowest path rather than the sum, and a failure
+        # cancels the other tasks instead of leaving them running.
+        #   Steps 2-3: merkle tree rewards (plus bond curve and share rate when
+        #     the multicall was unavailable)
+        #   Step 7: validator status (pubkeys -> beacon chain), if requested,
+        #     with Step 8 (APY metrics) and Step 9 (health) chained onto it
+        #   Step 10: withdrawal history, if requested
+        try:
+            async with asyncio.TaskGroup() as tg:
+                curve_task = tg.create_task(get_curve_id())
+                rewards_task = tg.create_task(self.rewards_tree.get_operator_rewards(operator_id))
+                rate_task = tg.create_task(ctx.shares_rate())
+                if fetch_validators:
+                    validators_task = tg.create_task(
+                        self._get_validators(operator_id, operator.total_deposited_keys)
+                    )
+                    apy_task = tg.create_task(apy_after_curve(curve_task))
+                    health_task = tg.create_task(health_after_validators(curve_task, validators_task))
+                if include_withdrawals:
+                    withdrawals_task = tg.create_task(
+                        self.get_withdrawal_history(operator_id, operator.reward_address)
+                    )
+        except ExceptionGroup as eg:
+            # Surface the first failure as-is so callers see the same exception
+            # types as with sequential awaits
+            raise eg.exceptions[0] from None
+
+        curve_id = curve_task.result()
+        rewards_info = rewards_task.result()
+        shares_rate = rate_task.result()
+        operator_type = self.onchain.get_operator_type_name(curve_id)
 
-        # Step 6: Calculate unclaimed
+        # Step 4: Calculate unclaimed
         cumulative_shares = (
             rewards_info.cumulative_fee_shares if rewards_info else 0
         )
         unclaimed_shares = max(0, cumulative_shares - distributed)
 
-        # Step 7: Convert shares to ETH
-        unclaimed_eth = await self.onchain.shares_to_eth(unclaimed_shares)
-        cumulative_eth = await self.onchain.shares_to_eth(cumulative_shares)
-        distributed_eth = await self.onchain.shares_to_eth(distributed)
+        # Step 5: Convert shares to ETH
+        unclaimed_eth = self._shares_to_eth(unclaimed_shares, shares_rate)
+        cumulative_eth = self._shares_to_eth(cumulative_shares, shares_rate)
+        distributed_eth = self._shares_to_eth(distributed, shares_rate)
 
-        # Step 8: Calculate total claimable
+        # Step 6: Calculate total claimable
         total_claimable = bond.excess_bond_eth + unclaimed_eth
 
-        # Step 9: Get validator details if requested
+        # Steps 7-10: Collect the optional results
         validator_details: list[ValidatorInfo] = []
         validators_by_status: dict[str, int] | None = None
         avg_effectiveness: float | None = None
@@ -106,37 +302,16 @@ class OperatorService:
         health_status: HealthStatus | None = None
         withdrawals: list[WithdrawalEvent] | None = None
 
-        if include_validators and operator.total_deposited_keys > 0:
-            # Get validator pubkeys
-            pubkeys = await self.onchain.get_signing_keys(
-                operator_id, 0, operator.total_deposited_keys
-            )
-            # Fetch validator status from beacon chain
-            validator_details = await self.beacon.get_validators_by_pubkeys(pubkeys)
-            validators_by_status = aggregate_validator_status(validator_details)
-            avg_effectiveness = calculate_avg_effectiveness(validator_details)
-            active_since = get_earliest_activation(validator_details)
-
-            # Step 10: Calculate APY metrics (using historical IPFS data)
-            apy_metrics = await self.calculate_apy_metrics(
-                operator_id=operator_id,
-                bond_eth=bond.current_bond_eth,
-                curve_id=curve_id,
-                include_history=include_history,
-            )
-
-            # Step 11: Calculate health status
-            health_status = await self.calculate_health_status(
-                operator_id=operator_id,
-                bond=bond,
-                stuck_validators_count=operator.stuck_validators_count,
-                validator_details=validator_details,
-                curve_id=curve_id,
-            )
+        if fetch_validators:
+            validator_details, validator_summary = validators_task.result()
+            validators_by_status = validator_summary.by_status
+            avg_effectiveness = validator_summary.avg_effectiveness
+            active_since = validator_summary.earliest_activation
+            apy_metrics = apy_task.result()
+            health_status = health_task.result()
 
-        # Step 12: Fetch withdrawal history if requested
         if include_withdrawals:
-            withdrawals = await self.get_withdrawal_history(operator_id)
+            withdrawals = withdrawals_task.result()
 
         return OperatorRewards(
             node_operator_id=operator_id,
@@ -166,6 +341,70 @@ class OperatorService:
             withdrawals=withdrawals,
         )
 
+    async def get_operators_by_ids(
+        self, operator_ids: list[int], concurrency: int = 16, **kwargs
+    ) -> list[OperatorRewards | BaseException | None]:
+        """Get rewards data for many operators with bounded concurrency.
+
+        Args:
+            operator_ids: Operator IDs to fetch
+            concurrency: Max operators fetched at once
+            **kwargs: Passed through to get_operator_by_id (include_validators, ...)
+
+        Returns:
+            One entry per ID, in order: the OperatorRewards, None if the operator
+            doesn't exist, or the exception raised while fetching it
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(operator_id: int) -> OperatorRewards | None:
+            async with semaphore:
+                return await self.get_operator_by_id(operator_id, **kwargs)
+
+        return await asyncio.gather(
+            *(fetch(operator_id) for operator_id in operator_ids), return_exceptions=True
+        )
+
+    async def iter_operators_by_ids(
+        self, operator_ids: list[int], concurrency: int = 16, **kwargs
+    ) -> AsyncIterator[tuple[int, OperatorRewards | BaseException | None]]:
+        """Like get_operators_by_ids, but yield each result as soon as it completes.
+
+        Yields:
+            (operator_id, result) pairs in completion order, where result is as
+            in get_operators_by_ids
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(operator_id: int):
+            async with semaphore:
+                try:
+                    return operator_id, await self.get_operator_by_id(operator_id, **kwargs)
+                except Exception as e:
+                    return operator_id, e
+
+        tasks = [asyncio.ensure_future(fetch(operator_id)) for operator_id in operator_ids]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # The consumer stopped early (e.g. client disconnected)
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    def _shares_to_eth(shares: int, rate: Decimal) -> Decimal:
+        """Convert stETH shares to ETH using a rate from get_shares_to_eth_rate()."""
+        return Decimal(shares) * rate / WEI_PER_ETH
+
+    async def _get_validators(
+        self, operator_id: int, count: int
+    ) -> tuple[list[ValidatorInfo], ValidatorSummary]:
+        """Get validator pubkeys for an operator, their beacon chain status and its summary."""
+        pubkeys = await self.onchain.get_signing_keys(operator_id, 0, count)
+        validator_details = await self.beacon.get_validators_by_pubkeys(pubkeys)
+        return validator_details, summarize_validators(validator_details)
+
     async def get_all_operators_with_rewards(self) -> list[int]:
         """Get list of all operator IDs that have rewards in the tree."""
         return await self.rewards_tree.get_all_operators_with_rewards()
@@ -176,6 +415,7 @@ class OperatorService:
         bond_eth: Decimal,
         curve_id: int = 0,
         include_history: bool = False,
+        ctx: RequestCache | None = None,
     ) -> APYMetrics:
         """Calculate APY metrics for an operator using historical IPFS data.
 
@@ -189,7 +429,26 @@ class OperatorService:
             curve_id: Bond curve (0=Permissionless, 1=ICS/Legacy EA)
             include_history: If True, populate the frames list with all historical data
                             and calculate accurate per-frame lifetime APY
+            ctx: Per-request cache shared with the caller
         """
+        # Minimum bond threshold: 0.01 ETH (dust amounts produce nonsensical APY)
+        MIN_BOND_ETH = Decimal("0.01")
+        # The stETH APR doesn't depend on anything below; start it now so its
+        # round-trip overlaps the log history / IPFS fetches
+        apr_task = asyncio.create_task(self.lido_api.get_steth_apr())
+        if bond_eth < MIN_BOND_ETH:
+            # Nothing below depends on the bond except the protocol stETH APR;
+            # skip the log history, IPFS and subgraph fetches entirely
+            steth_data = await apr_task
+            bond_apy = steth_data.get("apr")
+            return APYMetrics(
+                bond_apy=bond_apy,
+                net_apy_28d=round(bond_apy, 2) if bond_apy is not None else None,
+            )
+
+        ctx = ctx or RequestCache(self.onchain)
+        # Same for the historical APR series from the subgraph
+        historical_apr_task = asyncio.create_task(self.lido_api.get_historical_apr_data())
         historical_reward_apy_28d = None
         historical_reward_apy_ltd = None
         previous_distribution_eth = None
@@ -206,87 +465,104 @@ class OperatorService:
         lifetime_net_apy = None
         frame_list: list[DistributionFrame] | None = None
         frames = []
+        durations: list[float] = []  # frame durations in days, parallel to frames
+        frame_eths: tuple[float, ...] = ()  # frame rewards in ETH, parallel to frames
 
         # 1. Try to get historical APY from IPFS distribution logs
-        # Minimum bond threshold: 0.01 ETH (dust amounts produce nonsensical APY)
-        MIN_BOND_ETH = Decimal("0.01")
-        if bond_eth >= MIN_BOND_ETH:
-            try:
-                # Query historical log CIDs from contract events
-                log_history = await self.onchain.get_distribution_log_history()
+        # APY math runs in float; results are rounded to 2-6 decimals anyway
+        bond_f = float(bond_eth)
+        # Required bond per frame only depends on its validator count
+        required_bonds: dict[int, float] = {}
+
+        def required_bond(validator_count: int) -> float:
+            bond = required_bonds.get(validator_count)
+            if bond is None:
+                bond = required_bonds[validator_count] = float(
+                    self.onchain.calculate_required_bond(validator_count, curve_id)
+                )
+            return bond
 
-                if log_history:
-                    # Fetch operator's historical frame data
-                    frames = await self.ipfs_logs.get_operator_history(
-                        operator_id, log_history
+        try:
+            # Query historical log CIDs from contract events, together with
+            # one share rate for every conversion below (IPFS logs store
+            # distributed_rewards in stETH shares, not ETH)
+            log_history, shares_rate = await asyncio.gather(
+                ctx.log_history(), ctx.shares_rate()
+            )
+
+            if log_history:
+
+                # Fetch operator's historical frame data
+                frames = await self.ipfs_logs.get_operator_history(
+                    operator_id, log_history
+                )
+                # One pass over the frames; every section below indexes into these
+                frame_shares = []
+                total_shares = 0
+                for f in frames:
+                    frame_shares.append(f.distributed_rewards)
+                    total_shares += f.distributed_rewards
+                    durations.append(f.duration_days)
+                frame_eths = _frame_eths(tuple(frame_shares), shares_rate)
+
+                if frames:
+                    # Lifetime total: summed as int shares, converted once
+                    lifetime_distribution_eth = float(
+                        self._shares_to_eth(total_shares, shares_rate)
                     )
 
-                    if frames:
-                        # Convert all frame shares to ETH values
-                        # IPFS logs store distributed_rewards in stETH shares, not ETH
-                        # We need to convert shares to ETH for accurate display and APY calculation
-                        total_shares = sum(f.distributed_rewards for f in frames)
-                        lifetime_distribution_eth = float(
-                            await self.onchain.shares_to_eth(total_shares)
+                    # Extract current frame data (most recent)
+                    current_frame = frames[-1]
+                    current_eth = frame_eths[-1]
+                    current_days = durations[-1]
+                    current_distribution_eth = current_eth
+                    if current_days > 0:
+                        current_distribution_apy = round(
+                            current_eth / bond_f * (365.0 / current_days) * 100, 2
                         )
 
-                        # Extract current frame data (most recent)
-                        current_frame = frames[-1]
-                        current_eth = await self.onchain.shares_to_eth(
-                            current_frame.distributed_rewards
-                        )
-                        current_days = self.ipfs_logs.calculate_frame_duration_days(current_frame)
-                        current_distribution_eth = float(current_eth)
-                        if current_days > 0 and bond_eth >= MIN_BOND_ETH:
-                            current_distribution_apy = round(
-                                float(current_eth / bond_eth) * (365.0 / current_days) * 100, 2
+                    # Extract previous frame data (second-to-last)
+                    if len(frames) >= 2:
+                        prev_eth = frame_eths[-2]
+                        prev_days = durations[-2]
+                        previous_distribution_eth = prev_eth
+                        if prev_days > 0:
+                            previous_distribution_apy = round(
+                                prev_eth / bond_f * (365.0 / prev_days) * 100, 2
                             )
 
-                        # Extract previous frame data (second-to-last)
-                        if len(frames) >= 2:
-                            previous_frame = frames[-2]
-                            prev_eth = await self.onchain.shares_to_eth(
-                                previous_frame.distributed_rewards
-                            )
-                            prev_days = self.ipfs_logs.calculate_frame_duration_days(previous_frame)
-                            previous_distribution_eth = float(prev_eth)
-                            if prev_days > 0 and bond_eth >= MIN_BOND_ETH:
-                                previous_distribution_apy = round(
-                                    float(prev_eth / bond_eth) * (365.0 / prev_days) * 100, 2
-                                )
-
-                        # Calculate APY using ETH values (now that we have them)
-                        # Calculate 28-day APY (current frame)
-                        if current_distribution_apy is not None:
-                            historical_reward_apy_28d = current_distribution_apy
-                        # NOTE: Lifetime APY is intentionally NOT calculated because:
-                        # - It uses current bond as denominator for all historical rewards
-                        # - This produces misleading values for operators who grew over time
-                        # - We keep lifetime_distribution_eth (ETH totals are accurate)
-                        # historical_reward_apy_ltd remains None
-
-                        # Estimate next distribution date (~28 days after current frame ends)
-                        # Frame duration ≈ 28 days = ~6300 epochs
-                        # If IPFS logs are behind, keep advancing until we get a future date
-                        now = datetime.now(timezone.utc)
-                        next_epoch = current_frame.end_epoch + 6300
+                    # Calculate APY using ETH values (now that we have them)
+                    # Calculate 28-day APY (current frame)
+                    if current_distribution_apy is not None:
+                        historical_reward_apy_28d = current_distribution_apy
+                    # NOTE: Lifetime APY is intentionally NOT calculated because:
+                    # - It uses current bond as denominator for all historical rewards
+                    # - This produces misleading values for operators who grew over time
+                    # - We keep lifetime_distribution_eth (ETH totals are accurate)
+                    # historical_reward_apy_ltd remains None
+
+                    # Estimate next distribution date (~28 days after current frame ends)
+                    # Frame duration ≈ 28 days = ~6300 epochs
+                    # If IPFS logs are behind, keep advancing until we get a future date
+                    now = datetime.now(timezone.utc)
+                    next_epoch = current_frame.end_epoch + 6300
+                    next_dt = epoch_to_dt(next_epoch)
+                    while next_dt < now:
+                        next_epoch += 6300  # Add another ~28 days
                         next_dt = epoch_to_dt(next_epoch)
-                        while next_dt < now:
-                            next_epoch += 6300  # Add another ~28 days
-                            next_dt = epoch_to_dt(next_epoch)
-                        next_distribution_date = next_dt.isoformat()
+                    next_distribution_date = next_dt.isoformat()
 
-                        # Estimate next distribution ETH based on current daily rate
-                        if current_days > 0:
-                            daily_rate = current_eth / Decimal(current_days)
-                            next_distribution_est_eth = float(daily_rate * Decimal(28))
+                    # Estimate next distribution ETH based on current daily rate
+                    if current_days > 0:
+                        daily_rate = current_eth / current_days
+                        next_distribution_est_eth = daily_rate * 28
 
-            except Exception as e:
-                # If historical APY calculation fails, continue without it
-                logger.warning(f"Historical APY calculation failed for operator {operator_id}: {e}")
+        except Exception as e:
+            # If historical APY calculation fails, continue without it
+            logger.warning(f"Historical APY calculation failed for operator {operator_id}: {e}")
 
         # 2. Bond APY (stETH protocol rebase rate)
-        steth_data = await self.lido_api.get_steth_apr()
+        steth_data = await apr_task
         bond_apy = steth_data.get("apr")
 
         # 3. Net APY calculations (initialized here, calculated after historical APR section)
@@ -315,150 +591,133 @@ class OperatorService:
         previous_bond_apy = None  # Bond APY for previous frame (for accurate previous_net_apy)
 
         # Fetch historical APR data (returns [] if no API key)
-        historical_apr_data = await self.lido_api.get_historical_apr_data()
-
-        if bond_eth >= MIN_BOND_ETH:
-            # Previous frame bond earnings
-            if frames and len(frames) >= 2:
-                prev_frame = frames[-2]
-                prev_days = self.ipfs_logs.calculate_frame_duration_days(prev_frame)
-                if prev_days > 0:
-                    # Use average historical APR for the frame period
-                    prev_start_ts = BEACON_GENESIS + (prev_frame.start_epoch * 384)
-                    prev_end_ts = BEACON_GENESIS + (prev_frame.end_epoch * 384)
-                    prev_apr = self.lido_api.get_average_apr_for_range(
-                        historical_apr_data, prev_start_ts, prev_end_ts
+        historical_apr_data = await historical_apr_task
+
+        # Previous frame bond earnings
+        if frames and len(frames) >= 2:
+            prev_frame = frames[-2]
+            prev_days = durations[-2]
+            if prev_days > 0:
+                # Use average historical APR for the frame period
+                prev_start_ts = BEACON_GENESIS + (prev_frame.start_epoch * 384)
+                prev_end_ts = BEACON_GENESIS + (prev_frame.end_epoch * 384)
+                prev_apr = self.lido_api.get_average_apr_for_range(
+                    historical_apr_data, prev_start_ts, prev_end_ts
+                )
+                if prev_apr is None:
+                    prev_apr = bond_apy
+                if prev_apr is not None:
+                    previous_bond_apr = round(prev_apr, 2)
+                    previous_bond_apy = previous_bond_apr  # Same value, used for net APY
+
+                    # When include_history=True and we have validator count, use per-frame bond
+                    if include_history and prev_frame.validator_count > 0:
+                        prev_bond = required_bond(prev_frame.validator_count)
+                        previous_bond_eth = round(prev_bond * (prev_apr / 100) * (prev_days / 365), 6)
+                    else:
+                        previous_bond_eth = round(bond_f * (prev_apr / 100) * (prev_days / 365), 6)
+
+        # Current frame bond earnings
+        if frames:
+            curr_frame = frames[-1]
+            curr_days = durations[-1]
+            if curr_days > 0:
+                # Use average historical APR for the frame period
+                curr_start_ts = BEACON_GENESIS + (curr_frame.start_epoch * 384)
+                curr_end_ts = BEACON_GENESIS + (curr_frame.end_epoch * 384)
+                curr_apr = self.lido_api.get_average_apr_for_range(
+                    historical_apr_data, curr_start_ts, curr_end_ts
+                )
+                if curr_apr is None:
+                    curr_apr = bond_apy
+                if curr_apr is not None:
+                    current_bond_apr = round(curr_apr, 2)
+                    current_bond_eth = round(bond_f * (curr_apr / 100) * (curr_days / 365), 6)
+
+        # Lifetime bond earnings (sum of all frame durations with per-frame APR)
+        # When include_history=True, calculate accurate lifetime APY with per-frame bond
+        # Also build frame_list here to avoid duplicate loop
+        if frames:
+            lifetime_bond_sum = 0.0
+            # For accurate lifetime APY calculation (duration-weighted)
+            frame_reward_apys = []
+            frame_bond_apys = []
+            frame_durations = []
+            frame_list = []  # Build frame_list here instead of separate loop
+
+            for i, (f, f_days, f_eth) in enumerate(zip(frames, durations, frame_eths)):
+                f_apy = None
+                f_bond_apy = None
+                f_net_apy = None
+
+                if f_days > 0:
+                    # Use average historical APR for each frame period
+                    f_start_ts = BEACON_GENESIS + (f.start_epoch * 384)
+                    f_end_ts = BEACON_GENESIS + (f.end_epoch * 384)
+                    f_apr = self.lido_api.get_average_apr_for_range(
+                        historical_apr_data, f_start_ts, f_end_ts
                     )
-                    if prev_apr is None:
-                        prev_apr = bond_apy
-                    if prev_apr is not None:
-                        previous_bond_apr = round(prev_apr, 2)
-                        previous_bond_apy = previous_bond_apr  # Same value, used for net APY
+                    if f_apr is None:
+                        f_apr = bond_apy
 
+                    if f_apr is not None:
                         # When include_history=True and we have validator count, use per-frame bond
-                        if include_history and prev_frame.validator_count > 0:
-                            prev_bond = self.onchain.calculate_required_bond(
-                                prev_frame.validator_count, curve_id
-                            )
-                            # Keep calculation in Decimal for precision
-                            previous_bond_eth = round(
-                                float(prev_bond * Decimal(prev_apr / 100) * Decimal(prev_days / 365)), 6
-                            )
+                        if include_history and f.validator_count > 0:
+                            f_bond = required_bond(f.validator_count)
+                            lifetime_bond_sum += f_bond * (f_apr / 100) * (f_days / 365)
+
+                            # Calculate per-frame reward APY using accurate per-frame bond
+                            if f_bond > 0:
+                                f_apy = round(f_eth / f_bond * (365.0 / f_days) * 100, 2)
+                                f_bond_apy = round(f_apr, 2)
+                                f_net_apy = round(f_apy + f_bond_apy, 2)
+
+                                frame_reward_apys.append(f_apy)
+                                frame_bond_apys.append(f_apr)
+                                frame_durations.append(f_days)
                         else:
-                            previous_bond_eth = round(
-                                float(bond_eth * Decimal(prev_apr / 100) * Decimal(prev_days / 365)), 6
-                            )
-
-            # Current frame bond earnings
-            if frames:
-                curr_frame = frames[-1]
-                curr_days = self.ipfs_logs.calculate_frame_duration_days(curr_frame)
-                if curr_days > 0:
-                    # Use average historical APR for the frame period
-                    curr_start_ts = BEACON_GENESIS + (curr_frame.start_epoch * 384)
-                    curr_end_ts = BEACON_GENESIS + (curr_frame.end_epoch * 384)
-                    curr_apr = self.lido_api.get_average_apr_for_range(
-                        historical_apr_data, curr_start_ts, curr_end_ts
-                    )
-                    if curr_apr is None:
-                        curr_apr = bond_apy
-                    if curr_apr is not None:
-                        current_bond_apr = round(curr_apr, 2)
-                        # Keep calculation in Decimal for precision
-                        current_bond_eth = round(
-                            float(bond_eth * Decimal(curr_apr / 100) * Decimal(curr_days / 365)), 6
-                        )
-
-            # Lifetime bond earnings (sum of all frame durations with per-frame APR)
-            # When include_history=True, calculate accurate lifetime APY with per-frame bond
-            # Also build frame_list here to avoid duplicate loop
-            if frames:
-                lifetime_bond_sum = 0.0
-                # For accurate lifetime APY calculation (duration-weighted)
-                frame_reward_apys = []
-                frame_bond_apys = []
-                frame_durations = []
-                frame_list = []  # Build frame_list here instead of separate loop
-
-                for i, f in enumerate(frames):
-                    f_days = self.ipfs_logs.calculate_frame_duration_days(f)
-                    f_eth = await self.onchain.shares_to_eth(f.distributed_rewards)
-                    f_apy = None
-                    f_bond_apy = None
-                    f_net_apy = None
-
-                    if f_days > 0:
-                        # Use average historical APR for each frame period
-                        f_start_ts = BEACON_GENESIS + (f.start_epoch * 384)
-                        f_end_ts = BEACON_GENESIS + (f.end_epoch * 384)
-                        f_apr = self.lido_api.get_average_apr_for_range(
-                            historical_apr_data, f_start_ts, f_end_ts
-                        )
-                        if f_apr is None:
-                            f_apr = bond_apy
-
-                        if f_apr is not None:
-                            # When include_history=True and we have validator count, use per-frame bond
-                            if include_history and f.validator_count > 0:
-                                f_bond = self.onchain.calculate_required_bond(
-                                    f.validator_count, curve_id
-                                )
-                                # Keep calculations in Decimal for precision
-                                lifetime_bond_sum += float(f_bond * Decimal(f_apr / 100) * Decimal(f_days / 365))
-
-                                # Calculate per-frame reward APY using accurate per-frame bond
-                                if f_bond > 0:
-                                    f_apy = round(float((f_eth / f_bond) * Decimal(365.0 / f_days) * Decimal(100)), 2)
-                                    f_bond_apy = round(f_apr, 2)
-                                    f_net_apy = round(f_apy + f_bond_apy, 2)
-
-                                    frame_reward_apys.append(f_apy)
-                                    frame_bond_apys.append(f_apr)
-                                    frame_durations.append(f_days)
-                            else:
-                                lifetime_bond_sum += float(bond_eth * Decimal(f_apr / 100) * Decimal(f_days / 365))
-                                # Fallback: use current bond for APY calc
-                                if bond_eth >= MIN_BOND_ETH:
-                                    f_apy = round(float(f_eth / bond_eth) * (365.0 / f_days) * 100, 2)
-
-                    # Build frame_list entry if history requested
-                    if include_history:
-                        frame_list.append(
-                            DistributionFrame(
-                                frame_number=i + 1,
-                                start_date=epoch_to_dt(f.start_epoch).isoformat(),
-                                end_date=epoch_to_dt(f.end_epoch).isoformat(),
-                                rewards_eth=float(f_eth),
-                                rewards_shares=f.distributed_rewards,
-                                duration_days=round(f_days, 1),
-                                validator_count=f.validator_count,
-                                apy=f_apy,
-                                bond_apy=f_bond_apy,
-                                net_apy=f_net_apy,
-                            )
+                            lifetime_bond_sum += bond_f * (f_apr / 100) * (f_days / 365)
+                            # Fallback: use current bond for APY calc
+                            f_apy = round(f_eth / bond_f * (365.0 / f_days) * 100, 2)
+
+                # Build frame_list entry if history requested
+                if include_history:
+                    frame_list.append(
+                        DistributionFrame(
+                            frame_number=i + 1,
+                            start_date=_epoch_isoformat(f.start_epoch),
+                            end_date=_epoch_isoformat(f.end_epoch),
+                            rewards_eth=f_eth,
+                            rewards_shares=f.distributed_rewards,
+                            duration_days=round(f_days, 1),
+                            validator_count=f.validator_count,
+                            apy=f_apy,
+                            bond_apy=f_bond_apy,
+                            net_apy=f_net_apy,
                         )
+                    )
 
-                if lifetime_bond_sum > 0:
-                    lifetime_bond_eth = round(lifetime_bond_sum, 6)
-
-                # Calculate duration-weighted lifetime APYs when include_history=True
-                if include_history and frame_durations:
-                    total_duration = sum(frame_durations)
-                    if total_duration > 0:
-                        # Duration-weighted average reward APY
-                        lifetime_reward_apy = round(
-                            sum(apy * dur for apy, dur in zip(frame_reward_apys, frame_durations))
-                            / total_duration,
-                            2
-                        )
-                        # Duration-weighted average bond APY
-                        lifetime_bond_apy = round(
-                            sum(apy * dur for apy, dur in zip(frame_bond_apys, frame_durations))
-                            / total_duration,
-                            2
-                        )
-                        # Net = Reward + Bond
-                        lifetime_net_apy = round(lifetime_reward_apy + lifetime_bond_apy, 2)
+            if lifetime_bond_sum > 0:
+                lifetime_bond_eth = round(lifetime_bond_sum, 6)
+
+            # Calculate duration-weighted lifetime APYs when include_history=True
+            if include_history and frame_durations:
+                total_duration = sum(frame_durations)
+                if total_duration > 0:
+                    # Duration-weighted average reward APY
+                    lifetime_reward_apy = round(
+                        sum(apy * dur for apy, dur in zip(frame_reward_apys, frame_durations))
+                        / total_duration,
+                        2
+                    )
+                    # Duration-weighted average bond APY
+                    lifetime_bond_apy = round(
+                        sum(apy * dur for apy, dur in zip(frame_bond_apys, frame_durations))
+                        / total_duration,
+                        2
+                    )
+                    # Net = Reward + Bond
+                    lifetime_net_apy = round(lifetime_reward_apy + lifetime_bond_apy, 2)
 
         # 4b. Previous frame net APY (now that we have previous_bond_apy)
         # Uses the actual APR from the previous frame period instead of current bond_apy
@@ -525,18 +784,22 @@ class OperatorService:
         stuck_validators_count: int,
         validator_details: list[ValidatorInfo],
         curve_id: int | None = None,
+        validator_summary: ValidatorSummary | None = None,
     ) -> HealthStatus:
         """Calculate health status for an operator.
 
         Includes bond health, stuck validators, slashing, at-risk validators, and strikes.
+        Pass validator_summary if already computed to skip re-scanning validator_details.
         """
         # Bond health
         bond_healthy = bond.current_bond_eth >= bond.required_bond_eth
         bond_deficit = max(Decimal(0), bond.required_bond_eth - bond.current_bond_eth)
 
         # Count slashed and at-risk validators
-        slashed_count = count_slashed_validators(validator_details)
-        at_risk_count = count_at_risk_validators(validator_details)
+        if validator_summary is None:
+            validator_summary = summarize_validators(validator_details)
+        slashed_count = validator_summary.slashed_count
+        at_risk_count = validator_summary.at_risk_count
 
         # Get strikes data (pass curve_id for operator-specific thresholds)
         strike_summary = StrikeSummary()
@@ -572,14 +835,17 @@ class OperatorService:
         """
         return await self.strikes.get_operator_strikes(operator_id, curve_id)
 
-    async def get_recent_frame_dates(self, count: int = 6) -> list[dict]:
+    async def get_recent_frame_dates(
+        self, count: int = 6, ctx: RequestCache | None = None
+    ) -> list[dict]:
         """Get date ranges for the most recent N distribution frames.
 
         Returns list of {start, end} dicts with formatted date strings,
         ordered from oldest to newest (matching strikes array order).
         """
+        ctx = ctx or RequestCache(self.onchain)
         try:
-            log_history = await self.onchain.get_distribution_log_history()
+            log_history = await ctx.log_history()
         except Exception as e:
             logger.warning(f"Failed to fetch distribution log history: {e}")
             return []
@@ -590,23 +856,34 @@ class OperatorService:
         # Get last N frames (log_history is already sorted oldest-first)
         recent_logs = log_history[-count:] if len(log_history) >= count else log_history
 
-        frame_dates = []
-        for entry in recent_logs:
+        # Fetch all logs concurrently (cache hits return immediately, gateway
+        # requests are still spaced out by IPFSLogProvider's rate limiter)
+        log_datas = await asyncio.gather(
+            *(self.ipfs_logs.fetch_log(entry["logCid"]) for entry in recent_logs),
+            return_exceptions=True,
+        )
+
+        frame_epochs = []
+        for entry, log_data in zip(recent_logs, log_datas):
             try:
-                log_data = await self.ipfs_logs.fetch_log(entry["logCid"])
+                if isinstance(log_data, BaseException):
+                    raise log_data
                 if log_data:
-                    start_epoch, end_epoch = self.ipfs_logs.get_frame_info(log_data)
-                    start_date = epoch_to_datetime(start_epoch)
-                    end_date = epoch_to_datetime(end_epoch)
-                    frame_dates.append({
-                        "start": start_date.strftime("%b %d"),
-                        "end": end_date.strftime("%b %d"),
-                    })
+                    frame_epochs.append(self.ipfs_logs.get_frame_info(log_data))
             except Exception as e:
                 # Skip frames we can't fetch
                 logger.debug(f"Failed to fetch frame data for CID {entry.get('logCid', 'unknown')}: {e}")
                 continue
 
+        # Format once all fetches are done (epoch_to_datetime is memoized)
+        frame_dates = [
+            {
+                "start": epoch_to_datetime(start_epoch).strftime("%b %d"),
+                "end": epoch_to_datetime(end_epoch).strftime("%b %d"),
+            }
+            for start_epoch, end_epoch in frame_epochs
+        ]
+
         # Pad to ensure we always have `count` entries (for UI consistency)
         # Pad at the beginning since strikes array is ordered oldest to newest
         frame_number = 1
@@ -616,38 +893,80 @@ class OperatorService:
 
         return frame_dates
 
-    async def get_operator_active_since(self, operator_id: int):
+    async def get_operator_active_since(
+        self, operator_id: int, ctx: RequestCache | None = None
+    ) -> datetime | None:
         """Get operator's first validator activation date (lightweight).
 
         Returns datetime or None if no validators have been activated.
+        A found date never changes, so it is cached per operator for the
+        process lifetime.
         """
-        from datetime import datetime
+        active_since = _active_since_cache.get(operator_id)
+        if active_since is not None:
+            return active_since
 
+        ctx = ctx or RequestCache(self.onchain)
         try:
-            operator = await self.onchain.get_node_operator(operator_id)
-            if operator.total_deposited_keys == 0:
-                return None
-
-            # Get just the first pubkey to minimize beacon chain API calls
-            pubkeys = await self.onchain.get_signing_keys(operator_id, 0, 1)
-            if not pubkeys:
+            operator, pubkeys = await self._get_operator_and_first_key(operator_id, ctx)
+            if operator.total_deposited_keys == 0 or not pubkeys:
                 return None
 
             validators = await self.beacon.get_validators_by_pubkeys(pubkeys)
-            return get_earliest_activation(validators)
+            active_since = get_earliest_activation(validators)
+            if active_since is not None:
+                _active_since_cache[operator_id] = active_since
+            return active_since
         except Exception as e:
             logger.debug(f"Failed to get active_since for operator {operator_id}: {e}")
             return None
 
-    async def get_withdrawal_history(self, operator_id: int) -> list[WithdrawalEvent]:
+    async def _get_operator_and_first_key(
+        self, operator_id: int, ctx: RequestCache
+    ) -> tuple[NodeOperator, list[str]]:
+        """Get the operator and (at most) its first pubkey in one round trip.
+
+        Uses a single multicall, falling back to the operator lookup (free if
+        ctx already has it) gathered with a one-key getSigningKeys call.
+        """
+        from web3.exceptions import ContractLogicError
+
+        try:
+            operator, pubkey = await self.onchain.get_operator_with_first_key(operator_id)
+            ctx.set_operator(operator)
+            return operator, [pubkey] if pubkey else []
+        except ContractLogicError:
+            raise
+        except Exception as e:
+            logger.debug(f"Multicall failed for operator {operator_id} first key: {e}")
+
+        operator, pubkeys = await asyncio.gather(
+            ctx.operator(operator_id),
+            self.onchain.get_signing_keys(operator_id, 0, 1),
+            return_exceptions=True,
+        )
+        if isinstance(operator, BaseException):
+            raise operator
+        if isinstance(pubkeys, BaseException):
+            if operator.total_deposited_keys == 0:
+                return operator, []
+            raise pubkeys
+        return operator, pubkeys
+
+    async def get_withdrawal_history(
+        self, operator_id: int, reward_address: str | None = None
+    ) -> list[WithdrawalEvent]:
         """Get withdrawal/claim history for an operator.
 
         Returns list of WithdrawalEvent objects representing when rewards were claimed.
         Includes both stETH direct transfers and unstETH (withdrawal NFT) claims.
+        Pass reward_address when already known to skip the operator lookup.
         """
         try:
-            operator = await self.onchain.get_node_operator(operator_id)
-            events = await self.onchain.get_withdrawal_history(operator.reward_address)
+            if reward_address is None:
+                operator = await self.onchain.get_node_operator(operator_id)
+                reward_address = operator.reward_address
+            events = await self.onchain.get_withdrawal_history(reward_address)
             return [
                 WithdrawalEvent(
                     block_number=e["block_number"],
@@ -667,3 +986,23 @@ class OperatorService:
         except Exception as e:
             logger.warning(f"Failed to fetch withdrawal history for operator {operator_id}: {e}")
             return []
+
+
+_service: OperatorService | None = None
+_service_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_operator_service() -> OperatorService:
+    """Get the process-wide OperatorService, creating it on first use.
+
+    Building a service constructs web3 contract objects and provider state,
+    so the web app shares one instance instead of paying that per request.
+    A new instance is created if the running event loop changed, since the
+    providers hold asyncio locks and semaphores bound to a loop.
+    """
+    global _service, _service_loop
+    loop = asyncio.get_running_loop()
+    if _service is None or _service_loop is not loop:
+        _service = OperatorService()
+        _service_loop = loop
+    return _service
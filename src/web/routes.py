@@ -1,26 +1,46 @@
 """API endpoints for the web interface."""
 
+import asyncio
+import hashlib
 import logging
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
 logger = logging.getLogger(__name__)
 
 from ..data.database import (
     delete_operator,
+    find_saved_by_address,
     get_saved_operators,
     is_operator_saved,
+    list_saved_addresses,
     save_operator,
     update_operator_data,
+    update_operators_bulk,
 )
+from ..core import jsonutil
+from ..data.cache import SimpleCache
 from ..data.price import get_eth_price
-from ..services.operator_service import OperatorService
+from ..services.operator_service import RequestCache, get_operator_service
 
 router = APIRouter()
 
+# Maximum number of saved operators fetched concurrently by refresh-all
+REFRESH_CONCURRENCY = 4
+# Browser cache lifetime (seconds) for /price/eth; the server caches it for 5 minutes
+PRICE_MAX_AGE = 60
+# Rendered /operator responses are reused for OPERATOR_RESPONSE_TTL seconds, so
+# repeat lookups skip the upstream fetch and serialization; browsers may reuse
+# them for OPERATOR_MAX_AGE seconds and revalidate with the ETag after that
+OPERATOR_RESPONSE_TTL = 30
+OPERATOR_MAX_AGE = 15
+_operator_responses = SimpleCache(default_ttl=OPERATOR_RESPONSE_TTL, max_size=512)
+
 
 @router.get("/operator/{identifier}")
 async def get_operator(
+    request: Request,
     identifier: str,
     detailed: bool = Query(False, description="Include validator status from beacon chain"),
     history: bool = Query(False, description="Include all historical distribution frames"),
@@ -36,16 +56,39 @@ async def get_operator(
     - Add ?withdrawals=true to include withdrawal/claim history
     """
     logger.info(f"Get operator: {identifier}, detailed={detailed}, history={history}, withdrawals={withdrawals}")
-    service = OperatorService()
+    key = (identifier.lower(), detailed, history, withdrawals)
+    cached = _operator_responses.get(key)
+    if cached is None:
+        result = await _build_operator_response(identifier, detailed, history, withdrawals)
+        body = jsonutil.dumps(result)
+        cached = (body, f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"')
+        _operator_responses.set(key, cached)
+
+    body, etag = cached
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={OPERATOR_MAX_AGE}, stale-while-revalidate=60",
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def _build_operator_response(
+    identifier: str, detailed: bool, history: bool, withdrawals: bool
+) -> dict:
+    """Fetch an operator and build the /operator/{identifier} response body."""
+    service = get_operator_service()
+    ctx = RequestCache(service.onchain)
 
     # Determine if this is an ID or address
     if identifier.isdigit():
         operator_id = int(identifier)
         if operator_id < 0 or operator_id > 1_000_000:
             raise HTTPException(status_code=400, detail="Invalid operator ID")
-        rewards = await service.get_operator_by_id(operator_id, detailed or history, history, withdrawals)
+        rewards = await service.get_operator_by_id(operator_id, detailed or history, history, withdrawals, ctx)
     elif identifier.startswith("0x"):
-        rewards = await service.get_operator_by_address(identifier, detailed or history, history, withdrawals)
+        rewards = await service.get_operator_by_address(identifier, detailed or history, history, withdrawals, ctx)
     else:
         raise HTTPException(status_code=400, detail="Invalid identifier format")
 
@@ -80,7 +123,7 @@ async def get_operator(
     # Fetch active_since for basic (non-detailed) requests
     # For detailed requests, it's already included in rewards.active_since
     if not detailed and rewards.total_validators > 0:
-        active_since = await service.get_operator_active_since(rewards.node_operator_id)
+        active_since = await service.get_operator_active_since(rewards.node_operator_id, ctx)
         if active_since:
             result["active_since"] = active_since.isoformat()
 
@@ -99,7 +142,7 @@ async def get_operator(
     # Add APY metrics if available
     if rewards.apy:
         # Use actual excess bond for lifetime values (estimates for previous/current)
-        lifetime_bond = float(rewards.excess_bond_eth)
+        lifetime_bond = rewards.excess_bond_eth_float
         lifetime_net_total = (rewards.apy.lifetime_distribution_eth or 0) + lifetime_bond
         result["apy"] = {
             "previous_distribution_eth": rewards.apy.previous_distribution_eth,
@@ -208,7 +251,7 @@ async def get_operator(
 @router.get("/operators")
 async def list_operators():
     """List all operators with rewards in the current tree."""
-    service = OperatorService()
+    service = get_operator_service()
     operator_ids = await service.get_all_operators_with_rewards()
     return {"count": len(operator_ids), "operator_ids": operator_ids}
 
@@ -216,7 +259,7 @@ async def list_operators():
 @router.get("/operator/{identifier}/strikes")
 async def get_operator_strikes(identifier: str):
     """Get detailed strikes for an operator's validators."""
-    service = OperatorService()
+    service = get_operator_service()
 
     # Determine if this is an ID or address
     if identifier.isdigit():
@@ -274,36 +317,8 @@ async def list_saved_operators():
         return {"operators": [], "error": str(e)}
 
 
-@router.post("/operator/{identifier}/save")
-async def save_operator_endpoint(identifier: str):
-    """Save an operator to the follow list.
-
-    Fetches current operator data (including history and withdrawals) and stores it in the database.
-    """
-    logger.info(f"Saving operator: {identifier}")
-    service = OperatorService()
-
-    # Determine operator ID
-    if identifier.isdigit():
-        operator_id = int(identifier)
-    elif identifier.startswith("0x"):
-        operator_id = await service.onchain.find_operator_by_address(identifier)
-        if operator_id is None:
-            raise HTTPException(status_code=404, detail="Operator not found")
-    else:
-        raise HTTPException(status_code=400, detail="Invalid identifier format")
-
-    # Fetch current operator data with history and withdrawals
-    rewards = await service.get_operator_by_id(
-        operator_id,
-        include_validators=True,
-        include_history=True,
-        include_withdrawals=True,
-    )
-    if rewards is None:
-        raise HTTPException(status_code=404, detail="Operator not found")
-
-    # Build the data dict (same format as get_operator endpoint)
+def _build_saved_operator_data(rewards) -> dict:
+    """Build the data dict stored for a saved operator (same format as get_operator endpoint)."""
     data = {
         "operator_id": rewards.node_operator_id,
         "manager_address": rewards.manager_address,
@@ -412,6 +427,40 @@ async def save_operator_endpoint(identifier: str):
             for w in rewards.withdrawals
         ]
 
+    return data
+
+
+@router.post("/operator/{identifier}/save")
+async def save_operator_endpoint(identifier: str):
+    """Save an operator to the follow list.
+
+    Fetches current operator data (including history and withdrawals) and stores it in the database.
+    """
+    logger.info(f"Saving operator: {identifier}")
+    service = get_operator_service()
+
+    # Determine operator ID
+    if identifier.isdigit():
+        operator_id = int(identifier)
+    elif identifier.startswith("0x"):
+        operator_id = await service.onchain.find_operator_by_address(identifier)
+        if operator_id is None:
+            raise HTTPException(status_code=404, detail="Operator not found")
+    else:
+        raise HTTPException(status_code=400, detail="Invalid identifier format")
+
+    # Fetch current operator data with history and withdrawals
+    rewards = await service.get_operator_by_id(
+        operator_id,
+        include_validators=True,
+        include_history=True,
+        include_withdrawals=True,
+    )
+    if rewards is None:
+        raise HTTPException(status_code=404, detail="Operator not found")
+
+    data = _build_saved_operator_data(rewards)
+
     # Save to database
     frames_count = len(data.get("apy", {}).get("frames", []))
     withdrawals_count = len(data.get("withdrawals", []))
@@ -428,8 +477,10 @@ async def unsave_operator_endpoint(identifier: str):
     if identifier.isdigit():
         operator_id = int(identifier)
     elif identifier.startswith("0x"):
-        service = OperatorService()
-        operator_id = await service.onchain.find_operator_by_address(identifier)
+        operator_id = await find_saved_by_address(identifier)
+        if operator_id is None:
+            service = get_operator_service()
+            operator_id = await service.onchain.find_operator_by_address(identifier)
         if operator_id is None:
             raise HTTPException(status_code=404, detail="Operator not found")
     else:
@@ -448,10 +499,11 @@ async def check_operator_saved(identifier: str):
     if identifier.isdigit():
         operator_id = int(identifier)
     elif identifier.startswith("0x"):
-        service = OperatorService()
-        operator_id = await service.onchain.find_operator_by_address(identifier)
+        # Index probe on the saved addresses instead of scanning every on-chain operator
+        operator_id = await find_saved_by_address(identifier)
         if operator_id is None:
             return {"saved": False}
+        return {"saved": True, "operator_id": operator_id}
     else:
         raise HTTPException(status_code=400, detail="Invalid identifier format")
 
@@ -466,7 +518,7 @@ async def refresh_operator_endpoint(identifier: str):
     Fetches fresh data (including history and withdrawals) from APIs and updates the database.
     """
     logger.info(f"Refreshing operator: {identifier}")
-    service = OperatorService()
+    service = get_operator_service()
 
     # Determine operator ID
     if identifier.isdigit():
@@ -492,124 +544,94 @@ async def refresh_operator_endpoint(identifier: str):
     if rewards is None:
         raise HTTPException(status_code=404, detail="Operator not found")
 
-    # Build the data dict
-    data = {
-        "operator_id": rewards.node_operator_id,
-        "manager_address": rewards.manager_address,
-        "reward_address": rewards.reward_address,
-        "curve_id": rewards.curve_id,
-        "operator_type": rewards.operator_type,
-        "rewards": {
-            "current_bond_eth": str(rewards.current_bond_eth),
-            "required_bond_eth": str(rewards.required_bond_eth),
-            "excess_bond_eth": str(rewards.excess_bond_eth),
-            "cumulative_rewards_shares": rewards.cumulative_rewards_shares,
-            "cumulative_rewards_eth": str(rewards.cumulative_rewards_eth),
-            "distributed_shares": rewards.distributed_shares,
-            "distributed_eth": str(rewards.distributed_eth),
-            "unclaimed_shares": rewards.unclaimed_shares,
-            "unclaimed_eth": str(rewards.unclaimed_eth),
-            "total_claimable_eth": str(rewards.total_claimable_eth),
-        },
-        "validators": {
-            "total": rewards.total_validators,
-            "active": rewards.active_validators,
-            "exited": rewards.exited_validators,
-        },
-    }
-
-    if rewards.validators_by_status:
-        data["validators"]["by_status"] = rewards.validators_by_status
-
-    if rewards.avg_effectiveness is not None:
-        data["performance"] = {
-            "avg_effectiveness": round(rewards.avg_effectiveness, 2),
-        }
-
-    if rewards.active_since:
-        data["active_since"] = rewards.active_since.isoformat()
-
-    if rewards.apy:
-        data["apy"] = {
-            "historical_reward_apy_28d": rewards.apy.historical_reward_apy_28d,
-            "historical_reward_apy_ltd": rewards.apy.historical_reward_apy_ltd,
-            "bond_apy": rewards.apy.bond_apy,
-            "net_apy_28d": rewards.apy.net_apy_28d,
-            "net_apy_ltd": rewards.apy.net_apy_ltd,
-            "next_distribution_date": rewards.apy.next_distribution_date,
-            "next_distribution_est_eth": rewards.apy.next_distribution_est_eth,
-            "next_distribution_date": rewards.apy.next_distribution_date,
-            "next_distribution_est_eth": rewards.apy.next_distribution_est_eth,
-            "lifetime_reward_apy": rewards.apy.lifetime_reward_apy,
-            "lifetime_bond_apy": rewards.apy.lifetime_bond_apy,
-            "lifetime_net_apy": rewards.apy.lifetime_net_apy,
-        }
-        # Include distribution history frames
-        if rewards.apy.frames:
-            data["apy"]["frames"] = [
-                {
-                    "frame_number": f.frame_number,
-                    "start_date": f.start_date,
-                    "end_date": f.end_date,
-                    "rewards_eth": f.rewards_eth,
-                    "rewards_shares": f.rewards_shares,
-                    "duration_days": f.duration_days,
-                    "validator_count": f.validator_count,
-                    "apy": f.apy,
-                    "validator_count": f.validator_count,
-                    "apy": f.apy,
-                    "bond_apy": f.bond_apy,
-                    "net_apy": f.net_apy,
-                }
-                for f in rewards.apy.frames
-            ]
-
-    if rewards.health:
-        data["health"] = {
-            "bond_healthy": rewards.health.bond_healthy,
-            "bond_deficit_eth": str(rewards.health.bond_deficit_eth),
-            "stuck_validators_count": rewards.health.stuck_validators_count,
-            "slashed_validators_count": rewards.health.slashed_validators_count,
-            "validators_at_risk_count": rewards.health.validators_at_risk_count,
-            "strikes": {
-                "total_validators_with_strikes": rewards.health.strikes.total_validators_with_strikes,
-                "validators_at_risk": rewards.health.strikes.validators_at_risk,
-                "validators_near_ejection": rewards.health.strikes.validators_near_ejection,
-                "total_strikes": rewards.health.strikes.total_strikes,
-                "max_strikes": rewards.health.strikes.max_strikes,
-                "strike_threshold": rewards.health.strikes.strike_threshold,
-            },
-            "has_issues": rewards.health.has_issues,
-        }
-
-    # Include withdrawal history
-    if rewards.withdrawals:
-        data["withdrawals"] = [
-            {
-                "block_number": w.block_number,
-                "timestamp": w.timestamp,
-                "shares": w.shares,
-                "eth_value": w.eth_value,
-                "tx_hash": w.tx_hash,
-                "withdrawal_type": w.withdrawal_type,
-                "request_id": w.request_id,
-                "status": w.status,
-                "claimed_eth": w.claimed_eth,
-                "claim_tx_hash": w.claim_tx_hash,
-                "claim_timestamp": w.claim_timestamp,
-            }
-            for w in rewards.withdrawals
-        ]
+    data = _build_saved_operator_data(rewards)
 
     # Update in database
     frames_count = len(data.get("apy", {}).get("frames", []))
     withdrawals_count = len(data.get("withdrawals", []))
     logger.info(f"Refreshing operator {operator_id}: {frames_count} frames, {withdrawals_count} withdrawals")
     await update_operator_data(operator_id, data)
+    _operator_responses.clear()
 
     return {"status": "refreshed", "operator_id": operator_id, "data": data}
 
 
+@router.post("/saved-operators/refresh")
+async def refresh_all_saved_operators():
+    """Refresh the cached data for every saved operator.
+
+    Fetches fresh data for all saved operators and writes it back in a single transaction.
+    Operators removed while the refresh was running are not re-added.
+    """
+    operator_ids = [operator_id for operator_id, _, _ in await list_saved_addresses()]
+    logger.info(f"Refreshing {len(operator_ids)} saved operators")
+
+    service = get_operator_service()
+    results = await service.get_operators_by_ids(
+        operator_ids,
+        concurrency=REFRESH_CONCURRENCY,
+        include_validators=True,
+        include_history=True,
+        include_withdrawals=True,
+    )
+
+    refreshed = []
+    for operator_id, rewards in zip(operator_ids, results):
+        if isinstance(rewards, BaseException):
+            logger.error(f"Failed to refresh operator {operator_id}: {rewards}")
+        elif rewards is not None:
+            refreshed.append(_build_saved_operator_data(rewards))
+
+    await update_operators_bulk([(data["operator_id"], data) for data in refreshed])
+    _operator_responses.clear()
+
+    return {"status": "refreshed", "operators": refreshed}
+
+
+@router.post("/saved-operators/refresh/stream")
+async def stream_refresh_saved_operators():
+    """Refresh every saved operator, streaming results as NDJSON.
+
+    Each line is one refreshed operator's data, sent as soon as it is fetched, so
+    the page can update cards without waiting for the slowest operator. Failed
+    operators get an ``{"operator_id": ..., "error": ...}`` line instead. The data
+    is written back in a single transaction once the stream ends, including when
+    the client disconnects early, so completed refreshes are never thrown away.
+    """
+    operator_ids = [operator_id for operator_id, _, _ in await list_saved_addresses()]
+    logger.info(f"Streaming refresh of {len(operator_ids)} saved operators")
+
+    service = get_operator_service()
+
+    async def save(refreshed: list[tuple[int, dict]]) -> None:
+        await update_operators_bulk(refreshed)
+        _operator_responses.clear()
+
+    async def lines():
+        refreshed = []
+        try:
+            async for operator_id, rewards in service.iter_operators_by_ids(
+                operator_ids,
+                concurrency=REFRESH_CONCURRENCY,
+                include_validators=True,
+                include_history=True,
+                include_withdrawals=True,
+            ):
+                if isinstance(rewards, BaseException):
+                    logger.error(f"Failed to refresh operator {operator_id}: {rewards}")
+                    yield jsonutil.dumps({"operator_id": operator_id, "error": str(rewards)}) + b"\n"
+                elif rewards is not None:
+                    data = _build_saved_operator_data(rewards)
+                    refreshed.append((operator_id, data))
+                    yield jsonutil.dumps(data) + b"\n"
+        finally:
+            if refreshed:
+                # Shield so a disconnect's cancellation doesn't abort the write
+                await asyncio.shield(save(refreshed))
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 @router.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -618,9 +640,11 @@ async def health_check():
 
 
 @router.get("/price/eth")
-async def get_eth_price_endpoint():
+async def get_eth_price_endpoint(response: Response):
     """Get current ETH price in USD from CoinGecko."""
     price = await get_eth_price()
     if price is None:
         return {"price": None, "error": "Failed to fetch price"}
+    # Let browsers reuse the price across page loads and operator renders
+    response.headers["Cache-Control"] = f"public, max-age={PRICE_MAX_AGE}"
     return {"price": price, "currency": "USD"}
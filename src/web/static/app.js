@@ -0,0 +1,1260 @@
+const form = document.getElementById('lookup-form');
+const loading = document.getElementById('loading');
+const error = document.getElementById('error');
+const errorMessage = document.getElementById('error-message');
+const results = document.getElementById('results');
+const loadDetailsBtn = document.getElementById('load-details');
+const detailsLoading = document.getElementById('details-loading');
+const validatorStatus = document.getElementById('validator-status');
+const beaconchainLink = document.getElementById('beaconchain-link');
+const apySection = document.getElementById('apy-section');
+const healthSection = document.getElementById('health-section');
+const historySection = document.getElementById('history-section');
+
+// Elements looked up once at startup (the script is deferred, so the DOM is parsed)
+const els = Object.freeze({
+    ethPriceValue: document.getElementById('eth-price-value'),
+    ethPriceDisplay: document.getElementById('eth-price-display'),
+    apyLifetimeHeader: document.getElementById('apy-lifetime-header'),
+    rewardApyLtd: document.getElementById('reward-apy-ltd'),
+    bondApyLtd: document.getElementById('bond-apy-ltd'),
+    netApyLtd: document.getElementById('net-apy-ltd'),
+    activeSinceRow: document.getElementById('active-since-row'),
+    effectivenessSection: document.getElementById('effectiveness-section'),
+    strikesDetail: document.getElementById('strikes-detail'),
+    strikesList: document.getElementById('strikes-list'),
+    operatorId: document.getElementById('operator-id'),
+    managerAddress: document.getElementById('manager-address'),
+    rewardAddress: document.getElementById('reward-address'),
+    activeSince: document.getElementById('active-since'),
+    tipOperatorId: document.getElementById('tip-operator-id'),
+    lookupTip: document.getElementById('lookup-tip'),
+    totalValidators: document.getElementById('total-validators'),
+    activeValidators: document.getElementById('active-validators'),
+    exitedValidators: document.getElementById('exited-validators'),
+    currentBond: document.getElementById('current-bond'),
+    requiredBond: document.getElementById('required-bond'),
+    excessBond: document.getElementById('excess-bond'),
+    cumulativeRewards: document.getElementById('cumulative-rewards'),
+    distributedRewards: document.getElementById('distributed-rewards'),
+    unclaimedRewards: document.getElementById('unclaimed-rewards'),
+    totalClaimable: document.getElementById('total-claimable'),
+    statusActive: document.getElementById('status-active'),
+    statusPending: document.getElementById('status-pending'),
+    statusExiting: document.getElementById('status-exiting'),
+    statusExited: document.getElementById('status-exited'),
+    statusSlashed: document.getElementById('status-slashed'),
+    statusUnknown: document.getElementById('status-unknown'),
+    avgEffectiveness: document.getElementById('avg-effectiveness'),
+    rewardApy28d: document.getElementById('reward-apy-28d'),
+    bondApy28d: document.getElementById('bond-apy-28d'),
+    netApy28d: document.getElementById('net-apy-28d'),
+    nextDistDate: document.getElementById('next-dist-date'),
+    nextDistEth: document.getElementById('next-dist-eth'),
+    healthBond: document.getElementById('health-bond'),
+    healthStuck: document.getElementById('health-stuck'),
+    healthSlashed: document.getElementById('health-slashed'),
+    healthAtRisk: document.getElementById('health-at-risk'),
+    healthStrikes: document.getElementById('health-strikes'),
+    address: document.getElementById('address'),
+    toggleStrikes: document.getElementById('toggle-strikes'),
+    healthOverall: document.getElementById('health-overall'),
+    currentBondUsd: document.getElementById('current-bond-usd'),
+    requiredBondUsd: document.getElementById('required-bond-usd'),
+    excessBondUsd: document.getElementById('excess-bond-usd'),
+    cumulativeRewardsUsd: document.getElementById('cumulative-rewards-usd'),
+    distributedRewardsUsd: document.getElementById('distributed-rewards-usd'),
+    unclaimedRewardsUsd: document.getElementById('unclaimed-rewards-usd'),
+    totalClaimableUsd: document.getElementById('total-claimable-usd'),
+});
+
+// [ETH amount element, USD equivalent element] pairs kept in sync by updateUsdDisplays
+const USD_FIELDS = [
+    [els.currentBond, els.currentBondUsd],
+    [els.requiredBond, els.requiredBondUsd],
+    [els.excessBond, els.excessBondUsd],
+    [els.cumulativeRewards, els.cumulativeRewardsUsd],
+    [els.distributedRewards, els.distributedRewardsUsd],
+    [els.unclaimedRewards, els.unclaimedRewardsUsd],
+    [els.totalClaimable, els.totalClaimableUsd],
+];
+
+// Global abort controller for canceling requests on page unload
+let pageAbortController = new AbortController();
+window.addEventListener('beforeunload', () => {
+    pageAbortController.abort();
+});
+pageAbortController.signal.addEventListener('abort', () => {
+    loading.classList.add('hidden');
+    detailsLoading.classList.add('hidden');
+}, { once: true });
+
+// Helper to check if error is from abort (page unload)
+function isAbortError(err) {
+    return err.name === 'AbortError';
+}
+
+// Resolve at the start of the next frame, so a batch of DOM writes after an
+// awaited fetch lands in one style/layout pass
+function nextFrame() {
+    return new Promise(resolve => requestAnimationFrame(resolve));
+}
+
+// Run non-critical work when the browser is idle (setTimeout where
+// requestIdleCallback is unavailable)
+function whenIdle(fn) {
+    if (window.requestIdleCallback) {
+        requestIdleCallback(() => fn(), { timeout: 500 });
+    } else {
+        setTimeout(fn, 0);
+    }
+}
+
+// Set a status cell's colour and text (textContent, so no HTML parsing)
+function setStatus(el, colorClass, text) {
+    el.className = colorClass;
+    el.textContent = text;
+}
+
+const strikeDotTpl = document.getElementById('strike-dot').content.firstElementChild;
+
+// Build one validator row for the strikes list with DOM calls (no HTML parsing)
+function buildStrikeRow(v, threshold, frameDates) {
+    const vThreshold = v.strike_threshold || threshold;
+    const colorClass = v.at_ejection_risk ? 'text-red-400' :
+        (v.strike_count === vThreshold - 1 ? 'text-orange-400' : 'text-yellow-400');
+
+    const row = document.createElement('div');
+    row.className = `flex items-center gap-2 py-1.5 border-b border-gray-700 last:border-0 ${colorClass}`;
+
+    // Truncated pubkey with copy + beaconcha.in link
+    const pubkey = document.createElement('span');
+    pubkey.className = 'font-mono text-xs';
+    pubkey.textContent = v.pubkey.slice(0, 10) + '...' + v.pubkey.slice(-8);
+
+    const copyBtn = document.createElement('button');
+    copyBtn.className = 'text-gray-400 hover:text-white text-sm';
+    copyBtn.title = 'Copy full address';
+    copyBtn.textContent = '📋';
+    copyBtn.addEventListener('click', () => {
+        navigator.clipboard.writeText(v.pubkey);
+        copyBtn.textContent = '✓';
+        setTimeout(() => { copyBtn.textContent = '📋'; }, 1000);
+    });
+
+    const link = document.createElement('a');
+    link.href = `https://beaconcha.in/validator/${v.pubkey}`;
+    link.target = '_blank';
+    link.rel = 'noopener';
+    link.className = 'text-blue-400 hover:text-blue-300 text-sm';
+    link.title = 'View on beaconcha.in';
+    link.textContent = '↗';
+
+    // One dot per frame with a date tooltip
+    const dots = document.createElement('span');
+    dots.className = 'flex gap-0.5 text-base ml-1';
+    v.strikes.forEach((strike, i) => {
+        const frame = frameDates && frameDates[i];
+        const dateRange = frame ? `${frame.start} - ${frame.end}` : `Frame ${i + 1}`;
+        const dot = strikeDotTpl.cloneNode(true);
+        dot.classList.add(strike ? 'text-red-500' : 'text-green-500');
+        dot.title = `${dateRange}: ${strike ? 'Strike' : 'OK'}`;
+        dots.appendChild(dot);
+    });
+
+    const count = document.createElement('span');
+    count.className = 'text-gray-400 text-xs';
+    count.textContent = `(${v.strike_count}/${vThreshold})`;
+
+    row.append(pubkey, copyBtn, link, dots, count);
+    return row;
+}
+
+// ETH price state
+let ethPriceUsd = null;
+
+// Fetch ETH price from CoinGecko via our API
+async function fetchEthPrice() {
+    try {
+        const response = await fetch('/api/price/eth', { signal: pageAbortController.signal });
+        if (!response.ok) return;
+        const data = await response.json();
+        if (data.price) {
+            ethPriceUsd = data.price;
+            els.ethPriceValue.textContent = USD2.format(ethPriceUsd);
+            els.ethPriceDisplay.classList.remove('hidden');
+            // Update any displayed USD values
+            updateUsdDisplays();
+            // Refresh saved operator cards to show USD
+            scheduleSavedCardsUpdate();
+        }
+    } catch (err) {
+        if (!isAbortError(err)) {
+            console.error('Failed to fetch ETH price:', err);
+        }
+    }
+}
+
+// Two-decimal formatter for USD amounts and the ETH price
+const USD2 = new Intl.NumberFormat('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 2 });
+
+// Format USD value
+function formatUsd(ethAmount) {
+    if (ethPriceUsd === null || ethAmount === null || ethAmount === undefined) return '';
+    const usd = parseFloat(ethAmount) * ethPriceUsd;
+    if (usd < 0.01) return '';
+    return '$' + USD2.format(usd);
+}
+
+// Update all USD displays based on current ETH values
+function updateUsdDisplays() {
+    if (ethPriceUsd === null) return;
+
+    USD_FIELDS.forEach(([ethEl, usdEl]) => {
+        if (ethEl && usdEl) {
+            const ethVal = parseFloat(ethEl.textContent);
+            usdEl.textContent = formatUsd(ethVal);
+        }
+    });
+}
+
+// Fetch ETH price on page load
+fetchEthPrice();
+const loadHistoryBtn = document.getElementById('load-history-btn');
+const historyLoading = document.getElementById('history-loading');
+const historyTable = document.getElementById('history-table');
+const historyTbody = document.getElementById('history-tbody');
+const nextDistribution = document.getElementById('next-distribution');
+const withdrawalSection = document.getElementById('withdrawal-section');
+const loadWithdrawalsBtn = document.getElementById('load-withdrawals-btn');
+const withdrawalLoading = document.getElementById('withdrawal-loading');
+const withdrawalTable = document.getElementById('withdrawal-table');
+const withdrawalTbody = document.getElementById('withdrawal-tbody');
+
+const NO_WITHDRAWALS_ROW = '<tr><td colspan="5" class="py-4 text-center text-gray-400">No withdrawals found</td></tr>';
+
+// State variables for history/withdrawal loading
+let historyLoaded = false;
+let withdrawalsLoaded = false;
+// Strikes list state for the operator shown; read by the toggle handler
+const strikesCtx = { operatorId: null, loaded: false, loading: false, visible: false };
+// Cached-lookup data rendered only when its table is first opened
+let pendingApy = null;
+let pendingWithdrawals = null;
+
+function formatApy(val) {
+    return val !== null && val !== undefined ? val.toFixed(2) + '%' : '--%';
+}
+
+// Formatters for table rows, built once rather than per row
+const SHORT_DATE = new Intl.DateTimeFormat('en-US', { month: 'short', day: 'numeric' });
+const SHORT_DATE_YEAR = new Intl.DateTimeFormat('en-US', { month: 'short', day: 'numeric', year: 'numeric' });
+const ETH4 = new Intl.NumberFormat('en-US', { minimumFractionDigits: 4, maximumFractionDigits: 4, useGrouping: false });
+
+// Build the history table body (one row per frame plus the lifetime total),
+// so the tbody is parsed and laid out by a single innerHTML assignment
+function renderHistoryRows(apy) {
+    let totalEth = 0;
+    const rows = apy.frames.map(frame => {
+        totalEth += frame.rewards_eth;
+        const startDate = SHORT_DATE.format(new Date(frame.start_date));
+        const endDate = SHORT_DATE_YEAR.format(new Date(frame.end_date));
+        const rewardApy = frame.apy !== null && frame.apy !== undefined ? frame.apy.toFixed(2) + '%' : '--';
+        const bondApy = frame.bond_apy !== null && frame.bond_apy !== undefined ? frame.bond_apy.toFixed(2) + '%' : '--';
+        const netApy = frame.net_apy !== null && frame.net_apy !== undefined ? frame.net_apy.toFixed(2) + '%' : '--';
+        return `<tr class="border-t border-gray-700">
+            <td class="py-2">${frame.frame_number}</td>
+            <td class="py-2">${startDate} - ${endDate}</td>
+            <td class="py-2 text-right text-green-400">${ETH4.format(frame.rewards_eth)}</td>
+            <td class="py-2 text-right">${frame.validator_count}</td>
+            <td class="py-2 text-right text-green-400">${rewardApy}</td>
+            <td class="py-2 text-right text-green-400">${bondApy}</td>
+            <td class="py-2 text-right text-yellow-400 font-bold">${netApy}</td>
+        </tr>`;
+    });
+
+    // Total row with lifetime APYs
+    const lifetimeRewardApy = apy.lifetime_reward_apy !== null && apy.lifetime_reward_apy !== undefined ? apy.lifetime_reward_apy.toFixed(2) + '%' : '--';
+    const lifetimeBondApy = apy.lifetime_bond_apy !== null && apy.lifetime_bond_apy !== undefined ? apy.lifetime_bond_apy.toFixed(2) + '%' : '--';
+    const lifetimeNetApy = apy.lifetime_net_apy !== null && apy.lifetime_net_apy !== undefined ? apy.lifetime_net_apy.toFixed(2) + '%' : '--';
+    rows.push(`<tr class="border-t-2 border-gray-600 font-bold">
+        <td class="py-2" colspan="2">Lifetime</td>
+        <td class="py-2 text-right text-yellow-400">${ETH4.format(totalEth)}</td>
+        <td class="py-2 text-right">--</td>
+        <td class="py-2 text-right text-green-400">${lifetimeRewardApy}</td>
+        <td class="py-2 text-right text-green-400">${lifetimeBondApy}</td>
+        <td class="py-2 text-right text-yellow-400">${lifetimeNetApy}</td>
+    </tr>`);
+
+    return rows.join('');
+}
+
+// Withdrawal row templates, cloned per record instead of parsing HTML
+const wdRowTpl = document.getElementById('wd-row').content.firstElementChild;
+const wdTotalRowTpl = document.getElementById('wd-total-row').content.firstElementChild;
+
+// unstETH withdrawal request status styling
+const WD_STATUS_COLORS = Object.freeze({
+    pending: 'text-yellow-400',
+    finalized: 'text-blue-400',
+    claimed: 'text-green-400',
+});
+const WD_STATUS_LABELS = Object.freeze({
+    pending: 'Pending',
+    finalized: 'Ready',
+    claimed: 'Claimed',
+});
+
+// Build the withdrawal table body (one row per withdrawal plus the total)
+// as a fragment for a single replaceChildren() call
+function renderWithdrawalRows(withdrawals) {
+    const frag = document.createDocumentFragment();
+    withdrawals.forEach((w, i) => {
+        const wType = w.withdrawal_type || 'stETH';
+        // For unstETH, show claimed ETH if available, otherwise show stETH value
+        const amount = wType === 'unstETH' && w.claimed_eth !== null
+            ? ETH4.format(w.claimed_eth) + ' ETH'
+            : ETH4.format(w.eth_value) + ' stETH';
+
+        const tr = wdRowTpl.cloneNode(true);
+        const cells = tr.children;
+        cells[0].textContent = i + 1;
+        cells[1].textContent = SHORT_DATE_YEAR.format(new Date(w.timestamp));
+        cells[2].firstChild.className = wType === 'unstETH' ? 'text-purple-400' : 'text-blue-400';
+        cells[2].firstChild.textContent = wType;
+        cells[3].textContent = amount;
+
+        // Status for unstETH
+        const status = cells[4].firstChild;
+        if (wType === 'unstETH' && w.status) {
+            status.className = WD_STATUS_COLORS[w.status] || 'text-gray-400';
+            status.textContent = WD_STATUS_LABELS[w.status] || w.status;
+        } else if (wType !== 'unstETH') {
+            status.className = 'text-green-400';
+            status.textContent = 'Claimed';
+        } else {
+            status.textContent = '--';
+        }
+        frag.appendChild(tr);
+    });
+
+    // Add total row
+    let stethTotal = 0;
+    let ethTotal = 0;
+    for (const w of withdrawals) {
+        if (w.withdrawal_type === 'unstETH') {
+            if (w.claimed_eth !== null) ethTotal += w.claimed_eth;
+        } else {
+            stethTotal += w.eth_value;
+        }
+    }
+    let totalStr = '';
+    if (stethTotal > 0) totalStr += ETH4.format(stethTotal) + ' stETH';
+    if (ethTotal > 0) totalStr += (totalStr ? ' + ' : '') + ETH4.format(ethTotal) + ' ETH';
+    if (!totalStr) totalStr = '0';
+
+    const totalRow = wdTotalRowTpl.cloneNode(true);
+    totalRow.children[1].textContent = totalStr;
+    frag.appendChild(totalRow);
+    return frag;
+}
+
+// Reset UI to initial state
+function resetUI() {
+    error.classList.add('hidden');
+    results.classList.add('hidden');
+    validatorStatus.classList.add('hidden');
+    apySection.classList.add('hidden');
+    healthSection.classList.add('hidden');
+    historySection.classList.add('hidden');
+    nextDistribution.classList.add('hidden');
+    historyTable.classList.add('hidden');
+    historyTbody.innerHTML = '';
+    historyLoaded = false;
+    pendingApy = null;
+    loadHistoryBtn.textContent = 'Load History';
+    withdrawalSection.classList.add('hidden');
+    withdrawalTable.classList.add('hidden');
+    withdrawalTbody.innerHTML = '';
+    withdrawalsLoaded = false;
+    pendingWithdrawals = null;
+    loadWithdrawalsBtn.textContent = 'Load Withdrawals';
+    beaconchainLink.classList.add('hidden');
+    beaconchainLink.href = '#';
+    els.apyLifetimeHeader.classList.add('hidden');
+    els.rewardApyLtd.classList.add('hidden');
+    els.bondApyLtd.classList.add('hidden');
+    els.netApyLtd.classList.add('hidden');
+    els.activeSinceRow.classList.add('hidden');
+    els.effectivenessSection.classList.add('hidden');
+    loadDetailsBtn.classList.remove('hidden');
+    loadDetailsBtn.disabled = false;
+    loadDetailsBtn.textContent = 'Load Validator Status & APY (Beacon Chain)';
+
+    const strikesDetailDiv = els.strikesDetail;
+    const strikesList = els.strikesList;
+    if (strikesDetailDiv) strikesDetailDiv.classList.add('hidden');
+    if (strikesList) {
+        strikesList.classList.add('hidden');
+        strikesList.innerHTML = '';
+    }
+    strikesCtx.operatorId = null;
+    strikesCtx.loaded = false;
+    strikesCtx.loading = false;
+    strikesCtx.visible = false;
+}
+
+// Show an element, skipping the class write when it is already visible
+function show(el) {
+    if (el.classList.contains('hidden')) el.classList.remove('hidden');
+}
+
+// Fill the sections shared by a cached lookup and the detailed (beacon
+// chain) response: validator status, effectiveness, APY and health
+function populateCommon(data) {
+    // Validator status breakdown
+    if (data.validators?.by_status) {
+        els.statusActive.textContent = data.validators.by_status.active || 0;
+        els.statusPending.textContent = data.validators.by_status.pending || 0;
+        els.statusExiting.textContent = data.validators.by_status.exiting || 0;
+        els.statusExited.textContent = data.validators.by_status.exited || 0;
+        els.statusSlashed.textContent = data.validators.by_status.slashed || 0;
+        els.statusUnknown.textContent = data.validators.by_status.unknown || 0;
+        show(validatorStatus);
+    }
+
+    // Performance/effectiveness
+    if (data.performance && data.performance.avg_effectiveness !== null) {
+        els.avgEffectiveness.textContent = data.performance.avg_effectiveness.toFixed(1);
+        show(els.effectivenessSection);
+    }
+
+    // APY
+    if (data.apy) {
+        els.rewardApy28d.textContent = formatApy(data.apy.historical_reward_apy_28d);
+        els.rewardApyLtd.textContent = formatApy(data.apy.historical_reward_apy_ltd);
+        els.bondApy28d.textContent = formatApy(data.apy.bond_apy);
+        els.bondApyLtd.textContent = formatApy(data.apy.bond_apy);
+        els.netApy28d.textContent = formatApy(data.apy.net_apy_28d);
+        els.netApyLtd.textContent = formatApy(data.apy.net_apy_ltd);
+
+        if (data.apy.next_distribution_date || data.apy.next_distribution_est_eth) {
+            if (data.apy.next_distribution_date) {
+                const nextDate = new Date(data.apy.next_distribution_date);
+                els.nextDistDate.textContent = SHORT_DATE_YEAR.format(nextDate);
+            }
+            if (data.apy.next_distribution_est_eth) {
+                els.nextDistEth.textContent = ETH4.format(data.apy.next_distribution_est_eth);
+            }
+            show(nextDistribution);
+        }
+
+        show(apySection);
+        show(historySection);
+        show(withdrawalSection);
+    }
+
+    // Active Since
+    if (data.active_since) {
+        els.activeSince.textContent = SHORT_DATE_YEAR.format(new Date(data.active_since));
+        show(els.activeSinceRow);
+    }
+
+    // Health
+    if (data.health) {
+        const h = data.health;
+
+        if (h.bond_healthy) {
+            setStatus(els.healthBond, 'text-green-400', 'HEALTHY');
+        } else {
+            setStatus(els.healthBond, 'text-red-400', `DEFICIT -${ETH4.format(parseFloat(h.bond_deficit_eth))} ETH`);
+        }
+
+        if (h.stuck_validators_count === 0) {
+            setStatus(els.healthStuck, 'text-green-400', '0');
+        } else {
+            setStatus(els.healthStuck, 'text-red-400', `${h.stuck_validators_count} (exit within 4 days!)`);
+        }
+
+        if (h.slashed_validators_count === 0) {
+            setStatus(els.healthSlashed, 'text-green-400', '0');
+        } else {
+            setStatus(els.healthSlashed, 'text-red-400', `${h.slashed_validators_count}`);
+        }
+
+        if (h.validators_at_risk_count === 0) {
+            setStatus(els.healthAtRisk, 'text-green-400', '0');
+        } else {
+            setStatus(els.healthAtRisk, 'text-yellow-400', `${h.validators_at_risk_count}`);
+        }
+
+        // Strikes
+        const strikesDetailDiv = els.strikesDetail;
+        if (h.strikes && h.strikes.total_validators_with_strikes === 0) {
+            setStatus(els.healthStrikes, 'text-green-400', '0 validators');
+            strikesDetailDiv.classList.add('hidden');
+        } else if (h.strikes) {
+            const strikeParts = [];
+            if (h.strikes.validators_at_risk > 0) {
+                strikeParts.push(`${h.strikes.validators_at_risk} at ejection`);
+            }
+            if (h.strikes.validators_near_ejection > 0) {
+                strikeParts.push(`${h.strikes.validators_near_ejection} near ejection`);
+            }
+            const strikeStatus = strikeParts.length > 0 ? strikeParts.join(', ') : 'monitoring';
+            const strikeColor = h.strikes.validators_at_risk > 0 ? 'text-red-400' :
+                (h.strikes.validators_near_ejection > 0 ? 'text-orange-400' : 'text-yellow-400');
+            setStatus(els.healthStrikes, strikeColor, `${h.strikes.total_validators_with_strikes} validators (${strikeStatus})`);
+            show(strikesDetailDiv);
+        }
+
+        show(healthSection);
+    }
+}
+
+// Display operator data in UI (handles both basic and detailed data)
+function displayOperatorData(data) {
+    // Basic info
+    els.operatorId.textContent = data.operator_id;
+    // Handlers read the id from here rather than back out of the DOM
+    document.body.dataset.opId = data.operator_id;
+    els.managerAddress.textContent = data.manager_address;
+    els.rewardAddress.textContent = data.reward_address;
+
+    // Tip
+    els.tipOperatorId.textContent = data.operator_id;
+    els.lookupTip.classList.remove('hidden');
+
+    // Validators
+    els.totalValidators.textContent = data.validators?.total ?? 0;
+    els.activeValidators.textContent = data.validators?.active ?? 0;
+    els.exitedValidators.textContent = data.validators?.exited ?? 0;
+
+    // Rewards
+    els.currentBond.textContent = parseFloat(data.rewards?.current_bond_eth ?? 0).toFixed(6);
+    els.requiredBond.textContent = parseFloat(data.rewards?.required_bond_eth ?? 0).toFixed(6);
+    els.excessBond.textContent = parseFloat(data.rewards?.excess_bond_eth ?? 0).toFixed(6);
+    els.cumulativeRewards.textContent = parseFloat(data.rewards?.cumulative_rewards_eth ?? 0).toFixed(6);
+    els.distributedRewards.textContent = parseFloat(data.rewards?.distributed_eth ?? 0).toFixed(6);
+    els.unclaimedRewards.textContent = parseFloat(data.rewards?.unclaimed_eth ?? 0).toFixed(6);
+    els.totalClaimable.textContent = parseFloat(data.rewards?.total_claimable_eth ?? 0).toFixed(6);
+
+    // Update USD equivalents
+    updateUsdDisplays();
+
+    // Detailed data (if available)
+    populateCommon(data);
+    if (data.validators?.by_status) {
+        // Hide the load button since we have detailed data
+        loadDetailsBtn.classList.add('hidden');
+    }
+
+    // Distribution history and withdrawals (if present in cached data) are
+    // rendered when their table is first opened, not with the main panel
+    if (data.apy?.frames && data.apy.frames.length > 0) {
+        pendingApy = data.apy;
+    }
+    if (data.withdrawals) {
+        pendingWithdrawals = data.withdrawals;
+    }
+
+    // Reveal only once every field is filled in, so the writes above land on
+    // a hidden (unrendered) subtree and the browser lays the panel out once
+    results.classList.remove('hidden');
+}
+
+// Controller for the in-flight lookup; a new submit aborts the previous one
+// so only the latest response is rendered
+let currentLookup = null;
+pageAbortController.signal.addEventListener('abort', () => currentLookup?.abort(), { once: true });
+
+form.addEventListener('submit', async (e) => {
+    e.preventDefault();
+    const input = els.address.value.trim();
+
+    if (!input) return;
+
+    if (currentLookup) currentLookup.abort();
+    const lookup = new AbortController();
+    currentLookup = lookup;
+
+    // Reset UI and show loading
+    loading.classList.remove('hidden');
+    resetUI();
+
+    // A numeric ID is known up front, so check its saved status alongside the
+    // lookup instead of after it
+    currentOperatorSaved = false;
+    const savedCheck = /^\d+$/.test(input) ? checkIfOperatorSaved(input, lookup.signal) : null;
+
+    try {
+        const response = await fetch(`/api/operator/${input}`, { signal: lookup.signal });
+        const data = await response.json();
+        await nextFrame();
+        // Superseded or the page is unloading; skip DOM writes that would be thrown away
+        if (lookup.signal.aborted) return;
+
+        loading.classList.add('hidden');
+
+        if (!response.ok) {
+            error.classList.remove('hidden');
+            errorMessage.textContent = data.detail || 'An error occurred';
+            return;
+        }
+
+        displayOperatorData(data);
+        if (!savedCheck) checkIfOperatorSaved(data.operator_id, lookup.signal);
+    } catch (err) {
+        if (isAbortError(err)) return;  // Superseded or page is unloading, ignore
+        loading.classList.add('hidden');
+        error.classList.remove('hidden');
+        errorMessage.textContent = err.message || 'Network error';
+    }
+});
+
+let isLoadingDetails = false;
+
+loadDetailsBtn.addEventListener('click', async () => {
+    if (isLoadingDetails) return;
+    isLoadingDetails = true;
+
+    const operatorId = document.body.dataset.opId;
+
+    // Show loading, hide button
+    loadDetailsBtn.classList.add('hidden');
+    detailsLoading.classList.remove('hidden');
+
+    try {
+        const response = await fetch(`/api/operator/${operatorId}?detailed=true`, { signal: pageAbortController.signal });
+        // The error body isn't shown here, so only parse successful responses
+        const data = response.ok ? await response.json() : null;
+        await nextFrame();
+        if (pageAbortController.signal.aborted) return;
+
+        detailsLoading.classList.add('hidden');
+
+        if (!data) {
+            loadDetailsBtn.classList.remove('hidden');
+            loadDetailsBtn.textContent = 'Failed - Click to Retry';
+            return;
+        }
+
+        populateCommon(data);
+        show(validatorStatus);
+
+        // Build beaconcha.in dashboard URL with validator indices
+        if (data.validator_details && data.validator_details.length > 0) {
+            const validatorIds = data.validator_details
+                .slice(0, 100)
+                .map(v => v.index ?? v.pubkey)
+                .join(',');
+            beaconchainLink.href = `https://beaconcha.in/dashboard?validators=${validatorIds}`;
+            beaconchainLink.classList.remove('hidden');
+        }
+
+        // Health status overall line and the strikes breakdown
+        if (data.health) {
+            const h = data.health;
+
+            // Load the per-validator strikes list when there are strikes
+            if (h.strikes && h.strikes.total_validators_with_strikes > 0) {
+                strikesCtx.operatorId = operatorId;
+                // Auto-load strikes data once the main thread is idle; the
+                // toggle still loads immediately if clicked before then
+                whenIdle(loadStrikesData);
+            }
+
+            // Overall - color-coded by severity
+            const strikeThreshold = h.strikes.strike_threshold || 3;
+            if (!h.has_issues) {
+                setStatus(els.healthOverall, 'text-green-400', 'No issues detected');
+            } else if (
+                !h.bond_healthy ||
+                h.stuck_validators_count > 0 ||
+                h.slashed_validators_count > 0 ||
+                h.validators_at_risk_count > 0 ||
+                h.strikes.max_strikes >= strikeThreshold
+            ) {
+                // Critical issues (red)
+                let message = 'Issues detected - action required!';
+                if (h.strikes.max_strikes >= strikeThreshold) {
+                    message = `Validator ejectable (${h.strikes.validators_at_risk} at ${strikeThreshold}/${strikeThreshold} strikes)`;
+                }
+                setStatus(els.healthOverall, 'text-red-400', `${message}`);
+            } else if (h.strikes.max_strikes === strikeThreshold - 1) {
+                // Warning level 2 (orange) - one more strike = ejectable
+                setStatus(els.healthOverall, 'text-orange-400', `Warning - ${h.strikes.validators_near_ejection} validator(s) at ${strikeThreshold - 1}/${strikeThreshold} strikes`);
+            } else {
+                // Warning level 1 (yellow) - has strikes but not critical
+                setStatus(els.healthOverall, 'text-yellow-400', 'Warning - validator(s) have strikes');
+            }
+        }
+    } catch (err) {
+        if (isAbortError(err)) return;  // Page is unloading, ignore
+        detailsLoading.classList.add('hidden');
+        loadDetailsBtn.classList.remove('hidden');
+        loadDetailsBtn.textContent = 'Failed - Click to Retry';
+    } finally {
+        isLoadingDetails = false;
+    }
+});
+
+// Fetch and render the strikes list for strikesCtx.operatorId (no-op if
+// already loaded or in flight)
+async function loadStrikesData() {
+    const opId = strikesCtx.operatorId;
+    if (opId === null || strikesCtx.loaded || strikesCtx.loading) return;
+    const strikesList = els.strikesList;
+    strikesCtx.loading = true;
+    strikesCtx.visible = true;
+    strikesList.innerHTML = '<div class="text-gray-400">Loading...</div>';
+    strikesList.classList.remove('hidden');
+    try {
+        const strikesResp = await fetch(`/api/operator/${opId}/strikes`, { signal: pageAbortController.signal });
+        const strikesData = await strikesResp.json();
+        if (strikesCtx.operatorId !== opId) return;  // Another operator is shown now
+        const threshold = strikesData.strike_threshold || 3;
+        const frag = document.createDocumentFragment();
+        for (const v of strikesData.validators) {
+            frag.appendChild(buildStrikeRow(v, threshold, strikesData.frame_dates));
+        }
+        strikesList.replaceChildren(frag);
+        strikesCtx.loaded = true;
+        els.toggleStrikes.textContent = 'Hide validator details ▲';
+    } catch (err) {
+        if (isAbortError(err)) return;  // Page is unloading, ignore
+        if (strikesCtx.operatorId !== opId) return;
+        strikesList.innerHTML = '<div class="text-red-400">Failed to load strikes</div>';
+    } finally {
+        if (strikesCtx.operatorId === opId) strikesCtx.loading = false;
+    }
+}
+
+// Strikes toggle: installed once, driven by strikesCtx
+els.toggleStrikes.addEventListener('click', async () => {
+    if (!strikesCtx.visible && !strikesCtx.loaded) {
+        await loadStrikesData();
+        return;
+    }
+    strikesCtx.visible = !strikesCtx.visible;
+    els.strikesList.classList.toggle('hidden', !strikesCtx.visible);
+    els.toggleStrikes.textContent = strikesCtx.visible ? 'Hide validator details ▲' : 'Show validator details ▼';
+});
+
+// History button handler
+loadHistoryBtn.addEventListener('click', async () => {
+    if (historyLoaded) {
+        // Toggle visibility
+        historyTable.classList.toggle('hidden');
+        loadHistoryBtn.textContent = historyTable.classList.contains('hidden')
+            ? 'Load History' : 'Hide History';
+        return;
+    }
+
+    if (pendingApy) {
+        historyTbody.innerHTML = renderHistoryRows(pendingApy);
+        pendingApy = null;
+        historyTable.classList.remove('hidden');
+        historyLoaded = true;
+        loadHistoryBtn.textContent = 'Hide History';
+        return;
+    }
+
+    const operatorId = document.body.dataset.opId;
+    historyLoading.classList.remove('hidden');
+    historyTable.classList.add('hidden');
+
+    try {
+        const response = await fetch(`/api/operator/${operatorId}?detailed=true&history=true`, { signal: pageAbortController.signal });
+        const data = response.ok ? await response.json() : null;
+
+        historyLoading.classList.add('hidden');
+
+        if (!data || !data.apy || !data.apy.frames) {
+            historyTbody.innerHTML = '<tr><td colspan="7" class="py-4 text-center text-gray-400">No history available</td></tr>';
+            historyTable.classList.remove('hidden');
+            return;
+        }
+
+        historyTbody.innerHTML = renderHistoryRows(data.apy);
+
+        // Reveal and populate lifetime APY columns
+        if (data.apy) {
+            els.apyLifetimeHeader.classList.remove('hidden');
+            els.rewardApyLtd.textContent = formatApy(data.apy.lifetime_reward_apy);
+            els.rewardApyLtd.classList.remove('hidden');
+            els.bondApyLtd.textContent = formatApy(data.apy.lifetime_bond_apy);
+            els.bondApyLtd.classList.remove('hidden');
+            els.netApyLtd.textContent = formatApy(data.apy.lifetime_net_apy);
+            els.netApyLtd.classList.remove('hidden');
+        }
+
+        historyTable.classList.remove('hidden');
+        historyLoaded = true;
+        loadHistoryBtn.textContent = 'Hide History';
+    } catch (err) {
+        if (isAbortError(err)) return;  // Page is unloading, ignore
+        historyLoading.classList.add('hidden');
+        historyTbody.innerHTML = '<tr><td colspan="7" class="py-4 text-center text-red-400">Failed to load history</td></tr>';
+        historyTable.classList.remove('hidden');
+    }
+});
+
+// Withdrawal button handler
+loadWithdrawalsBtn.addEventListener('click', async () => {
+    if (withdrawalsLoaded) {
+        // Toggle visibility
+        withdrawalTable.classList.toggle('hidden');
+        loadWithdrawalsBtn.textContent = withdrawalTable.classList.contains('hidden')
+            ? 'Load Withdrawals' : 'Hide Withdrawals';
+        return;
+    }
+
+    if (pendingWithdrawals) {
+        if (pendingWithdrawals.length > 0) {
+            withdrawalTbody.replaceChildren(renderWithdrawalRows(pendingWithdrawals));
+        } else {
+            withdrawalTbody.innerHTML = NO_WITHDRAWALS_ROW;
+        }
+        pendingWithdrawals = null;
+        withdrawalTable.classList.remove('hidden');
+        withdrawalsLoaded = true;
+        loadWithdrawalsBtn.textContent = 'Hide Withdrawals';
+        return;
+    }
+
+    const operatorId = document.body.dataset.opId;
+    withdrawalLoading.classList.remove('hidden');
+    withdrawalTable.classList.add('hidden');
+
+    try {
+        const response = await fetch(`/api/operator/${operatorId}?withdrawals=true`, { signal: pageAbortController.signal });
+        const data = response.ok ? await response.json() : null;
+
+        withdrawalLoading.classList.add('hidden');
+
+        if (!data || !data.withdrawals || data.withdrawals.length === 0) {
+            withdrawalTbody.innerHTML = NO_WITHDRAWALS_ROW;
+            withdrawalTable.classList.remove('hidden');
+            withdrawalsLoaded = true;
+            loadWithdrawalsBtn.textContent = 'Hide Withdrawals';
+            return;
+        }
+
+        withdrawalTbody.replaceChildren(renderWithdrawalRows(data.withdrawals));
+
+        withdrawalTable.classList.remove('hidden');
+        withdrawalsLoaded = true;
+        loadWithdrawalsBtn.textContent = 'Hide Withdrawals';
+    } catch (err) {
+        if (isAbortError(err)) return;  // Page is unloading, ignore
+        withdrawalLoading.classList.add('hidden');
+        withdrawalTbody.innerHTML = '<tr><td colspan="5" class="py-4 text-center text-red-400">Failed to load withdrawals</td></tr>';
+        withdrawalTable.classList.remove('hidden');
+    }
+});
+
+// ===== SAVED OPERATORS FUNCTIONALITY =====
+const savedOperatorsSection = document.getElementById('saved-operators-section');
+const savedOperatorsList = document.getElementById('saved-operators-list');
+const savedOperatorsLoading = document.getElementById('saved-operators-loading');
+const refreshAllBtn = document.getElementById('refresh-all-btn');
+const saveOperatorBtn = document.getElementById('save-operator-btn');
+
+let currentOperatorSaved = false;
+let savedOperatorsData = {};  // Store operator data by ID for quick lookup
+const SAVED_OPERATORS_STORAGE_KEY = 'savedOperatorsData';
+
+// Mirror savedOperatorsData to localStorage so the next page load can paint
+// the saved cards before /api/saved-operators responds
+function persistSavedOperators() {
+    try {
+        localStorage.setItem(SAVED_OPERATORS_STORAGE_KEY, JSON.stringify(savedOperatorsData));
+    } catch (err) {
+        // Storage full or disabled; the server copy stays authoritative
+    }
+}
+
+// Relative-time labels keyed by timestamp and 30s bucket, so re-rendering
+// the saved cards reuses them; cleared wholesale once it grows past the limit
+const RELATIVE_TIME_BUCKET_MS = 30000;
+const RELATIVE_TIME_CACHE_SIZE = 256;
+const relativeTimeCache = new Map();
+
+// Format relative time with precision
+function formatRelativeTime(isoString) {
+    const key = isoString + ':' + Math.floor(Date.now() / RELATIVE_TIME_BUCKET_MS);
+    let label = relativeTimeCache.get(key);
+    if (label === undefined) {
+        if (relativeTimeCache.size >= RELATIVE_TIME_CACHE_SIZE) relativeTimeCache.clear();
+        label = computeRelativeTime(isoString);
+        relativeTimeCache.set(key, label);
+    }
+    return label;
+}
+
+function computeRelativeTime(isoString) {
+    const date = new Date(isoString);
+    const now = new Date();
+    const diffMs = now - date;
+    const diffSecs = Math.floor(diffMs / 1000);
+    const diffMins = Math.floor(diffMs / 60000);
+    const diffHours = Math.floor(diffMs / 3600000);
+    const diffDays = Math.floor(diffMs / 86400000);
+
+    if (diffSecs < 60) return 'just now';
+    if (diffMins < 60) return `${diffMins} min ago`;
+    if (diffHours < 24) {
+        const mins = diffMins % 60;
+        if (mins === 0) return `${diffHours}h ago`;
+        return `${diffHours}h ${mins}m ago`;
+    }
+    if (diffDays < 7) {
+        const hours = diffHours % 24;
+        if (hours === 0) return `${diffDays}d ago`;
+        return `${diffDays}d ${hours}h ago`;
+    }
+    return `${diffDays}d ago`;
+}
+
+// Display values for a saved operator card
+function savedCardFields(op) {
+    const claimableEth = parseFloat(op.rewards?.total_claimable_eth ?? 0);
+    const claimable = ETH4.format(claimableEth);
+    const claimableUsd = formatUsd(claimableEth);
+
+    // Health indicator
+    let healthColor = 'bg-green-500';
+    if (op.health?.has_issues) {
+        if (!op.health.bond_healthy || op.health.slashed_validators_count > 0 || op.health.stuck_validators_count > 0) {
+            healthColor = 'bg-red-500';
+        } else {
+            healthColor = 'bg-yellow-500';
+        }
+    }
+
+    return {
+        claimable: `${claimable} ETH`,
+        claimableUsd: claimableUsd ? ` (${claimableUsd})` : '',
+        validators: op.validators?.active ?? 0,
+        updatedAt: `Updated ${op._updated_at ? formatRelativeTime(op._updated_at) : 'unknown'}`,
+        healthClass: `w-2 h-2 rounded-full ${healthColor} inline-block`,
+    };
+}
+
+const savedOpTpl = document.getElementById('saved-op-tpl').content.firstElementChild;
+
+// Build a single saved operator card from its template
+function renderSavedOperatorCard(op) {
+    const card = savedOpTpl.cloneNode(true);
+    const operatorId = op.operator_id;
+    card.dataset.operatorId = operatorId;
+    card.querySelector('.js-label').textContent = `Operator #${operatorId}`;
+    card.querySelector('.js-view').addEventListener('click', () => viewSavedOperator(operatorId));
+    card.querySelector('.js-refresh').addEventListener('click', (e) => refreshSavedOperator(operatorId, e.currentTarget));
+    card.querySelector('.js-remove').addEventListener('click', (e) => removeSavedOperator(operatorId, e.currentTarget));
+    updateSavedOperatorCard(card, op);
+    return card;
+}
+
+// Update an existing saved operator card in place (text and health dot
+// only), keeping its nodes and listeners instead of re-parsing the card
+function updateSavedOperatorCard(card, op) {
+    const f = savedCardFields(op);
+    card.querySelector('.js-health').className = `js-health ${f.healthClass}`;
+    card.querySelector('.js-updated').textContent = f.updatedAt;
+    card.querySelector('.js-validators').textContent = f.validators;
+    card.querySelector('.js-claimable').textContent = f.claimable;
+    card.querySelector('.js-claimable-usd').textContent = f.claimableUsd;
+}
+
+// Saved operator card elements by operator id, so handlers find a card
+// without querying the document
+const savedOperatorCards = new Map();
+
+// Render the saved operator list and index its cards
+function renderSavedOperatorList(operators) {
+    const frag = document.createDocumentFragment();
+    savedOperatorCards.clear();
+    for (const op of operators) {
+        const card = renderSavedOperatorCard(op);
+        savedOperatorCards.set(Number(op.operator_id), card);
+        frag.appendChild(card);
+    }
+    savedOperatorsList.replaceChildren(frag);
+}
+
+// Remove a saved operator's card, hiding the section once it is empty
+function removeSavedOperatorCard(operatorId) {
+    const card = savedOperatorCards.get(Number(operatorId));
+    if (card) card.remove();
+    savedOperatorCards.delete(Number(operatorId));
+    if (savedOperatorCards.size === 0) {
+        savedOperatorsSection.classList.add('hidden');
+    }
+}
+
+// Refresh the saved operator cards in place (called when ETH price updates)
+function rerenderSavedOperators() {
+    for (const [operatorId, card] of savedOperatorCards) {
+        const op = savedOperatorsData[operatorId];
+        if (op) updateSavedOperatorCard(card, op);
+    }
+}
+
+// Coalesce saved-card refreshes to at most one per frame
+let savedCardsUpdateQueued = false;
+function scheduleSavedCardsUpdate() {
+    if (savedCardsUpdateQueued) return;
+    savedCardsUpdateQueued = true;
+    requestAnimationFrame(() => {
+        savedCardsUpdateQueued = false;
+        rerenderSavedOperators();
+    });
+}
+
+// Load saved operators on page load
+async function loadSavedOperators() {
+    try {
+        const response = await fetch('/api/saved-operators', { signal: pageAbortController.signal });
+        // Keep the cards painted from localStorage if the server can't answer
+        if (!response.ok) return;
+        const data = await response.json();
+
+        if (data.operators && data.operators.length > 0) {
+            // Store data for quick lookup
+            savedOperatorsData = {};
+            data.operators.forEach(op => {
+                savedOperatorsData[op.operator_id] = op;
+            });
+            renderSavedOperatorList(data.operators);
+            savedOperatorsSection.classList.remove('hidden');
+        } else {
+            savedOperatorsData = {};
+            renderSavedOperatorList([]);
+            savedOperatorsSection.classList.add('hidden');
+        }
+        persistSavedOperators();
+    } catch (err) {
+        if (!isAbortError(err)) {
+            console.error('Failed to load saved operators:', err);
+        }
+    }
+}
+
+// View a saved operator (display cached data directly)
+window.viewSavedOperator = function(operatorId) {
+    const opData = savedOperatorsData[operatorId];
+    if (!opData) {
+        // Fallback to API fetch if data not in cache
+        els.address.value = operatorId;
+        form.dispatchEvent(new Event('submit', { bubbles: true, cancelable: true }));
+        return;
+    }
+
+    // Display cached data directly, dropping any lookup still in flight
+    if (currentLookup) currentLookup.abort();
+    els.address.value = operatorId;
+    resetUI();
+    displayOperatorData(opData);
+
+    // Update save button state
+    currentOperatorSaved = true;
+    updateSaveButton();
+};
+
+// Refresh a saved operator
+window.refreshSavedOperator = async function(operatorId, btn) {
+    const originalText = btn.textContent;
+    btn.innerHTML = '<span class="inline-block animate-spin">&#8635;</span>';
+    btn.disabled = true;
+
+    try {
+        const response = await fetch(`/api/operator/${operatorId}/refresh`, { method: 'POST', signal: pageAbortController.signal });
+        if (response.ok) {
+            const data = await response.json();
+            // Update the card in the list and stored data
+            const card = savedOperatorCards.get(Number(operatorId));
+            if (card && data.data) {
+                data.data._updated_at = new Date().toISOString();
+                savedOperatorsData[operatorId] = data.data;  // Update stored data
+                persistSavedOperators();
+                updateSavedOperatorCard(card, data.data);
+            }
+        }
+    } catch (err) {
+        if (!isAbortError(err)) {
+            console.error('Failed to refresh operator:', err);
+        }
+    } finally {
+        btn.innerHTML = originalText;
+        btn.disabled = false;
+    }
+};
+
+// Remove a saved operator
+window.removeSavedOperator = async function(operatorId, btn) {
+    const originalText = btn.textContent;
+    btn.innerHTML = '<span class="inline-block animate-spin">&#8635;</span>';
+    btn.disabled = true;
+
+    try {
+        const response = await fetch(`/api/operator/${operatorId}/save`, { method: 'DELETE', signal: pageAbortController.signal });
+        if (response.ok) {
+            delete savedOperatorsData[operatorId];  // Remove from stored data
+            persistSavedOperators();
+            removeSavedOperatorCard(operatorId);
+
+            // Update save button if viewing this operator
+            const currentOpId = document.body.dataset.opId;
+            if (currentOpId == operatorId) {
+                currentOperatorSaved = false;
+                updateSaveButton();
+            }
+        }
+    } catch (err) {
+        if (!isAbortError(err)) {
+            console.error('Failed to remove operator:', err);
+            btn.innerHTML = originalText;
+            btn.disabled = false;
+        }
+    }
+};
+
+// Parse a newline-delimited JSON response body, yielding each object as
+// soon as its line has arrived
+async function* readNdjson(response) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    while (true) {
+        const { value, done } = await reader.read();
+        buffer += decoder.decode(value, { stream: !done });
+        let newline;
+        while ((newline = buffer.indexOf('\n')) !== -1) {
+            const line = buffer.slice(0, newline);
+            buffer = buffer.slice(newline + 1);
+            if (line) yield JSON.parse(line);
+        }
+        if (done) break;
+    }
+    if (buffer) yield JSON.parse(buffer);
+}
+
+// Refresh all saved operators
+refreshAllBtn.addEventListener('click', async () => {
+    const originalText = refreshAllBtn.textContent;
+    refreshAllBtn.disabled = true;
+
+    refreshAllBtn.innerHTML = '<span class="inline-block animate-spin mr-1">&#8635;</span> Refreshing';
+
+    try {
+        // One NDJSON line per operator, sent as each refresh completes, so
+        // cards update progressively instead of after the slowest operator
+        const response = await fetch('/api/saved-operators/refresh/stream', { method: 'POST', signal: pageAbortController.signal });
+        if (response.ok) {
+            for await (const op of readNdjson(response)) {
+                if (op.error) {
+                    const card = savedOperatorCards.get(op.operator_id);
+                    if (card) card.querySelector('.js-updated').textContent = 'Refresh failed';
+                    continue;
+                }
+                op._updated_at = new Date().toISOString();
+                savedOperatorsData[op.operator_id] = op;  // Update stored data
+                const card = savedOperatorCards.get(op.operator_id);
+                if (card) updateSavedOperatorCard(card, op);
+            }
+            persistSavedOperators();
+        }
+    } catch (err) {
+        if (!isAbortError(err)) {
+            console.error('Failed to refresh saved operators:', err);
+        }
+    }
+
+    refreshAllBtn.innerHTML = originalText;
+    refreshAllBtn.disabled = false;
+});
+
+// Update save button state
+function updateSaveButton() {
+    if (currentOperatorSaved) {
+        saveOperatorBtn.textContent = 'Saved';
+        saveOperatorBtn.classList.remove('bg-yellow-600', 'hover:bg-yellow-700');
+        saveOperatorBtn.classList.add('bg-gray-600', 'hover:bg-gray-700');
+    } else {
+        saveOperatorBtn.textContent = 'Save';
+        saveOperatorBtn.classList.remove('bg-gray-600', 'hover:bg-gray-700');
+        saveOperatorBtn.classList.add('bg-yellow-600', 'hover:bg-yellow-700');
+    }
+}
+
+// Check if current operator is saved
+async function checkIfOperatorSaved(operatorId, signal = pageAbortController.signal) {
+    try {
+        const response = await fetch(`/api/operator/${operatorId}/saved`, { signal });
+        if (!response.ok) return;
+        const data = await response.json();
+        if (signal.aborted) return;
+        currentOperatorSaved = data.saved;
+        updateSaveButton();
+    } catch (err) {
+        if (!isAbortError(err)) {
+            console.error('Failed to check if operator is saved:', err);
+        }
+    }
+}
+
+// Save/unsave operator button handler
+saveOperatorBtn.addEventListener('click', async () => {
+    const operatorId = document.body.dataset.opId;
+    if (!operatorId) return;
+
+    saveOperatorBtn.disabled = true;
+    saveOperatorBtn.innerHTML = '<span class="inline-block animate-spin">&#8635;</span>';
+
+    try {
+        if (currentOperatorSaved) {
+            // Unsave
+            const response = await fetch(`/api/operator/${operatorId}/save`, { method: 'DELETE', signal: pageAbortController.signal });
+            if (response.ok) {
+                currentOperatorSaved = false;
+                delete savedOperatorsData[operatorId];  // Remove from stored data
+                persistSavedOperators();
+                // Remove from saved list
+                removeSavedOperatorCard(operatorId);
+            }
+        } else {
+            // Save
+            const response = await fetch(`/api/operator/${operatorId}/save`, { method: 'POST', signal: pageAbortController.signal });
+            if (response.ok) {
+                currentOperatorSaved = true;
+                // Reload saved operators to show the new one
+                await loadSavedOperators();
+            }
+        }
+    } catch (err) {
+        if (!isAbortError(err)) {
+            console.error('Failed to save/unsave operator:', err);
+        }
+    } finally {
+        saveOperatorBtn.disabled = false;
+        updateSaveButton();
+    }
+});
+
+// Paint the saved cards from the last visit right away, then revalidate
+// them against the server
+try {
+    const stored = JSON.parse(localStorage.getItem(SAVED_OPERATORS_STORAGE_KEY) || '{}');
+    if (Object.keys(stored).length > 0) {
+        savedOperatorsData = stored;
+        renderSavedOperatorList(Object.values(stored));
+        savedOperatorsSection.classList.remove('hidden');
+    }
+} catch (err) {
+    // Unreadable or disabled storage; wait for the server list
+}
+
+// Load saved operators on page load
+loadSavedOperators();
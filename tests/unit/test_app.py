@@ -0,0 +1,273 @@
+"""Tests for the FastAPI application."""
+
+import logging
+from logging.handlers import QueueHandler
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.core.config import Settings
+from src.services.operator_service import get_operator_service
+from src.web import app as app_module
+from src.web import routes
+from src.web.app import APP_JS_VERSION, INDEX_ETAG, OrjsonResponse, create_app
+
+
+class TestIndex:
+    """Tests for the index page."""
+
+    def test_serves_page_with_etag(self):
+        client = TestClient(create_app())
+
+        response = client.get("/")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/html")
+        assert response.headers["etag"] == INDEX_ETAG
+        assert b"CSM Operator Dashboard" in response.content
+
+    def test_matching_etag_returns_not_modified(self):
+        client = TestClient(create_app())
+
+        response = client.get("/", headers={"If-None-Match": INDEX_ETAG})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_gzip_when_accepted(self):
+        client = TestClient(create_app())
+
+        response = client.get("/", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert b"CSM Operator Dashboard" in response.content
+
+    def test_repeat_requests_are_independent(self):
+        # Middleware (gzip, Server-Timing) edits response headers in place,
+        # so the page must not be served from one shared Response object
+        client = TestClient(create_app())
+
+        plain = client.get("/", headers={"Accept-Encoding": "identity"})
+        compressed = [client.get("/", headers={"Accept-Encoding": "gzip"}) for _ in range(2)]
+        plain_again = client.get("/", headers={"Accept-Encoding": "identity"})
+
+        assert [r.headers.get("content-encoding") for r in compressed] == ["gzip", "gzip"]
+        assert "content-encoding" not in plain_again.headers
+        assert plain_again.content == plain.content
+
+
+class TestStaticFiles:
+    """Tests for the /img and /static mounts."""
+
+    def test_sets_cache_control(self):
+        client = TestClient(create_app())
+
+        response = client.get("/img/favicon.ico")
+
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "public, max-age=86400"
+        assert "etag" in response.headers
+
+    def test_app_script_is_versioned_and_immutable(self):
+        client = TestClient(create_app())
+
+        page = client.get("/")
+        script = client.get(f"/static/app.js?v={APP_JS_VERSION}")
+
+        assert f'src="/static/app.js?v={APP_JS_VERSION}"'.encode() in page.content
+        assert script.status_code == 200
+        assert script.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+
+class TestRequestLogging:
+    """Tests for the request logging middleware."""
+
+    def test_logs_page_requests(self, caplog):
+        client = TestClient(create_app())
+
+        with caplog.at_level(logging.INFO, logger="src.web.app"):
+            client.get("/")
+
+        assert "Request: GET /" in caplog.messages
+        assert any(m.startswith("Response: GET / -> 200 (") for m in caplog.messages)
+
+    def test_sets_server_timing(self):
+        client = TestClient(create_app())
+
+        response = client.get("/")
+
+        assert response.headers["server-timing"].startswith("app;dur=")
+
+    def test_skips_static_assets(self, caplog):
+        client = TestClient(create_app())
+
+        with caplog.at_level(logging.INFO, logger="src.web.app"):
+            client.get("/img/favicon.ico")
+
+        assert caplog.messages == []
+
+
+class TestLogListener:
+    """Tests for the queued logging setup."""
+
+    def test_handlers_restored_after_shutdown(self):
+        root = logging.getLogger()
+        before = list(root.handlers)
+
+        with TestClient(create_app()):
+            assert any(isinstance(h, QueueHandler) for h in root.handlers)
+
+        assert root.handlers == before
+
+
+class TestPriceEndpoint:
+    """Tests for /api/price/eth."""
+
+    def test_sets_cache_control(self, monkeypatch):
+        async def fake_price():
+            return 3000.5
+
+        monkeypatch.setattr(routes, "get_eth_price", fake_price)
+        client = TestClient(create_app())
+
+        response = client.get("/api/price/eth")
+
+        assert response.json() == {"price": 3000.5, "currency": "USD"}
+        assert response.headers["cache-control"] == "public, max-age=60"
+
+
+class TestOperatorEndpoint:
+    """Tests for the /api/operator/{identifier} response cache."""
+
+    def setup_method(self):
+        routes._operator_responses.clear()
+
+    def fake_build(self, monkeypatch):
+        calls = []
+
+        async def fake_build_response(identifier, detailed, history, withdrawals):
+            calls.append(identifier)
+            return {"operator_id": int(identifier)}
+
+        monkeypatch.setattr(routes, "_build_operator_response", fake_build_response)
+        return calls
+
+    def test_reuses_response_and_sets_etag(self, monkeypatch):
+        calls = self.fake_build(monkeypatch)
+        client = TestClient(create_app())
+
+        first = client.get("/api/operator/7")
+        second = client.get("/api/operator/7")
+
+        assert calls == ["7"]
+        assert first.json() == {"operator_id": 7}
+        assert second.headers["etag"] == first.headers["etag"]
+        assert first.headers["cache-control"] == "public, max-age=15, stale-while-revalidate=60"
+
+    def test_returns_304_for_matching_etag(self, monkeypatch):
+        self.fake_build(monkeypatch)
+        client = TestClient(create_app())
+        etag = client.get("/api/operator/7").headers["etag"]
+
+        response = client.get("/api/operator/7", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_query_flags_are_cached_separately(self, monkeypatch):
+        calls = self.fake_build(monkeypatch)
+        client = TestClient(create_app())
+
+        client.get("/api/operator/7")
+        client.get("/api/operator/7?detailed=true")
+
+        assert calls == ["7", "7"]
+
+
+class TestRefreshStream:
+    """Tests for /api/saved-operators/refresh/stream."""
+
+    def test_streams_one_line_per_operator_and_saves(self, monkeypatch):
+        saved = []
+
+        async def fake_addresses():
+            return [(1, "0xm1", "0xr1"), (2, "0xm2", "0xr2"), (3, "0xm3", "0xr3")]
+
+        async def fake_save(items):
+            saved.extend(items)
+
+        class FakeService:
+            async def iter_operators_by_ids(self, operator_ids, **kwargs):
+                yield 2, 2
+                yield 1, RuntimeError("boom")
+                yield 3, None
+
+        monkeypatch.setattr(routes, "list_saved_addresses", fake_addresses)
+        monkeypatch.setattr(routes, "update_operators_bulk", fake_save)
+        monkeypatch.setattr(routes, "get_operator_service", FakeService)
+        monkeypatch.setattr(routes, "_build_saved_operator_data", lambda r: {"operator_id": r})
+        client = TestClient(create_app())
+
+        response = client.post("/api/saved-operators/refresh/stream")
+
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert response.text == '{"operator_id":2}\n{"operator_id":1,"error":"boom"}\n'
+        assert saved == [(2, {"operator_id": 2})]
+
+    def test_saves_completed_results_when_stream_stops_early(self, monkeypatch):
+        saved = []
+
+        async def fake_addresses():
+            return [(1, "0xm1", "0xr1"), (2, "0xm2", "0xr2")]
+
+        async def fake_save(items):
+            saved.extend(items)
+
+        class FakeService:
+            async def iter_operators_by_ids(self, operator_ids, **kwargs):
+                yield 1, 1
+                raise RuntimeError("connection lost")
+
+        monkeypatch.setattr(routes, "list_saved_addresses", fake_addresses)
+        monkeypatch.setattr(routes, "update_operators_bulk", fake_save)
+        monkeypatch.setattr(routes, "get_operator_service", FakeService)
+        monkeypatch.setattr(routes, "_build_saved_operator_data", lambda r: {"operator_id": r})
+        client = TestClient(create_app(), raise_server_exceptions=False)
+
+        client.post("/api/saved-operators/refresh/stream")
+
+        assert saved == [(1, {"operator_id": 1})]
+
+
+class TestSharedService:
+    """Tests for the shared OperatorService used by the routes."""
+
+    @pytest.mark.asyncio
+    async def test_service_is_reused(self):
+        assert get_operator_service() is get_operator_service()
+
+
+class TestApiDocs:
+    """Tests for the api_docs_enabled setting."""
+
+    def test_docs_served_by_default(self):
+        client = TestClient(create_app())
+
+        assert client.get("/openapi.json").status_code == 200
+
+    def test_docs_disabled(self, monkeypatch):
+        monkeypatch.setattr(app_module, "get_settings", lambda: Settings(api_docs_enabled=False))
+        client = TestClient(create_app())
+
+        assert client.get("/openapi.json").status_code == 404
+        assert client.get("/docs").status_code == 404
+
+
+class TestOrjsonResponse:
+    """Tests for the default JSON response class."""
+
+    def test_renders_compact_json(self):
+        assert OrjsonResponse({"a": 1.5, "b": None}).body == b'{"a":1.5,"b":null}'
+
+    def test_renders_big_integers(self):
+        assert OrjsonResponse({"shares": 2**70}).body == b'{"shares": 1180591620717411303424}'
@@ -0,0 +1,163 @@
+"""Tests for the beaconcha.in validator provider."""
+
+import json
+
+import httpx
+import pytest
+
+from src.data import beacon
+from src.data.beacon import (
+    BeaconDataProvider,
+    ValidatorInfo,
+    ValidatorStatus,
+    aggregate_validator_status,
+    calculate_avg_effectiveness,
+    count_at_risk_validators,
+    count_slashed_validators,
+    get_earliest_activation,
+    summarize_validators,
+)
+from src.data.http_client import close_http_client
+
+
+async def fetch(provider: BeaconDataProvider, pubkeys: list[str]) -> list:
+    """Call get_validators_by_pubkeys starting from an empty validator cache."""
+    beacon._validator_cache.clear()
+    try:
+        return await provider.get_validators_by_pubkeys(pubkeys)
+    finally:
+        await close_http_client()
+
+
+def pubkey(n: int) -> str:
+    return "0x" + f"{n:096x}"
+
+
+def requested_keys(request: httpx.Request) -> list[str]:
+    assert request.method == "POST"
+    return json.loads(request.content)["indicesOrPubkey"].split(",")
+
+
+class TestGetValidatorsByPubkeys:
+    """Tests for batching and deduplication of pubkey lookups."""
+
+    @pytest.mark.asyncio
+    async def test_duplicates_are_requested_once(self, httpx_mock):
+        requested = []
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            keys = requested_keys(request)
+            requested.extend(keys)
+            data = [{"pubkey": k, "validatorindex": 1, "status": "active_online"} for k in keys]
+            return httpx.Response(200, json={"data": data})
+
+        httpx_mock.add_callback(respond)
+
+        provider = BeaconDataProvider()
+        provider.BATCH_INTERVAL = 0
+        mixed_case = "0x" + pubkey(0xABC)[2:].upper()
+        validators = await fetch(provider, [pubkey(0xABC), pubkey(2), mixed_case])
+
+        assert sorted(requested) == sorted([pubkey(0xABC), pubkey(2)])
+        assert [v.pubkey for v in validators] == [pubkey(0xABC), pubkey(2)]
+
+    @pytest.mark.asyncio
+    async def test_batches_keep_order_and_mark_failures_unknown(self, httpx_mock):
+        def respond(request: httpx.Request) -> httpx.Response:
+            keys = requested_keys(request)
+            if pubkey(0) in keys:
+                return httpx.Response(500)
+            data = [{"pubkey": k, "status": "active_online"} for k in keys]
+            return httpx.Response(200, json={"data": data})
+
+        httpx_mock.add_callback(respond, is_reusable=True)
+
+        provider = BeaconDataProvider()
+        provider.BATCH_INTERVAL = 0
+        keys = [pubkey(n) for n in range(250)]
+        validators = await fetch(provider, keys)
+
+        assert [v.pubkey for v in validators] == keys
+        assert {v.status for v in validators[:100]} == {ValidatorStatus.UNKNOWN}
+        assert validators[100].status != ValidatorStatus.UNKNOWN
+
+    @pytest.mark.asyncio
+    async def test_cached_per_pubkey_until_epoch_changes(self, httpx_mock, monkeypatch):
+        requested = []
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            keys = requested_keys(request)
+            requested.append(sorted(keys))
+            data = [{"pubkey": k, "status": "active_online"} for k in keys]
+            return httpx.Response(200, json={"data": data})
+
+        httpx_mock.add_callback(respond, is_reusable=True)
+        monkeypatch.setattr(beacon, "current_epoch", lambda: 100)
+
+        provider = BeaconDataProvider()
+        provider.BATCH_INTERVAL = 0
+        await fetch(provider, [pubkey(1)])
+        try:
+            validators = await provider.get_validators_by_pubkeys([pubkey(1), pubkey(2)])
+            assert [v.pubkey for v in validators] == [pubkey(1), pubkey(2)]
+
+            monkeypatch.setattr(beacon, "current_epoch", lambda: 101)
+            await provider.get_validators_by_pubkeys([pubkey(1)])
+        finally:
+            await close_http_client()
+
+        assert requested == [[pubkey(1)], [pubkey(2)], [pubkey(1)]]
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded(self, httpx_mock, monkeypatch):
+        def respond(request: httpx.Request) -> httpx.Response:
+            data = [{"pubkey": k, "status": "active_online"} for k in requested_keys(request)]
+            return httpx.Response(200, json={"data": data})
+
+        httpx_mock.add_callback(respond, is_reusable=True)
+        monkeypatch.setattr(beacon, "current_epoch", lambda: 100)
+        monkeypatch.setattr(beacon, "VALIDATOR_CACHE_SIZE", 3)
+
+        provider = BeaconDataProvider()
+        provider.BATCH_INTERVAL = 0
+        await fetch(provider, [pubkey(n) for n in range(5)])
+        assert list(beacon._validator_cache) == [pubkey(2), pubkey(3), pubkey(4)]
+
+        # Entries from a previous epoch are dropped, not kept until looked up
+        monkeypatch.setattr(beacon, "current_epoch", lambda: 101)
+        try:
+            await provider.get_validators_by_pubkeys([pubkey(9)])
+        finally:
+            await close_http_client()
+        assert list(beacon._validator_cache) == [pubkey(9)]
+
+
+class TestSummarizeValidators:
+    """summarize_validators must match the individual helper functions."""
+
+    def test_matches_individual_helpers(self):
+        validators = [
+            ValidatorInfo(
+                pubkey=pubkey(n),
+                status=status,
+                balance_gwei=31_900_000_000 if n % 3 == 0 else 32_010_000_000,
+                effectiveness=95.0 + n if n % 2 else None,
+                activation_epoch=300_000 - n if status.is_active or status.is_exited else None,
+            )
+            for n, status in enumerate(list(ValidatorStatus) * 3)
+        ]
+
+        summary = summarize_validators(validators)
+
+        assert summary.by_status == aggregate_validator_status(validators)
+        assert summary.avg_effectiveness == calculate_avg_effectiveness(validators)
+        assert summary.slashed_count == count_slashed_validators(validators)
+        assert summary.at_risk_count == count_at_risk_validators(validators)
+        assert summary.earliest_activation == get_earliest_activation(validators)
+
+    def test_empty(self):
+        summary = summarize_validators([])
+
+        assert summary.by_status == aggregate_validator_status([])
+        assert summary.avg_effectiveness is None
+        assert summary.earliest_activation is None
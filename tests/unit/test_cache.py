@@ -1,7 +1,9 @@
 """Tests for the cache module."""
 
+import asyncio
+import time
+
 import pytest
-from datetime import datetime, timedelta
 from unittest.mock import patch
 
 from src.data.cache import SimpleCache, cached, get_cache
@@ -30,8 +32,7 @@ class TestSimpleCache:
         assert cache.get("key1") == "value1"
 
         # Mock time to be past expiry
-        with patch("src.data.cache.datetime") as mock_datetime:
-            mock_datetime.now.return_value = datetime.now() + timedelta(seconds=2)
+        with patch("src.data.cache.time.monotonic", return_value=time.monotonic() + 2):
             assert cache.get("key1") is None
 
     def test_cache_custom_ttl(self):
@@ -40,11 +41,8 @@ class TestSimpleCache:
         cache.set("key1", "value1", ttl=600)
 
         # Mock time to be 400 seconds later (past default TTL but within custom TTL)
-        with patch("src.data.cache.datetime") as mock_datetime:
-            mock_datetime.now.return_value = datetime.now() + timedelta(seconds=400)
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
-            # Note: This test is tricky due to how timedelta works with mocked datetime
-            # The cache stores expiry at set time, so checking is against stored expiry
+        with patch("src.data.cache.time.monotonic", return_value=time.monotonic() + 400):
+            assert cache.get("key1") == "value1"
 
     def test_cache_clear(self):
         """Test clearing all cached entries."""
@@ -67,6 +65,41 @@ class TestSimpleCache:
         cache.set("key1", "value2")
         assert cache.get("key1") == "value2"
 
+    def test_cleanup_expired(self):
+        """Test that cleanup_expired removes only expired entries."""
+        cache = SimpleCache(default_ttl=300)
+        cache.set("short", "value1", ttl=1)
+        cache.set("long", "value2", ttl=600)
+
+        with patch("src.data.cache.time.monotonic", return_value=time.monotonic() + 2):
+            assert cache.cleanup_expired() == 1
+
+        assert cache.size == 1
+        assert cache.get("long") == "value2"
+
+    def test_eviction_prefers_expired_entries(self):
+        """Test that expired entries are evicted before live ones when full."""
+        cache = SimpleCache(default_ttl=300, max_size=2)
+        cache.set("live", "value1", ttl=600)
+        cache.set("stale", "value2", ttl=1)
+
+        with patch("src.data.cache.time.monotonic", return_value=time.monotonic() + 2):
+            cache.set("new", "value3")
+            assert cache.get("live") == "value1"
+            assert cache.get("new") == "value3"
+            assert cache.size == 2
+
+    def test_eviction_drops_oldest_when_full(self):
+        """Test that the oldest inserted entry is evicted when nothing is expired."""
+        cache = SimpleCache(default_ttl=300, max_size=2)
+        cache.set("first", 1)
+        cache.set("second", 2)
+        cache.set("third", 3)
+
+        assert cache.get("first") is None
+        assert cache.get("second") == 2
+        assert cache.get("third") == 3
+
     def test_cache_stores_different_types(self):
         """Test that cache can store various Python types."""
         cache = SimpleCache(default_ttl=300)
@@ -151,6 +184,22 @@ class TestCachedDecorator:
         assert result2 == 15
         assert call_count == 2  # Different kwargs = different cache key
 
+    @pytest.mark.asyncio
+    async def test_cached_decorator_unhashable_args(self):
+        """Test that unhashable arguments (e.g. lists) still produce cache hits."""
+        call_count = 0
+
+        @cached(ttl=300)
+        async def my_function(items):
+            nonlocal call_count
+            call_count += 1
+            return len(items)
+
+        assert await my_function(["a", "b"]) == 2
+        assert await my_function(["a", "b"]) == 2
+        assert await my_function(["a", "b", "c"]) == 3
+        assert call_count == 2
+
 
 class TestGetCache:
     """Tests for the get_cache function."""
@@ -160,3 +209,38 @@ class TestGetCache:
         cache1 = get_cache()
         cache2 = get_cache()
         assert cache1 is cache2
+
+    @pytest.mark.asyncio
+    async def test_cached_decorator_coalesces_concurrent_calls(self):
+        """Test that concurrent misses for the same key share one call."""
+        call_count = 0
+
+        @cached(ttl=300)
+        async def my_function(x):
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            return x * 2
+
+        results = await asyncio.gather(*(my_function(5) for _ in range(5)))
+
+        assert results == [10] * 5
+        assert call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_decorator_does_not_cache_errors(self):
+        """Test that a failed call is retried on the next call."""
+        call_count = 0
+
+        @cached(ttl=300)
+        async def my_function():
+            nonlocal call_count
+            call_count += 1
+            if call_count == 1:
+                raise ValueError("upstream down")
+            return "ok"
+
+        with pytest.raises(ValueError):
+            await my_function()
+        assert await my_function() == "ok"
+        assert call_count == 2
@@ -0,0 +1,21 @@
+"""Tests for CLI command helpers."""
+
+import json
+
+from src.cli.commands import print_json
+
+
+class TestPrintJson:
+    """Tests for print_json."""
+
+    def test_small_values(self, capsysbinary):
+        print_json({"operator_id": 1, "unclaimed_eth": "0.5"})
+        out = capsysbinary.readouterr().out
+        assert json.loads(out) == {"operator_id": 1, "unclaimed_eth": "0.5"}
+
+    def test_shares_wider_than_64_bits(self, capsysbinary):
+        data = {"rewards": {"unclaimed_shares": 2**64, "distributed_shares": 3 * 10**19}}
+        print_json(data)
+        out = capsysbinary.readouterr().out
+        assert out.endswith(b"\n")
+        assert json.loads(out) == data
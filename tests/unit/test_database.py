@@ -0,0 +1,70 @@
+"""Tests for the saved operators database."""
+
+import pytest
+
+from src.data import database
+
+
+@pytest.fixture(autouse=True)
+def temp_db(tmp_path, monkeypatch):
+    """Point the shared connection at a fresh temporary database file."""
+    path = tmp_path / "operators.db"
+
+    async def get_db_path():
+        return path
+
+    monkeypatch.setattr(database, "get_db_path", get_db_path)
+    monkeypatch.setattr(database, "_conn", None)
+    monkeypatch.setattr(database, "_saved_cache", None)
+
+
+class TestBulkWrites:
+    """Tests for update_operators_bulk."""
+
+    @pytest.mark.asyncio
+    async def test_update_refreshes_saved_operators(self):
+        try:
+            await database.save_operator(1, {"operator_id": 1, "manager_address": "0xa"})
+            await database.update_operators_bulk([(1, {"operator_id": 1, "manager_address": "0xb"})])
+
+            saved = await database.get_saved_operators()
+            assert [op["manager_address"] for op in saved] == ["0xb"]
+        finally:
+            await database.close_db()
+
+    @pytest.mark.asyncio
+    async def test_update_does_not_reinsert_removed_operators(self):
+        try:
+            await database.save_operator(1, {"operator_id": 1})
+            await database.save_operator(2, {"operator_id": 2})
+            # Removed while a refresh was in flight
+            await database.delete_operator(2)
+
+            await database.update_operators_bulk([(1, {"operator_id": 1}), (2, {"operator_id": 2})])
+
+            assert await database.is_operator_saved(1)
+            assert not await database.is_operator_saved(2)
+        finally:
+            await database.close_db()
+
+
+class TestSavedOperatorsCache:
+    """Tests for the get_saved_operators() cache."""
+
+    @pytest.mark.asyncio
+    async def test_sees_writes_from_other_connections(self, tmp_path):
+        try:
+            await database.save_operator(1, {"operator_id": 1})
+            assert [op["operator_id"] for op in await database.get_saved_operators()] == [1]
+
+            # Another worker process writes through its own connection
+            other = await database._open_connection()
+            try:
+                await other.execute(database.SQL_DELETE, (1,))
+                await other.commit()
+            finally:
+                await other.close()
+
+            assert await database.get_saved_operators() == []
+        finally:
+            await database.close_db()
@@ -0,0 +1,36 @@
+"""Tests for the shared HTTP client."""
+
+import pytest
+
+from src.data.http_client import close_http_client, get_http_client
+
+
+class TestHttpClient:
+    """Tests for get_http_client / close_http_client."""
+
+    @pytest.mark.asyncio
+    async def test_client_is_reused(self):
+        try:
+            assert get_http_client() is get_http_client()
+        finally:
+            await close_http_client()
+
+    @pytest.mark.asyncio
+    async def test_close_creates_fresh_client(self):
+        client = get_http_client()
+        await close_http_client()
+        assert client.is_closed
+        new_client = get_http_client()
+        try:
+            assert new_client is not client
+        finally:
+            await close_http_client()
+
+    @pytest.mark.asyncio
+    async def test_requests_go_through_shared_client(self, httpx_mock):
+        httpx_mock.add_response(url="https://example.com/a", json={"ok": True})
+        try:
+            response = await get_http_client().get("https://example.com/a", timeout=5.0)
+            assert response.json() == {"ok": True}
+        finally:
+            await close_http_client()
@@ -0,0 +1,140 @@
+"""Tests for IPFS distribution log fetching."""
+
+import asyncio
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from src.data import ipfs_logs
+from src.data.http_client import close_http_client
+from src.data.ipfs_logs import FrameData, IPFSLogProvider
+
+
+@pytest.fixture(autouse=True)
+def empty_memory_cache():
+    ipfs_logs._log_memory_cache.clear()
+    ipfs_logs._operator_history_cache.clear()
+    yield
+    ipfs_logs._log_memory_cache.clear()
+    ipfs_logs._operator_history_cache.clear()
+
+
+class TestFetchLog:
+    """Tests for fetch_log caching."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_fetches_share_one_request(self, httpx_mock, tmp_path):
+        requests = []
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url)
+            return httpx.Response(200, json=[{"frame": [1, 2], "operators": {}}])
+
+        httpx_mock.add_callback(respond)
+
+        provider = IPFSLogProvider(cache_dir=tmp_path)
+        try:
+            results = await asyncio.gather(*(provider.fetch_log("QmCid") for _ in range(3)))
+        finally:
+            await close_http_client()
+
+        assert len(requests) == 1
+        assert results[0] == {"frame": [1, 2], "operators": {}}
+        assert results[0] is results[1] is results[2]
+
+    @pytest.mark.asyncio
+    async def test_memory_cache_skips_disk(self, tmp_path):
+        provider = IPFSLogProvider(cache_dir=tmp_path)
+        provider._save_to_cache("QmCid", {"frame": [1, 2]})
+
+        first = await provider.fetch_log("QmCid")
+        (tmp_path / "QmCid.json").unlink()
+        second = await provider.fetch_log("QmCid")
+
+        assert second is first
+
+    @pytest.mark.asyncio
+    async def test_clear_cache_drops_memory_caches(self, tmp_path):
+        provider = IPFSLogProvider(cache_dir=tmp_path)
+        provider._save_to_cache("QmCid", {"frame": [1, 2]})
+        await provider.fetch_log("QmCid")
+        ipfs_logs._operator_history_cache[(7, ("QmCid",))] = []
+
+        provider.clear_cache()
+
+        assert not ipfs_logs._log_memory_cache
+        assert not ipfs_logs._operator_history_cache
+        assert not (tmp_path / "QmCid.json").exists()
+
+    def test_inflight_fetch_from_another_loop_is_not_awaited(self, tmp_path):
+        provider = IPFSLogProvider(cache_dir=tmp_path)
+        provider._save_to_cache("QmCid", {"frame": [1, 2]})
+        old_loop = asyncio.new_event_loop()
+        ipfs_logs._inflight_fetches["QmCid"] = old_loop.create_future()
+        old_loop.close()
+
+        try:
+            assert asyncio.run(provider.fetch_log("QmCid")) == {"frame": [1, 2]}
+        finally:
+            ipfs_logs._inflight_fetches.clear()
+
+
+class TestGetOperatorHistory:
+    """Tests for get_operator_history caching."""
+
+    LOG = {
+        "frame": [100, 325],
+        "distributable": 10**18,
+        "operators": {"7": {"distributed": 5 * 10**16, "validators": {"1": {}, "2": {}}}},
+    }
+
+    @pytest.mark.asyncio
+    async def test_repeat_lookup_reuses_frames(self, tmp_path):
+        provider = IPFSLogProvider(cache_dir=tmp_path)
+        provider._save_to_cache("QmA", self.LOG)
+        log_cids = [{"block": 10, "logCid": "QmA"}]
+
+        first = await provider.get_operator_history(7, log_cids)
+        ipfs_logs._log_memory_cache.clear()
+        (tmp_path / "QmA.json").unlink()
+        second = await provider.get_operator_history(7, log_cids)
+
+        assert [f.distributed_rewards for f in second] == [5 * 10**16]
+        assert second == first
+
+    @pytest.mark.asyncio
+    async def test_incomplete_history_not_cached(self, tmp_path):
+        provider = IPFSLogProvider(cache_dir=tmp_path)
+        provider._save_to_cache("QmA", self.LOG)
+        provider.gateways = []
+        log_cids = [{"block": 10, "logCid": "QmA"}, {"block": 20, "logCid": "QmMissing"}]
+
+        frames = await provider.get_operator_history(7, log_cids)
+
+        assert len(frames) == 1
+        assert not ipfs_logs._operator_history_cache
+
+
+class TestCalculateHistoricalApy:
+    """Tests for calculate_historical_apy."""
+
+    def test_annualizes_frame_rewards(self, tmp_path):
+        provider = IPFSLogProvider(cache_dir=tmp_path)
+        frame = FrameData(
+            start_epoch=0,
+            end_epoch=6300,  # 28 days
+            log_cid="QmCid",
+            block_number=1,
+            distributed_rewards=10**17,  # 0.1 ETH
+            validator_count=1,
+        )
+
+        result = provider.calculate_historical_apy([frame], Decimal("10"))
+
+        assert result == {"28d": 13.04, "ltd": 13.04}
+
+    def test_no_bond(self, tmp_path):
+        provider = IPFSLogProvider(cache_dir=tmp_path)
+
+        assert provider.calculate_historical_apy([], Decimal("0")) == {"28d": None, "ltd": None}
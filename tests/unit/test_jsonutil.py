@@ -0,0 +1,47 @@
+"""Tests for the orjson-backed JSON helpers."""
+
+from src.core import jsonutil
+
+
+class TestJsonUtil:
+    """Tests for jsonutil.dumps / jsonutil.loads."""
+
+    def test_roundtrip(self):
+        data = {"operator_id": 42, "shares": 304687403773285400, "name": "x"}
+        assert jsonutil.loads(jsonutil.dumps(data)) == data
+
+    def test_big_int_roundtrip_is_exact(self):
+        shares = 2**70 + 1
+        raw = jsonutil.dumps({"shares": shares})
+        assert jsonutil.loads(raw)["shares"] == shares
+
+    def test_loads_accepts_str(self):
+        assert jsonutil.loads('{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_negative_big_int_roundtrip_is_exact(self):
+        shares = -(2**63) - 1
+        assert jsonutil.loads(jsonutil.dumps({"shares": shares}))["shares"] == shares
+
+    def test_proofs_payload_takes_fast_path(self, monkeypatch):
+        raw = jsonutil.dumps(
+            {
+                "CSM Operator 0": {
+                    "cumulativeFeeShares": 304687403773285400,
+                    "proof": [
+                        "0x1234567890123456789012345678901234567890123456789012345678901234",
+                        "0xab12345678901234567890123456789012345678901234567890123456789012",
+                    ],
+                },
+                "amount": 10**18,
+                "shares": 2**63,
+                "rate": 1.2345678901234567890123,
+            }
+        )
+
+        def stdlib_loads(*args, **kwargs):
+            raise AssertionError("stdlib parser used")
+
+        monkeypatch.setattr(jsonutil.json, "loads", stdlib_loads)
+        data = jsonutil.loads(raw)
+        assert data["CSM Operator 0"]["cumulativeFeeShares"] == 304687403773285400
+        assert data["amount"] == 10**18
@@ -0,0 +1,46 @@
+"""Tests for on-chain operator lookups."""
+
+import pytest
+
+from src.data.onchain import OnChainDataProvider
+
+ADDRESS = "0x" + "ab" * 20
+
+
+@pytest.fixture
+def provider():
+    return OnChainDataProvider("http://localhost:1")
+
+
+class TestFindOperatorByAddress:
+    """Tests for the event lookup / full scan split in find_operator_by_address."""
+
+    @pytest.mark.asyncio
+    async def test_no_event_match_skips_scan(self, provider, monkeypatch):
+        async def no_match(target):
+            return None
+
+        async def count():
+            raise AssertionError("full scan started")
+
+        monkeypatch.setattr(provider, "_find_operator_by_events", no_match)
+        monkeypatch.setattr(provider, "get_node_operators_count", count)
+
+        assert await provider.find_operator_by_address(ADDRESS) is None
+
+    @pytest.mark.asyncio
+    async def test_rejected_log_query_falls_back_to_scan(self, provider, monkeypatch):
+        scanned = []
+
+        async def rejected(target):
+            raise ValueError("query returned more than 10000 results")
+
+        async def count():
+            scanned.append(True)
+            return 0
+
+        monkeypatch.setattr(provider, "_find_operator_by_events", rejected)
+        monkeypatch.setattr(provider, "get_node_operators_count", count)
+
+        assert await provider.find_operator_by_address(ADDRESS) is None
+        assert scanned == [True]
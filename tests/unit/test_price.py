@@ -0,0 +1,49 @@
+"""Tests for ETH price fetching."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.data import price
+from src.data.http_client import close_http_client
+
+
+@pytest.fixture(autouse=True)
+def empty_price_cache():
+    price._price_cache.update(eth_usd=None, timestamp=0)
+    yield
+    price._price_cache.update(eth_usd=None, timestamp=0)
+
+
+class TestGetEthPrice:
+    """Tests for get_eth_price."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_request(self, httpx_mock):
+        requests = []
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url)
+            return httpx.Response(200, json={"ethereum": {"usd": 3000.5}})
+
+        httpx_mock.add_callback(respond)
+
+        try:
+            results = await asyncio.gather(*(price.get_eth_price() for _ in range(3)))
+            cached = await price.get_eth_price()
+        finally:
+            await close_http_client()
+
+        assert len(requests) == 1
+        assert results == [3000.5, 3000.5, 3000.5]
+        assert cached == 3000.5
+
+    @pytest.mark.asyncio
+    async def test_failure_returns_none(self, httpx_mock):
+        httpx_mock.add_response(status_code=500)
+
+        try:
+            assert await price.get_eth_price() is None
+        finally:
+            await close_http_client()
@@ -0,0 +1,115 @@
+"""Tests for the rewards tree provider's on-disk ETag cache."""
+
+import gzip
+
+import pytest
+
+from src.core.config import get_settings
+from src.data.rewards_tree import RewardsTreeProvider
+
+PROOFS = b'{"CSM Operator 3": {"cumulativeFeeShares": 12345678901234567890123, "proof": ["0xab"]}}'
+
+
+async def fetch(provider: RewardsTreeProvider) -> dict:
+    """Call fetch_rewards_data bypassing the in-memory @cached layer."""
+    return await RewardsTreeProvider.fetch_rewards_data.__wrapped__(provider)
+
+
+class TestRewardsTreeCache:
+    """Tests for conditional downloads of proofs.json."""
+
+    @pytest.mark.asyncio
+    async def test_stores_body_and_etag(self, tmp_path, httpx_mock):
+        url = get_settings().rewards_proofs_url
+        httpx_mock.add_response(url=url, content=PROOFS, headers={"ETag": '"v1"'})
+
+        provider = RewardsTreeProvider(cache_dir=tmp_path)
+        data = await fetch(provider)
+
+        assert data["CSM Operator 3"]["cumulativeFeeShares"] == 12345678901234567890123
+        assert (tmp_path / "proofs.etag").read_text() == '"v1"'
+        assert (tmp_path / "proofs.json.gz").exists()
+
+    @pytest.mark.asyncio
+    async def test_not_modified_uses_cached_body(self, tmp_path, httpx_mock):
+        url = get_settings().rewards_proofs_url
+        httpx_mock.add_response(url=url, content=PROOFS, headers={"ETag": '"v1"'})
+        await fetch(RewardsTreeProvider(cache_dir=tmp_path))
+
+        httpx_mock.add_response(url=url, status_code=304, match_headers={"If-None-Match": '"v1"'})
+        data = await fetch(RewardsTreeProvider(cache_dir=tmp_path))
+
+        assert data["CSM Operator 3"]["proof"] == ["0xab"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("corrupt", ["gzip", "json"])
+    async def test_corrupt_cache_is_replaced(self, tmp_path, httpx_mock, corrupt):
+        url = get_settings().rewards_proofs_url
+        httpx_mock.add_response(url=url, content=PROOFS, headers={"ETag": '"v1"'})
+        await fetch(RewardsTreeProvider(cache_dir=tmp_path))
+
+        body_path = tmp_path / "proofs.json.gz"
+        if corrupt == "gzip":
+            raw = bytearray(body_path.read_bytes())
+            raw[len(raw) // 2] ^= 0xFF
+            body_path.write_bytes(bytes(raw))
+        else:
+            body_path.write_bytes(gzip.compress(b"not json"))
+
+        httpx_mock.add_response(url=url, status_code=304, match_headers={"If-None-Match": '"v1"'})
+        httpx_mock.add_response(url=url, content=PROOFS, headers={"ETag": '"v2"'})
+        data = await fetch(RewardsTreeProvider(cache_dir=tmp_path))
+
+        assert data["CSM Operator 3"]["proof"] == ["0xab"]
+        assert "If-None-Match" not in httpx_mock.get_requests()[-1].headers
+        assert (tmp_path / "proofs.etag").read_text() == '"v2"'
+        assert gzip.decompress(body_path.read_bytes()) == PROOFS
+
+    @pytest.mark.asyncio
+    async def test_downloads_use_private_temp_files(self, tmp_path, httpx_mock):
+        url = get_settings().rewards_proofs_url
+        httpx_mock.add_response(url=url, content=PROOFS, headers={"ETag": '"v1"'})
+        httpx_mock.add_response(url=url, content=b"not json")
+        provider = RewardsTreeProvider(cache_dir=tmp_path)
+
+        temp_paths = []
+        make_temp = provider._make_temp
+
+        def record_temp(suffix):
+            path = make_temp(suffix)
+            temp_paths.append(path)
+            return path
+
+        provider._make_temp = record_temp
+        await fetch(provider)
+        # A body that fails to parse never replaces the cached copy
+        await fetch(provider)
+
+        body_temps = [p for p in temp_paths if p.name.endswith(".json.gz.tmp")]
+        assert len(body_temps) == 2 and body_temps[0] != body_temps[1]
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["proofs.etag", "proofs.json.gz"]
+
+
+class TestRewardsTreeIndex:
+    """Tests for the integer operator ID index."""
+
+    @pytest.mark.asyncio
+    async def test_lookup_by_operator_id(self, tmp_path, monkeypatch):
+        data = {
+            "CSM Operator 10": {"cumulativeFeeShares": 5, "proof": ["0x01"]},
+            "CSM Operator 2": {"cumulativeFeeShares": 7, "proof": ["0x02"]},
+            "CSM Operator x": {"cumulativeFeeShares": 1, "proof": []},
+            "Other": {"cumulativeFeeShares": 1, "proof": []},
+        }
+        provider = RewardsTreeProvider(cache_dir=tmp_path)
+
+        async def fake_fetch():
+            return data
+
+        monkeypatch.setattr(provider, "fetch_rewards_data", fake_fetch)
+
+        assert await provider.get_all_operators_with_rewards() == [2, 10]
+        info = await provider.get_operator_rewards(10)
+        assert info.cumulative_fee_shares == 5
+        assert info.proof == ["0x01"]
+        assert await provider.get_operator_rewards(3) is None
@@ -205,3 +205,9 @@ class TestOperatorRewards:
         assert sample_operator_rewards.health is not None
         assert sample_operator_rewards.health.bond_healthy is True
         assert sample_operator_rewards.health.strikes.strike_threshold == 3
+
+    def test_operator_rewards_excess_bond_float(self, sample_operator_rewards):
+        """Test that the float copy of excess bond is computed at construction."""
+        assert sample_operator_rewards.excess_bond_eth_float == float(
+            sample_operator_rewards.excess_bond_eth
+        )